@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark for scoring many short texts with the pattern sentiment analyzer,
+one text at a time versus :meth:`PatternAnalyzer.analyze_many`.
+
+Usage: ::
+
+    $ python -m benchmarks.bench_analyze_many
+"""
+from __future__ import print_function, unicode_literals
+import random
+import timeit
+
+from textblob.sentiments import PatternAnalyzer
+
+WORDS = ("the movie was not very good but the acting is really great and "
+         "I am never sad ! , . quite boring terrible happy extremely nice "
+         "food service slow friendly").split()
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, repeat=3, number=number)) / number
+
+
+def main():
+    rnd = random.Random(0)
+    texts = [" ".join(rnd.choice(WORDS) for i in range(rnd.randint(3, 20)))
+             for j in range(10000)]
+    analyzer = PatternAnalyzer()
+    assert analyzer.analyze_many(texts) == [analyzer.analyze(s) for s in texts]
+    t1 = bench(lambda: [analyzer.analyze(s) for s in texts], 1)
+    print("analyze: {0:,} texts in {1:.4f}s".format(len(texts), t1))
+    t2 = bench(lambda: analyzer.analyze_many(texts), 1)
+    print("analyze_many: {0:,} texts in {1:.4f}s ({2:.1f}x)".format(len(texts), t2, t1 / t2))
+
+if __name__ == '__main__':
+    main()
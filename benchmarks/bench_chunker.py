@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark for the phrase chunker in ``textblob._text.find_chunks``.
+
+Chunks sentences of 10 to 10,000 tokens without punctuation (e.g., transcripts),
+and compares ``find_chunks`` with the previous implementation, which counted
+the separators in the tags-string before each match (quadratic in the length
+of the sentence).
+
+Usage: ::
+
+    $ python -m benchmarks.bench_chunker
+"""
+from __future__ import print_function, unicode_literals
+import timeit
+
+from textblob import _text
+from textblob.en import parser
+
+SENTENCE = ("so I told him that the very big dog was running quickly "
+            "into the old house and then we went to see my friends in the city "
+            "because they had never seen such a thing before and it was nice")
+
+SIZES = (10, 100, 1000, 10000)
+
+
+def find_chunks_rescan(tagged, language="en"):
+    """The previous implementation of ``find_chunks``."""
+    chunked = [x for x in tagged]
+    tags = "".join("%s%s" % (tag, _text.SEPARATOR) for token, tag in tagged)
+    for tag, rule in _text.CHUNKS[int(language in ("ca", "es", "pt", "fr", "it", "pt", "ro"))]:
+        for m in rule.finditer(tags):
+            i = m.start()
+            j = tags[:i].count(_text.SEPARATOR)
+            n = m.group(0).count(_text.SEPARATOR)
+            for k in range(j, j+n):
+                if len(chunked[k]) == 3:
+                    continue
+                if len(chunked[k]) < 3:
+                    if k == j and chunked[k][1] in ("CC", "CJ", "KON", "Conj(neven)"):
+                        j += 1
+                    elif k == j:
+                        chunked[k].append("B-"+tag)
+                    else:
+                        chunked[k].append("I-"+tag)
+    for chink in filter(lambda x: len(x) < 3, chunked):
+        chink.append("O")
+    for i, (word, tag, chunk) in enumerate(chunked):
+        if tag.startswith("RB") and chunk == "B-NP":
+            if i < len(chunked)-1 and not chunked[i+1][1].startswith("JJ"):
+                chunked[i+0][2] = "B-ADVP"
+                chunked[i+1][2] = "B-NP"
+    return chunked
+
+
+def make_sentence(size):
+    words = (SENTENCE.split() * (size // len(SENTENCE.split()) + 1))[:size]
+    return parser.find_tags(words)
+
+
+def bench(func, tagged, number):
+    return min(timeit.repeat(lambda: func([list(t) for t in tagged]),
+                             repeat=3, number=number)) / number
+
+
+def main():
+    for size in SIZES:
+        tagged = make_sentence(size)
+        assert find_chunks_rescan([list(t) for t in tagged]) == \
+            _text.find_chunks([list(t) for t in tagged])
+        number = max(1, 10000 // size)
+        t1 = bench(find_chunks_rescan, tagged, number)
+        t2 = bench(_text.find_chunks, tagged, number)
+        print("{0:>6} tokens: rescan {1:9.5f}s  find_chunks {2:9.5f}s  ({3:.1f}x, {4:.2f}us/token)".format(
+            size, t1, t2, t1 / t2, t2 / size * 1e6))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark for emoticon handling in the pattern tokenizer and sentiment
+analyzer, on chat-like text with many punctuation tokens.
+
+Usage: ::
+
+    $ python -m benchmarks.bench_emoticons
+"""
+from __future__ import print_function, unicode_literals
+import timeit
+
+from textblob import _text
+from textblob.en import sentiment
+
+TEXT = ("omg :-) that was sooo good!!! :D but then... :( why?? "
+        "lol ;-) see you @ 8 :P #fun & games :-/ ok... <3 ")
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, repeat=3, number=number)) / number
+
+
+def main():
+    text = TEXT * 200
+    words = [(w.lower(), None) for w in " ".join(_text.find_tokens(text)).split()]
+    sentiment.assessments(words[:1])
+    t = bench(lambda: sentiment.assessments(words), 10)
+    print("assessments: {0:,} tokens in {1:.4f}s".format(len(words), t))
+    t = bench(lambda: _text.find_tokens(text), 10)
+    print("find_tokens: {0:,} characters in {1:.4f}s".format(len(text), t))
+    sentences = _text.find_tokens(text)
+    sub = lambda m: m.group(1).replace(" ", "") + m.group(2)
+    t = bench(lambda: [_text.RE_EMOTICONS.sub(sub, s) for s in sentences], 10)
+    print("RE_EMOTICONS: {0:,} sentences in {1:.4f}s".format(len(sentences), t))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark for the lemmatizer used by ``parse(lemmata=True)``.
+
+Lemmatizes the tagged tokens of a repeated paragraph with a cold and a
+warm (word, tag) memo, and compares the full pattern pipeline with and
+without lemmata.
+
+Usage: ::
+
+    $ python -m benchmarks.bench_lemmata
+"""
+from __future__ import print_function, unicode_literals
+import timeit
+
+from textblob import en
+from textblob.en import parser
+
+TEXT = ("The engineers said that the servers were running slowly. "
+        "They rebuilt the indexes, moved the caches and tried again. "
+        "Two days later the users reported that pages loaded quickly. ")
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, repeat=3, number=number)) / number
+
+
+def main():
+    tagged = [token for document in parser.parse_many([TEXT] * 200, chunks=False)
+              for sentence in document for token in sentence]
+    print("{0:,} tokens, {1:,} distinct (word, tag) pairs".format(
+        len(tagged), len(set(map(tuple, tagged)))))
+
+    def cold():
+        en.lemma_cache.clear()
+        en.find_lemmata([list(token) for token in tagged])
+
+    def warm():
+        en.find_lemmata([list(token) for token in tagged])
+
+    t1 = bench(cold, 5)
+    t2 = bench(warm, 5)
+    print("find_lemmata: cold memo {0:.4f}s, warm memo {1:.4f}s ({2:,.0f} tokens/s)".format(
+        t1, t2, len(tagged) / t2))
+    texts = [TEXT] * 200
+    t1 = bench(lambda: parser.parse_many(texts), 1)
+    t2 = bench(lambda: parser.parse_many(texts, lemmata=True), 1)
+    print("parse_many of 600 sentences: {0:.3f}s, with lemmata {1:.3f}s".format(t1, t2))
+
+if __name__ == '__main__':
+    main()
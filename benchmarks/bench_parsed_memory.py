@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Memory benchmark for the columnar ``ParsedText`` returned by
+``textblob._text.Parser.parse_structured``.
+
+Parses the documentation and measures the memory held by the parse results
+as nested lists (one [word, tag, chunk, pnp]-list per token) and as a
+``ParsedText``, relative to the size of the text. Requires Python 3.4+
+(tracemalloc).
+
+Usage: ::
+
+    $ python -m benchmarks.bench_parsed_memory
+"""
+from __future__ import print_function, unicode_literals
+import glob
+import io
+import os
+import tracemalloc
+
+from textblob.en import parser
+
+DOCS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "docs")
+
+
+def measure(func):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = func()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    text = "\n\n".join(io.open(f, encoding="utf-8").read()
+                       for f in sorted(glob.glob(os.path.join(DOCS, "*.rst"))))
+    sentences = parser._sentences(text)
+    parser.parse_structured("Warm up.")
+    nested, n1 = measure(lambda: parser._annotate([list(s) for s in sentences]))
+    parsed, n2 = measure(lambda: parser.parse_structured(text))
+    assert parsed.split() == nested
+    words = sum(len(s) for s in nested)
+    size = len(text.encode("utf-8"))
+    print("{0} tokens, {1} KB of text".format(words, size // 1024))
+    print("nested lists: {0:7d} KB ({1:.1f}x text)".format(n1 // 1024, n1 / float(size)))
+    print("  ParsedText: {0:7d} KB ({1:.1f}x text)".format(n2 // 1024, n2 / float(size)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Throughput benchmark for the relation labeler in ``textblob._text.find_relations``.
+
+Labels chunked sentences of 10 to 10,000 tokens, and compares the full
+pattern pipeline with and without relations (``parse(relations=True)``).
+
+Usage: ::
+
+    $ python -m benchmarks.bench_relations
+"""
+from __future__ import print_function, unicode_literals
+import timeit
+
+from textblob import _text
+from textblob.en import parser
+
+SENTENCE = ("The cat on the mat saw the dog eat a bone and "
+            "I told my friends that they should read the new book ")
+
+SIZES = (10, 100, 1000, 10000)
+
+
+def make_chunked(size):
+    words = (SENTENCE.split() * (size // len(SENTENCE.split()) + 1))[:size]
+    return parser.find_chunks(parser.find_tags(words))
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, repeat=3, number=number)) / number
+
+
+def main():
+    for size in SIZES:
+        chunked = make_chunked(size)
+        number = max(1, 10000 // size)
+        t = bench(lambda: _text.find_relations([list(token) for token in chunked]), number)
+        print("{0:>6} tokens: find_relations {1:9.5f}s  ({2:,.0f} tokens/s)".format(
+            size, t, size / t))
+    texts = [SENTENCE.strip() + "."] * 1000
+    t1 = bench(lambda: parser.parse_many(texts), 1)
+    t2 = bench(lambda: parser.parse_many(texts, relations=True), 1)
+    print("parse_many of 1,000 sentences: {0:.3f}s, with relations {1:.3f}s".format(t1, t2))
+
+if __name__ == '__main__':
+    main()
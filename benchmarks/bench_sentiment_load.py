@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark for loading the pattern sentiment lexicon, from the XML file
+and from the compiled binary file next to it (``en-sentiment.bin``).
+
+Usage: ::
+
+    $ python -m benchmarks.bench_sentiment_load
+"""
+from __future__ import print_function, unicode_literals
+import os
+import timeit
+
+from textblob import _text
+from textblob.en import Sentiment, MODULE
+
+PATH = os.path.join(MODULE, "en-sentiment.xml")
+BIN = os.path.join(MODULE, "en-sentiment.bin")
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, repeat=3, number=number)) / number
+
+
+def main():
+    sentiment = Sentiment(path=PATH, synset="wordnet_id")
+    sentiment.load()
+    t1 = bench(lambda: sentiment._parse(PATH), 5)
+    key = "%s %s" % (sentiment._synset, sentiment._confidence)
+    t2 = bench(lambda: _text.CompiledSentiment.read(BIN, key=key), 5)
+    print("XML parse {0:.4f}s, compiled read {1:.4f}s ({2:.1f}x)".format(t1, t2, t1 / t2))
+    t = bench(lambda: Sentiment(path=PATH, synset="wordnet_id").load(), 5)
+    print("Sentiment.load {0:.4f}s".format(t))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Microbenchmark for scoring a document with the pattern sentiment analyzer,
+with assessments (``Sentiment.__call__``) and without (``Sentiment.score``).
+Reports the time and the peak memory allocated while scoring one tokenized
+document, and the number of allocated blocks that are still alive when the
+scoring returns (the assessments). Requires Python 3.9+ (``tracemalloc.reset_peak``).
+
+Usage: ::
+
+    $ python -m benchmarks.bench_sentiment_score
+"""
+from __future__ import print_function, unicode_literals
+import timeit
+import tracemalloc
+
+from textblob.en import sentiment
+
+TEXT = ("The movie was not very good , but the actors were really great ! "
+        "The plot is quite boring and the ending is terrible . "
+        "I would never watch it again , it is so bad :( ")
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, repeat=3, number=number)) / number
+
+
+def allocated(func):
+    """Return the peak number of bytes allocated while calling func(),
+    and the number of blocks still allocated by its return value.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    value = func()
+    peak = tracemalloc.get_traced_memory()[1] - size
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "lineno"))
+    del value
+    return peak, blocks
+
+
+def main():
+    words = TEXT.split() * 10
+    assert sentiment.score(words) == tuple(sentiment(words))
+    print("{0} words per document".format(len(words)))
+    for name, func in (("Sentiment.__call__", lambda: sentiment(words)),
+                       ("Sentiment.score", lambda: sentiment.score(words))):
+        t = bench(func, 1000)
+        peak, blocks = allocated(func)
+        print("{0}: {1:.1f}us, peak {2:,} bytes, {3:,} blocks retained".format(
+            name, t * 1e6, peak, blocks))
+
+if __name__ == '__main__':
+    main()
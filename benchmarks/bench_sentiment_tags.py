@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark for scoring the sentiment of a tagged blob from its text, which
+tokenizes the text again, versus from its tagged tokens.
+
+Usage: ::
+
+    $ python -m benchmarks.bench_sentiment_tags
+"""
+from __future__ import print_function, unicode_literals
+import timeit
+
+from textblob import TextBlob
+from textblob.sentiments import PatternAnalyzer
+
+TEXT = ("The movie was not very good, but the actors were really great! "
+        "The plot is quite boring and the ending is terrible. "
+        "I would never watch it again, it is so bad. ")
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, repeat=3, number=number)) / number
+
+
+def main():
+    blob = TextBlob(TEXT * 20)
+    blob.tags
+    print("{0:,} tagged tokens".format(len(blob.tagged_tokens)))
+    for name, analyzer, func in (
+            ("analyze(blob.raw)", PatternAnalyzer(), lambda a: a.analyze(blob.raw)),
+            ("analyze_blob(blob)", PatternAnalyzer(), lambda a: a.analyze_blob(blob)),
+            ("analyze_blob(blob), use_tags=True", PatternAnalyzer(use_tags=True),
+             lambda a: a.analyze_blob(blob))):
+        t = bench(lambda: func(analyzer), 100)
+        print("{0}: {1:.2f}ms".format(name, t * 1e3))
+
+if __name__ == '__main__':
+    main()
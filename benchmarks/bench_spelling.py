@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark for spelling correction of misspelled words that are two edits
+away from a known word, with the deletion index (``Spelling.index``) and
+without it (generating every word within two edits).
+
+Usage: ::
+
+    $ python -m benchmarks.bench_spelling
+"""
+from __future__ import print_function, unicode_literals
+import timeit
+
+import mock
+
+from textblob._text import Spelling
+from textblob.en import spelling
+
+WORDS = ["corectoin", "acomodaton", "recieveing", "embarasment", "begininng",
+         "occurance", "seperatly", "definatly", "goverment", "tommorrow"]
+
+
+def bench(func, number):
+    return min(timeit.repeat(func, repeat=3, number=number)) / number
+
+
+def main():
+    t = timeit.default_timer()
+    spelling.index
+    print("index: {0:.2f}s, {1:,} words".format(timeit.default_timer() - t, len(spelling.index)))
+    suggest = lambda: [spelling.suggest(w) for w in WORDS]
+    with mock.patch.object(Spelling, "index", None):
+        expected = suggest()
+        t1 = bench(suggest, 1)
+    t2 = bench(suggest, 10)
+    assert suggest() == expected
+    print("suggest() without index: {0:.2f}ms per word".format(t1 / len(WORDS) * 1e3))
+    print("suggest() with index: {0:.2f}ms per word".format(t2 / len(WORDS) * 1e3))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark for batch tagging with ``PatternTagger.tag_sents``.
+
+Compares a Python loop over ``PatternTagger.tag`` with one call to
+``PatternTagger.tag_sents`` for short texts (e.g., tweets) and paragraphs.
+
+Usage: ::
+
+    $ python -m benchmarks.bench_tag_sents
+"""
+from __future__ import print_function, unicode_literals
+import timeit
+
+from textblob.taggers import PatternTagger
+
+SHORT = ["Can't wait for the weekend :) #tgif",
+         "The new phone is great, but the battery life is terrible.",
+         "RT @someone: Read this article about machine learning!",
+         "I've been waiting for 2 hours... worst service ever"]
+
+PARAGRAPH = ("TextBlob is a Python library for processing textual data. "
+             "It provides a simple API for diving into common natural language "
+             "processing tasks such as part-of-speech tagging, noun phrase "
+             "extraction, sentiment analysis, classification and translation. ")
+
+BATCHES = (("10,000 short texts", SHORT * 2500), ("1,000 paragraphs", [PARAGRAPH] * 1000))
+
+
+def bench(func, number=1):
+    return min(timeit.repeat(func, repeat=3, number=number)) / number
+
+
+def main():
+    tagger = PatternTagger()
+    tagger.tag("Warm up.")
+    for label, texts in BATCHES:
+        assert tagger.tag_sents(texts) == [tagger.tag(text) for text in texts]
+        t1 = bench(lambda: [tagger.tag(text) for text in texts])
+        t2 = bench(lambda: tagger.tag_sents(texts))
+        print("{0:>18}: tag() loop {1:7.3f}s  tag_sents() {2:7.3f}s  ({3:.1f}x)".format(
+            label, t1, t2, t1 / t2))
+
+if __name__ == '__main__':
+    main()
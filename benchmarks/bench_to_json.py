@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Regression benchmark for serializing a blob with ``TextBlob.to_json``.
+Each sentence must be analyzed once: ``Sentence.dict`` reads ``polarity`` and
+``subjectivity``, which share the sentence's sentiment.
+
+Usage: ::
+
+    $ python -m benchmarks.bench_to_json
+"""
+from __future__ import print_function, unicode_literals
+import timeit
+
+from textblob import TextBlob
+from textblob.base import BaseNPExtractor
+from textblob.sentiments import PatternAnalyzer
+
+TEXT = ("Beautiful is better than ugly. Explicit is better than implicit. "
+        "Simple is better than complex. Complex is better than complicated. "
+        "The movie was not very good, but the actors were really great! ")
+
+
+class CountingAnalyzer(PatternAnalyzer):
+    """Pattern analyzer that counts the blobs it analyzes."""
+
+    calls = 0
+
+    def analyze_blob(self, blob):
+        self.calls += 1
+        return super(CountingAnalyzer, self).analyze_blob(blob)
+
+
+class NoNPExtractor(BaseNPExtractor):
+    """Noun phrase extractor that finds nothing, so that only the tagger
+    and the sentiment analyzer are measured.
+    """
+
+    def extract(self, text):
+        return []
+
+
+def main():
+    text = TEXT * 100
+    analyzer = CountingAnalyzer()
+    extractor = NoNPExtractor()
+    blob = TextBlob(text, analyzer=analyzer, np_extractor=extractor)
+    blob.to_json()
+    n = len(blob.sentences)
+    assert analyzer.calls == n, "{0} sentiment passes for {1} sentences".format(analyzer.calls, n)
+    print("to_json: {0} sentiment passes for {1} sentences".format(analyzer.calls, n))
+    t = min(timeit.repeat(
+        lambda: TextBlob(text, analyzer=analyzer, np_extractor=extractor).to_json(),
+        repeat=3, number=1))
+    print("to_json: {0:,} sentences in {1:.4f}s".format(n, t))
+
+if __name__ == '__main__':
+    main()
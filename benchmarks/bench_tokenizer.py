@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmark for the single-pass tokenizer in ``textblob._text.find_tokens``.
+
+Compares the single scan (``_scan_tokens``) with the string-rewriting
+tokenizer (``_rewrite_tokens``) that is still used for custom replacements.
+
+Usage: ::
+
+    $ python -m benchmarks.bench_tokenizer
+"""
+from __future__ import print_function, unicode_literals
+import timeit
+
+from textblob import _text
+
+SAMPLE = ("The quick brown fox doesn't jump over the lazy dog's \"bone\". "
+          "Mr. Smith said, “It's 5 p.m. already!” (!) :-) U.S. e.g. etc.)...\n\n"
+          "Heading without period\r\n\r\nAnother paragraph: she'd've known. ")
+
+SIZES = (("1 KB", 1024), ("100 KB", 100 * 1024), ("10 MB", 10 * 1024 * 1024))
+
+
+def make_text(size):
+    return (SAMPLE * (size // len(SAMPLE) + 1))[:size]
+
+
+def bench(func, text, number):
+    return min(timeit.repeat(lambda: func(text), repeat=3, number=number)) / number
+
+
+def main():
+    punctuation = tuple(_text.PUNCTUATION.replace(".", ""))
+    rewrite = lambda s: _text._rewrite_tokens(s, punctuation)
+    scan = lambda s: _text._scan_tokens(s, punctuation)
+    for label, size in SIZES:
+        text = make_text(size)
+        assert rewrite(text) == scan(text)
+        number = max(1, 1024 * 1024 // size)
+        t1 = bench(rewrite, text, number)
+        t2 = bench(scan, text, number)
+        t3 = bench(_text.find_tokens, text, number)
+        print("{0:>7}: rewrite {1:9.4f}s  scan {2:9.4f}s  ({3:.1f}x)  find_tokens {4:9.4f}s".format(
+            label, t1, t2, t1 / t2, t3))
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,12 @@
 Tests for the text processor.
 """
 from __future__ import unicode_literals
+import io
 import json
+import os
+import shutil
+import tempfile
+import threading
 from unittest import TestCase, main
 from datetime import datetime
 import mock
@@ -20,6 +25,8 @@ from textblob.tokenizers import WordTokenizer, SentenceTokenizer
 from textblob.sentiments import NaiveBayesAnalyzer, PatternAnalyzer
 from textblob.parsers import PatternParser
 from textblob.classifiers import NaiveBayesClassifier
+from textblob.en import sentiment as pattern_sentiment
+from textblob._text import Spelling, SpellingIndex, edit_distance
 import textblob.wordnet as wn
 
 Synset = nltk.corpus.reader.Synset
@@ -691,6 +698,82 @@ is managed by the non-profit Python Software Foundation.'''
         assert_true(isinstance(positive.polarity, float))
         assert_true(positive.polarity > 0)
 
+    def test_sentiment_reuses_pattern_tags(self):
+        blob = tb.TextBlob("This is not a good movie. I'd say it's awful :-(")
+        expected = PatternAnalyzer().analyze(blob.raw)
+        assert_equal(len(blob.tags), 15)
+        with mock.patch('textblob.en.sentiments.pattern_sentiment',
+                        wraps=pattern_sentiment) as sentiment:
+            assert_equal(blob.sentiment, expected)
+            # Scored the tokens of the tagger rather than the raw text
+            assert_true(isinstance(sentiment.score.call_args[0][0], list))
+
+    def test_tags_are_computed_once(self):
+        blob = tb.TextBlob("Simple is better than complex. Complex is better than complicated.")
+        with mock.patch.object(blob.pos_tagger, 'tag',
+                               wraps=blob.pos_tagger.tag) as tag:
+            blob.tags
+            blob.pos_tags
+            blob.tagged_tokens
+            blob.sentiment
+            assert_equal(tag.call_count, 1)
+
+    def test_sentences_reuse_blob_annotations(self):
+        blob = tb.TextBlob('Simple is better than complex. "Flat" is better than nested.')
+        expected = [tb.TextBlob(s.raw).tagged_tokens for s in blob.sentences]
+        blob = tb.TextBlob(blob.raw)
+        blob.tags
+        blob.tokens
+        with mock.patch.object(blob.pos_tagger, 'tag',
+                               wraps=blob.pos_tagger.tag) as tag:
+            assert_equal([s.tagged_tokens for s in blob.sentences], expected)
+            assert_equal([len(s.tokens) for s in blob.sentences], [6, 8])
+            assert_equal(tag.call_count, 0)
+
+    def test_blob_reuses_sentence_annotations(self):
+        blob = tb.TextBlob("Simple is better than complex. Flat is better than nested.")
+        expected = blob.tagged_tokens
+        blob = tb.TextBlob(blob.raw)
+        with mock.patch.object(blob.pos_tagger, 'tag',
+                               wraps=blob.pos_tagger.tag) as tag:
+            blob.sentences[0].tags
+            assert_equal(blob.tagged_tokens, expected)
+            blob.sentences[1].tags
+            # The text is tagged once, for the blob and its sentences
+            assert_equal(tag.call_count, 1)
+        assert_equal(blob.tokens, blob.sentences[0].tokens + blob.sentences[1].tokens)
+
+    def test_annotations_do_not_depend_on_access_order(self):
+        for text in ("He works at Acme Corp.:8.30 is the time. Next one.",
+                     'She said "Hello."... Then she left. Mr. Smith stayed.',
+                     "Simple is better than complex. Flat is better than nested."):
+            blob = tb.TextBlob(text)
+            expected = (blob.tokens, blob.tagged_tokens,
+                        [(s.tokens, s.tagged_tokens) for s in blob.sentences])
+            blob = tb.TextBlob(text)
+            sentences = [(s.tokens, s.tagged_tokens) for s in blob.sentences]
+            assert_equal((blob.tokens, blob.tagged_tokens, sentences), expected)
+            assert_equal(blob.tagged_tokens, tb.TextBlob(text).tagged_tokens)
+
+    def test_sentences_share_conll_noun_phrases(self):
+        chunker = mock.Mock()
+        chunker.parse.return_value = [
+            nltk.tree.Tree('NP', [('Python', 'NN'), ('code', 'NN')])]
+        extractor = ConllExtractor(parser=chunker)
+        blob = tb.TextBlob("Python code is simple. It is readable.",
+                           np_extractor=extractor)
+        assert_equal(blob.noun_phrases, ['python code', 'python code'])
+        assert_equal(blob.sentences[1].noun_phrases, ['python code'])
+        assert_equal(chunker.parse.call_count, 2)
+        # Like extract(), extract_blob returns the noun phrases as they are in the text
+        assert_equal(extractor.extract_blob(blob), ['Python code', 'Python code'])
+
+    def test_tagged_tokens_include_punctuation(self):
+        blob = tb.TextBlob("Simple is better than complex.")
+        assert_equal(blob.tagged_tokens[-1], ('.', '.'))
+        assert_equal([word for word, tag in blob.tags],
+                     [word for word, tag in blob.tagged_tokens[:-1]])
+
     def test_sentiment_of_emoticons(self):
         b1 = tb.TextBlob("Faces have values =)")
         b2 = tb.TextBlob("Faces have values")
@@ -722,6 +805,21 @@ is managed by the non-profit Python Software Foundation.'''
         assert_almost_equal(blob_dict['subjectivity'],
                             blob.sentences[0].subjectivity, places=4)
 
+    def test_to_json_analyzes_each_sentence_once(self):
+        analyzer = PatternAnalyzer()
+        chunker = mock.Mock()
+        chunker.parse.return_value = []
+        blob = tb.TextBlob('Beautiful is better than ugly. '
+                           'Explicit is better than implicit.', analyzer=analyzer,
+                           np_extractor=ConllExtractor(parser=chunker))
+        with mock.patch.object(analyzer, 'analyze_blob',
+                               wraps=analyzer.analyze_blob) as analyze_blob:
+            blob_dict = json.loads(blob.to_json())
+            assert_equal(analyze_blob.call_count, 2)
+        sentence = blob.sentences[0]
+        assert_equal(blob_dict[0]['polarity'], sentence.sentiment.polarity)
+        assert_equal(blob_dict[0]['subjectivity'], sentence.sentiment.subjectivity)
+
     def test_words_are_word_objects(self):
         words = self.blob.words
         assert_true(isinstance(words[0], tb.Word))
@@ -936,6 +1034,52 @@ class WordTest(TestCase):
         assert_equal(len(synsets), len(definitions))
 
 
+class SpellingIndexTest(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "spelling.txt")
+        with io.open(self.path, "w", encoding="utf-8") as f:
+            f.write(";;; comment\nspelling 10\nspell 5\ncorrection 3\n"
+                    "connection 7\ncorrect 4\ntest 2\nthe 20\n")
+        self.spelling = Spelling(path=self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_edit_distance(self):
+        assert_equal(edit_distance("spelling", "spelling"), 0)
+        assert_equal(edit_distance("speling", "spelling"), 1)
+        assert_equal(edit_distance("teh", "the"), 1)
+        assert_equal(edit_distance("ca", "abc"), 2)
+        assert_equal(edit_distance("corection", "connection"), 2)
+        assert_equal(edit_distance("spell", "correction"), 3)
+
+    def test_candidates(self):
+        len(self.spelling)
+        index = self.spelling.index
+        assert_true(isinstance(index, SpellingIndex))
+        assert_true(os.path.exists(os.path.join(self.dir, "spelling.bin")))
+        assert_equal(len(index), 7)
+        assert_true("correction" in index.candidates("corectoin"))
+        assert_true("spell" in index.candidates("spel"))
+
+    def test_suggest_uses_index(self):
+        len(self.spelling)
+        for word in ("spellingg", "spel", "corectoin", "cnonection", "Tset", "xyzzy"):
+            with mock.patch.object(Spelling, "index", None):
+                expected = self.spelling.suggest(word)
+            assert_equal(self.spelling.suggest(word), expected)
+        assert_equal(self.spelling.suggest("corectoin"), [("correction", 1.0)])
+
+    def test_added_words_disable_index(self):
+        len(self.spelling)
+        self.spelling["spelt"] = 1
+        assert_equal(self.spelling.index, None)
+        assert_equal(self.spelling.suggest("spellt")[0][0], "spell")
+        assert_equal(self.spelling.suggest("spalte"), [("spelt", 1.0)])
+
+
 class TestWordnetInterface(TestCase):
 
     def setUp(self):
@@ -975,6 +1119,52 @@ class BlobberTest(TestCase):
         blob = self.blobber("Some text")
         assert_true(isinstance(blob.tokenizer, WordTokenizer))
 
+    def test_pipe(self):
+        texts = ["I love this sandwich.", "This is a terrible car!"]
+        records = list(self.blobber.pipe(texts, n_workers=1,
+                                         fields=("tags", "sentiment")))
+        assert_equal(len(records), 2)
+        for i, (text, record) in enumerate(zip(texts, records)):
+            blob = self.blobber(text)
+            assert_equal(record.index, i)
+            assert_equal(record.tags, [(unicode(w), t) for w, t in blob.tags])
+            assert_equal(record.sentiment, blob.sentiment)
+            assert_equal(record.sentiment.polarity, blob.sentiment.polarity)
+
+    def test_pipe_unknown_field(self):
+        assert_raises(ValueError, self.blobber.pipe, ["Some text"], fields=("tags", "tag"))
+        assert_raises(ValueError, self.blobber.pipe, ["Some text"], fields=("classify",))
+
+    @attr("slow")
+    def test_pipe_with_worker_processes(self):
+        texts = ["I love this sandwich.", "This is a terrible car!",
+                 "Simple is better than complex."] * 10
+        fields = ("tags", "sentiment", "words")
+        expected = list(self.blobber.pipe(texts, n_workers=1, fields=fields))
+        records = list(self.blobber.pipe(texts, n_workers=2, batch_size=4,
+                                         fields=fields))
+        assert_equal(records, expected)
+        unordered = self.blobber.pipe(texts, n_workers=2, batch_size=4,
+                                      fields=fields, preserve_order=False)
+        assert_equal(sorted(unordered), expected)
+
+    @attr("slow")
+    def test_pipe_reads_texts_as_records_are_consumed(self):
+        read = []
+        def texts():
+            while True:
+                read.append(1)
+                yield "I love this sandwich."
+        for unordered in (False, True):
+            del read[:]
+            records = self.blobber.pipe(texts(), n_workers=2, batch_size=5,
+                                        fields=("words",), preserve_order=not unordered)
+            first = [next(records) for i in range(12)]
+            records.close()
+            assert_equal(len(first), 12)
+            # 3 batches consumed and at most 2 * n_workers batches pending
+            assert_true(len(read) <= 5 * (3 + 4) + 1)
+
     def test_str_and_repr(self):
         expected = "Blobber(tokenizer=WordTokenizer(), pos_tagger=PatternTagger(), np_extractor=FastNPExtractor(), analyzer=PatternAnalyzer(), parser=PatternParser(), classifier=None)"
         assert_equal(repr(self.blobber), expected)
@@ -1004,6 +1194,59 @@ class BlobberTest(TestCase):
         blob = b("I am so amazing")
         assert_equal(blob.classify(), 'pos')
 
+    def test_warmup(self):
+        tagger, analyzer = PatternTagger(), PatternAnalyzer()
+        b = tb.Blobber(pos_tagger=tagger, analyzer=analyzer)
+        with mock.patch.object(tagger, 'tag') as tag, \
+                mock.patch.object(analyzer, 'analyze') as analyze:
+            ready = b.warmup(components=["pos_tagger", "analyzer"])
+            assert_true(tag.called)
+            assert_true(analyze.called)
+        assert_true(ready.done())
+        assert_equal(ready.result(), ("pos_tagger", "analyzer"))
+
+    def test_warmup_spelling_index(self):
+        with mock.patch.object(Spelling, 'index', new_callable=mock.PropertyMock) as index:
+            self.blobber.warmup(components=["spelling"])
+            assert_true(index.called)
+
+    def test_warmup_in_background(self):
+        extractor = ConllExtractor()
+        b = tb.Blobber(np_extractor=extractor)
+        loading = threading.Event()
+        with mock.patch.object(extractor, 'extract', side_effect=lambda text: loading.wait(10)):
+            ready = b.warmup(components=["np_extractor"], background=True)
+            assert_false(ready.done())
+            loading.set()
+            assert_equal(ready.result(timeout=10), ("np_extractor",))
+            assert_true(ready.done())
+
+    def test_warmup_error(self):
+        extractor = ConllExtractor()
+        b = tb.Blobber(np_extractor=extractor)
+        error = RuntimeError("Missing corpus")
+        with mock.patch.object(extractor, 'extract', side_effect=error):
+            ready = b.warmup(components=["np_extractor"], background=True)
+            assert_true(ready.wait(timeout=10))
+            assert_true(ready.exception() is error)
+            assert_raises(RuntimeError, ready.result)
+            assert_raises(RuntimeError, b.warmup, components=["np_extractor"])
+
+    def test_warmup_unknown_component(self):
+        assert_raises(ValueError, self.blobber.warmup, components=["lexicon"])
+
+    def test_warmup_on_construction(self):
+        with mock.patch.object(tb.Blobber, 'warmup') as warmup:
+            tb.Blobber()
+            assert_false(warmup.called)
+            tb.Blobber(warmup=True)
+            assert_true(warmup.called)
+
+    def test_module_warmup(self):
+        with mock.patch.object(tb.Blobber, 'warmup') as warmup:
+            tb.warmup(components=["spelling"], background=True)
+            warmup.assert_called_with(["spelling"], True)
+
 def is_blob(obj):
     return isinstance(obj, tb.TextBlob)
 
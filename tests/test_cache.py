@@ -0,0 +1,162 @@
+from __future__ import unicode_literals
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from nose.tools import *  # PEP8 asserts
+import mock
+
+import nltk
+
+from textblob.cache import (ModelCache, get_cache, model_key, cached_model,
+                            corpus_identity, function_identity, CACHE_ENV_VAR)
+from textblob.np_extractors import FastNPExtractor
+from textblob.en.np_extractors import ChunkParser
+from textblob.sentiments import NaiveBayesAnalyzer
+
+
+class TestModelCache(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.cache = ModelCache(os.path.join(self.dir, "models"))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_save_and_load(self):
+        key = model_key("Tagger", corpus="abc")
+        assert_true(self.cache.save("Tagger", key, {"the": "DT"}))
+        assert_equal(self.cache.load("Tagger", key), {"the": "DT"})
+        assert_equal(os.listdir(self.cache.directory),
+                     [os.path.basename(self.cache.path("Tagger", key))])
+
+    def test_load_missing(self):
+        assert_equal(self.cache.load("Tagger", model_key("Tagger")), None)
+
+    def test_load_other_key(self):
+        key1, key2 = model_key("Tagger", corpus="abc"), model_key("Tagger", corpus="xyz")
+        assert_not_equal(key1, key2)
+        self.cache.save("Tagger", key1, {"the": "DT"})
+        assert_equal(self.cache.load("Tagger", key2), None)
+        # A file with another key at the same path
+        os.rename(self.cache.path("Tagger", key1), self.cache.path("Tagger", key2))
+        assert_equal(self.cache.load("Tagger", key2), None)
+
+    def test_load_corrupt_file(self):
+        key = model_key("Tagger")
+        self.cache.save("Tagger", key, {"the": "DT"})
+        with open(self.cache.path("Tagger", key), "r+b") as f:
+            f.seek(-4, os.SEEK_END)
+            f.write(b"\0\0\0\0")
+        assert_equal(self.cache.load("Tagger", key), None)
+
+    def test_cached_model(self):
+        train = mock.Mock(return_value={"the": "DT"})
+        assert_equal(cached_model(self.cache, "Tagger", train, corpus="abc"), {"the": "DT"})
+        assert_equal(cached_model(self.cache, "Tagger", train, corpus="abc"), {"the": "DT"})
+        assert_equal(train.call_count, 1)
+        cached_model(self.cache, "Tagger", train, corpus="xyz")
+        assert_equal(train.call_count, 2)
+
+    def test_get_cache(self):
+        with mock.patch.dict(os.environ, {CACHE_ENV_VAR: self.dir}):
+            assert_equal(get_cache().directory, self.dir)
+            assert_equal(get_cache("other").directory, "other")
+            assert_true(get_cache(self.cache) is self.cache)
+        with mock.patch.dict(os.environ, {CACHE_ENV_VAR: ""}):
+            assert_equal(get_cache(), None)
+            train = mock.Mock(return_value=1)
+            cached_model(None, "Tagger", train)
+            cached_model(None, "Tagger", train)
+            assert_equal(train.call_count, 2)
+
+    def test_cached_model_callable_params(self):
+        corpus = mock.Mock(return_value="abc")
+        with mock.patch.dict(os.environ, {CACHE_ENV_VAR: ""}):
+            cached_model(None, "Tagger", mock.Mock(return_value=1), corpus=corpus)
+        assert_false(corpus.called)
+        cached_model(self.cache, "Tagger", mock.Mock(return_value=1), corpus=corpus)
+        assert_equal(self.cache.load("Tagger", model_key("Tagger", corpus="abc")), 1)
+
+    def test_corpus_identity(self):
+        with open(os.path.join(self.dir, "a.txt"), "w") as f:
+            f.write("Hello world.")
+        corpus = mock.Mock()
+        corpus.root = mock.Mock(spec=["path"], path=self.dir)
+        corpus.fileids.return_value = ["a.txt"]
+        identity = corpus_identity(corpus)
+        assert_equal(corpus_identity(corpus), identity)
+        with open(os.path.join(self.dir, "a.txt"), "a") as f:
+            f.write(" Hello again.")
+        assert_not_equal(corpus_identity(corpus), identity)
+
+    def test_function_identity(self):
+        f1 = lambda words: dict((w, True) for w in words)
+        f2 = lambda words: dict((w.lower(), True) for w in words)
+        assert_equal(function_identity(f1), function_identity(f1))
+        assert_not_equal(function_identity(f1), function_identity(f2))
+        f3 = lambda words: dict((w, True) for w in words if w not in set(["a", "b"]))
+        f4 = lambda words: dict((w, True) for w in words if w not in set(["a", "c"]))
+        assert_not_equal(function_identity(f3), function_identity(f4))
+
+    def test_function_identity_in_other_processes(self):
+        # The default feature extractor has a generator expression, whose repr
+        # has a memory address
+        script = ("from textblob.cache import function_identity; "
+                  "from textblob.en.sentiments import _default_feature_extractor as f; "
+                  "print(function_identity(f))")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        identities = set()
+        for seed in ("1", "2"):
+            env = dict(os.environ, PYTHONHASHSEED=seed)
+            identities.add(subprocess.check_output([sys.executable, "-c", script],
+                                                   cwd=root, env=env))
+        assert_equal(len(identities), 1)
+
+    def test_fast_np_extractor(self):
+        brown = mock.Mock()
+        brown.tagged_sents.return_value = [
+            [("The", "AT"), ("run", "NN"), ("was", "BEDZ"), ("fine", "JJ")],
+            [("They", "PPSS"), ("run", "VB"), ("home", "NR")],
+            [("They", "PPSS"), ("run", "VB"), ("fast", "RB")]]
+        with mock.patch.object(nltk.corpus, "brown", brown), \
+                mock.patch("textblob.en.np_extractors.corpus_identity", return_value="brown"):
+            extractor = FastNPExtractor(cache=self.dir)
+            expected = extractor.extract("The run was fine")
+            brown.tagged_sents.side_effect = AssertionError("retrained")
+            extractor = FastNPExtractor(cache=self.dir)
+            assert_equal(extractor.extract("The run was fine"), expected)
+            assert_equal(brown.tagged_sents.call_count, 1)
+
+    def test_chunk_parser(self):
+        conll2000 = mock.Mock()
+        conll2000.chunked_sents.return_value = [nltk.tree.Tree('S', [
+            nltk.tree.Tree('NP', [('the', 'DT'), ('code', 'NN')]), ('runs', 'VBZ')])]
+        sentence = [('the', 'DT'), ('code', 'NN'), ('runs', 'VBZ')]
+        with mock.patch.object(nltk.corpus, "conll2000", conll2000), \
+                mock.patch("textblob.en.np_extractors.corpus_identity", return_value="conll"):
+            expected = ChunkParser(cache=self.dir).parse(sentence)
+            conll2000.chunked_sents.side_effect = AssertionError("retrained")
+            assert_equal(ChunkParser(cache=self.dir).parse(sentence), expected)
+
+    def test_naive_bayes_analyzer(self):
+        reviews = mock.Mock()
+        reviews.fileids.side_effect = lambda label: [label]
+        reviews.words.side_effect = lambda fileids: (
+            ["great", "fun"] if fileids == ["pos"] else ["awful", "boring"])
+        with mock.patch.object(nltk.corpus, "movie_reviews", reviews), \
+                mock.patch("textblob.en.sentiments.corpus_identity", return_value="reviews"):
+            expected = NaiveBayesAnalyzer(cache=self.dir).analyze("great fun")
+            assert_equal(expected.classification, "pos")
+            reviews.words.side_effect = AssertionError("retrained")
+            assert_equal(NaiveBayesAnalyzer(cache=self.dir).analyze("great fun"), expected)
+            # Another feature extractor is trained again
+            analyzer = NaiveBayesAnalyzer(lambda words: {}, cache=self.dir)
+            assert_raises(AssertionError, analyzer.analyze, "great fun")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
+import pickle
 import unittest
 from nose.tools import *  # PEP8 asserts
 
 from textblob.parsers import PatternParser
-from textblob.en import parse as pattern_parse
+from textblob.en import parse as pattern_parse, parser, sentiment
+from textblob._text import find_chunks, find_relations
+from textblob.en.inflect import find_lemma
 
 
 class TestPatternParser(unittest.TestCase):
@@ -15,6 +18,124 @@ class TestPatternParser(unittest.TestCase):
     def test_parse(self):
         assert_equal(self.parser.parse(self.text), pattern_parse(self.text))
 
+    def test_parse_structured(self):
+        parsed = parser.parse_structured(self.text, lemmata=False)
+        assert_equal(parsed.string, pattern_parse(self.text))
+        assert_equal(parsed.string.tags, pattern_parse(self.text).tags)
+        assert_equal(parsed.split(), pattern_parse(self.text).split())
+        token = parsed[0][0]
+        assert_equal((token.word, token.tag, token.chunk, token.pnp), ("And", "CC", "O", "O"))
+        assert_equal(token.relation, None)
+
+    def test_parsed_sentence_columns(self):
+        sentence = parser.parse_structured("The cat sat.")[0]
+        assert_equal(len(sentence), 4)
+        assert_equal(sentence.words, ["The", "cat", "sat", "."])
+        assert_equal(sentence.tags, ["DT", "NN", "VBD", "."])
+        assert_equal(sentence.chunks, ["B-NP", "I-NP", "B-VP", "O"])
+        assert_equal(sentence.lemmata, None)
+        assert_equal(sentence[1], ("cat", "NN", "I-NP", "O", None, None))
+        assert_equal(sentence[-1].tag, ".")
+        assert_equal(pickle.loads(pickle.dumps(sentence)), sentence)
+
+    def test_parsed_sentence_comparison(self):
+        sentence = parser.parse_structured("The cat sat.")[0]
+        assert_true(sentence == list(sentence))
+        assert_false(sentence != list(sentence))
+        assert_true(sentence != parser.parse_structured("The dog sat.")[0])
+        assert_false(sentence == None)
+        assert_true(sentence != 1)
+
+    def test_sentiment_of_parsed_text(self):
+        text = "This is a really great movie."
+        assert_equal(sentiment(parser.parse_structured(text)), sentiment(text))
+
+    def test_parse_many(self):
+        texts = [self.text, "Hello world. Bye."]
+        assert_equal(parser.parse_many(texts),
+                     [parser.parse(text, collapse=False) for text in texts])
+
+
+class TestFindChunks(unittest.TestCase):
+
+    def test_find_chunks(self):
+        tagged = [["The", "DT"], ["nice", "JJ"], ["fish", "NN"],
+                  ["is", "VBZ"], ["dead", "JJ"], [".", "."]]
+        assert_equal([chunk for word, tag, chunk in find_chunks(tagged)],
+                     ["B-NP", "I-NP", "I-NP", "B-VP", "B-ADJP", "O"])
+
+    def test_chunk_starting_inside_tag(self):
+        # "DT/" in "WDT/" starts a noun phrase at "Which"
+        tagged = [["Which", "WDT"], ["dogs", "NNS"], ["and", "CC"], ["cats", "NNS"]]
+        assert_equal([chunk for word, tag, chunk in find_chunks(tagged)],
+                     ["B-NP", "I-NP", "O", "B-NP"])
+
+    def test_long_sentence(self):
+        tagged = [["big", "JJ"], ["dogs", "NNS"], ["run", "VBP"]] * 5000
+        chunks = [chunk for word, tag, chunk in find_chunks(tagged)]
+        assert_equal(chunks[-6:], ["B-NP", "I-NP", "B-VP"] * 2)
+
+
+class TestFindRelations(unittest.TestCase):
+
+    def test_find_relations(self):
+        chunked = [["I", "PRP", "B-NP", "O"], ["saw", "VBD", "B-VP", "O"],
+                   ["the", "DT", "B-NP", "O"], ["cat", "NN", "I-NP", "O"],
+                   ["eat", "VB", "B-VP", "O"], [".", ".", "O", "O"]]
+        assert_equal([token[-1] for token in find_relations(chunked)],
+            ["NP-SBJ-1", "VP-1", "NP-OBJ-1*NP-SBJ-2", "NP-OBJ-1*NP-SBJ-2", "VP-2", "O"])
+
+    def test_subject_before_prepositional_phrase(self):
+        s = parser.parse("The cat on the mat saw a dog.", relations=True).split()[0]
+        assert_equal([token[-1] for token in s],
+            ["NP-SBJ-1", "NP-SBJ-1", "O", "O", "O", "VP-1", "NP-OBJ-1", "NP-OBJ-1", "O"])
+
+    def test_parse_relations(self):
+        assert_equal(parser.parse("I ate pizza.", chunks=False, relations=True),
+                     "I/PRP/NP-SBJ-1 ate/VBD/VP-1 pizza/NN/NP-OBJ-1 ././O")
+        assert_equal(parser.parse_structured("I ate pizza.", relations=True)[0].relations,
+                     ["NP-SBJ-1", "VP-1", "NP-OBJ-1", "O"])
+
+
+class TestLemmata(unittest.TestCase):
+
+    def test_find_lemma(self):
+        assert_equal([find_lemma(w) for w in
+                      ("was", "said", "gotten", "'re", "walks", "complies", "kisses",
+                       "tried", "chopping", "danced", "hoped", "hopped", "panicked")],
+                     ["be", "say", "get", "be", "walk", "comply", "kiss",
+                      "try", "chop", "dance", "hope", "hop", "panic"])
+
+    def test_find_lemma_irregular_participles(self):
+        assert_equal([find_lemma(w) for w in
+                      ("coming", "becoming", "writing", "biting", "lying", "being",
+                       "seeing", "running", "beginning", "quitting")],
+                     ["come", "become", "write", "bite", "lie", "be",
+                      "see", "run", "begin", "quit"])
+
+    def test_find_lemma_suffix_rules(self):
+        assert_equal([find_lemma(w) for w in
+                      ("creating", "inviting", "agreed", "freed", "need", "succeeded",
+                       "equipped", "travelled", "spelled", "focusing", "caused", "dying")],
+                     ["create", "invite", "agree", "free", "need", "succeed",
+                      "equip", "travel", "spell", "focus", "cause", "die"])
+
+    def test_find_lemma_third_person(self):
+        assert_equal([find_lemma(w) for w in
+                      ("goes", "does", "undergoes", "vetoes", "echoes", "shoes", "tiptoes",
+                       "focuses", "buses", "biased", "causes", "uses", "kisses", "passes")],
+                     ["go", "do", "undergo", "veto", "echo", "shoe", "tiptoe",
+                      "focus", "bus", "bias", "cause", "use", "kiss", "pass"])
+
+    def test_parse_lemmata(self):
+        assert_equal(parser.parse("The cats were sitting.", chunks=False, lemmata=True),
+                     "The/DT/the cats/NNS/cat were/VBD/be sitting/VBG/sit ././.")
+        assert_equal(parser.parse_structured("He said it.", lemmata=True)[0].lemmata,
+                     ["he", "say", "it", "."])
+        assert_equal(parser.parse_structured("He goes home and she focuses on it.",
+                                             lemmata=True)[0].lemmata,
+                     ["he", "go", "home", "and", "she", "focus", "on", "it", "."])
+
 
 if __name__ == '__main__':
     unittest.main()
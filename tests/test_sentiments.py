@@ -1,9 +1,18 @@
 from __future__ import unicode_literals
+import io
+import os
+import shutil
+import tempfile
 import unittest
 from nose.tools import *  # PEP8 asserts
 from nose.plugins.attrib import attr
+import mock
 
+from textblob import TextBlob
 from textblob.sentiments import PatternAnalyzer, NaiveBayesAnalyzer, DISCRETE, CONTINUOUS
+from textblob.en import sentiment as pattern_sentiment
+from textblob._text import Sentiment, CompiledSentiment
+from textblob.en import Sentiment as EnglishSentiment
 
 
 class TestPatternSentiment(unittest.TestCase):
@@ -24,6 +33,109 @@ class TestPatternSentiment(unittest.TestCase):
         assert_equal(p1_result.polarity, p1_result[0])
         assert_equal(p1_result.subjectivity, p1_result[1])
 
+    def test_emoticon_assessments(self):
+        words = [(w, None) for w in (":-)", ":-D", ":p", "xd", ":-(", ".")]
+        assert_equal([(w, p, x) for w, p, s, x in pattern_sentiment.assessments(words)],
+                     [([":-)"], 0.5, "mood"), ([":p"], 0.75, "mood"), ([":-("], -0.75, "mood")])
+
+    def test_score(self):
+        texts = ["I feel great this morning.", "This is a terrible car.", "",
+                 "It is not very good!!", "The food was really not good.",
+                 "Not bad at all, not bad :-)", "What a wonderful day (!)",
+                 "Very very nice. Extremely happy!"]
+        for text in texts:
+            assert_equal(pattern_sentiment.score(text), tuple(pattern_sentiment(text)))
+            assert_equal(pattern_sentiment.score(text, negation=False),
+                         tuple(pattern_sentiment(text, negation=False)))
+        words = ["not", "very", "good", None, "!"]
+        assert_equal(pattern_sentiment.score(words), tuple(pattern_sentiment(words)))
+
+    def test_score_with_tags(self):
+        words = ["a", "real", "good", "movie"]
+        # "real" is a stronger intensifier as an adverb than as an adjective
+        assert_equal(pattern_sentiment.score(words, tags=["DT", "RB", "JJ", "NN"]), (1.0, 1.0))
+        assert_equal(pattern_sentiment.score(words, tags=["DT", "JJ", "JJ", "NN"]),
+                     pattern_sentiment.score(["good"]))
+        # Words with one sense score the same with any tag
+        assert_equal(pattern_sentiment.score(["not", "good"], tags=["RB", "NN"]),
+                     pattern_sentiment.score(["not", "good"]))
+
+    def test_analyze_blob_with_tags(self):
+        blob = TextBlob("The ruins are pale.", analyzer=PatternAnalyzer(use_tags=True))
+        with mock.patch.object(blob.pos_tagger, 'tag', wraps=blob.pos_tagger.tag) as tag:
+            assert_equal(blob.sentiment, pattern_sentiment.score(
+                ["the", "ruins", "are", "pale", "."], tags=["DT", "NNS", "VBP", "JJ", "."]))
+            assert_equal(tag.call_count, 1)
+        assert_not_equal(blob.sentiment, PatternAnalyzer().analyze(blob.raw))
+
+    def test_tokenize_many(self):
+        texts = ["I feel GREAT!", "", "!Not bad.", "a\x00b"]
+        assert_equal(pattern_sentiment.tokenize_many(texts),
+                     [" ".join(pattern_sentiment.tokenizer(s)).lower().split() for s in texts])
+
+    @attr('requires_numpy')
+    def test_analyze_many(self):
+        texts = ["I feel great this morning.", "This is a terrible car.", "",
+                 "It is not very good!!", "The food was really not good.",
+                 "Not bad at all, not bad :-)", "What a wonderful day (!)",
+                 "Very very nice. Extremely happy!", "no", "Be never so sad!"]
+        assert_equal(self.analyzer.analyze_many(texts),
+                     [self.analyzer.analyze(text) for text in texts])
+        assert_equal(self.analyzer.analyze_many([]), [])
+
+
+class TestCompiledSentiment(unittest.TestCase):
+
+    XML = ('<sentiment language="en">\n'
+           '<word form="good" pos="JJ" polarity="0.7" subjectivity="0.6" wordnet_id="a-00000001" />\n'
+           '<word form="good" pos="JJ" polarity="0.5" subjectivity="0.6" />\n'
+           '<word form="good" pos="NN" polarity="0.4" subjectivity="0.2" confidence="0.9" />\n'
+           '<word form="na\u00efve" pos="JJ" polarity="-0.1" subjectivity="0.8" label="mood" />\n'
+           '</sentiment>\n')
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "sentiment.xml")
+        with io.open(self.path, "w", encoding="utf-8") as f:
+            f.write(self.XML)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def load(self, synset="wordnet_id", cls=Sentiment):
+        sentiment = cls(path=self.path, synset=synset)
+        sentiment.load()
+        return sentiment
+
+    def test_load_compiled(self):
+        s1 = self.load()
+        assert_true(os.path.exists(os.path.join(self.dir, "sentiment.bin")))
+        s2 = self.load()
+        assert_equal(dict(s2), dict(s1))
+        assert_equal(s2["good"]["JJ"], [0.6, 0.6, 1.0])
+        assert_equal(s2.labeler, {"na\u00efve": "mood"})
+        assert_equal(s2.synset("a-00000001"), (0.7, 0.6))
+        assert_equal(s2.language, "en")
+
+    def test_recompiled_when_settings_or_source_change(self):
+        self.load()
+        assert_equal(self.load(synset="cornetto_id")._synsets, {})
+        with io.open(self.path, "w", encoding="utf-8") as f:
+            f.write(self.XML.replace("0.7", "0.9"))
+        os.utime(self.path, (0, 0))
+        assert_equal(self.load()["good"]["JJ"], [0.7, 0.6, 1.0])
+
+    def test_recompiled_for_subclass_parser(self):
+        # English Sentiment._parse() adds adverbs, which Sentiment doesn't have,
+        # whichever class compiles the lexicon first.
+        for classes in ((Sentiment, EnglishSentiment), (EnglishSentiment, Sentiment)):
+            for cls in classes:
+                self.load(cls=cls)
+            assert_true("goodly" in self.load(cls=EnglishSentiment))
+            assert_false("goodly" in self.load(cls=Sentiment))
+            assert_true("goodly" in self.load(cls=EnglishSentiment))
+            os.remove(os.path.join(self.dir, "sentiment.bin"))
+
 
 class TestNaiveBayesAnalyzer(unittest.TestCase):
 
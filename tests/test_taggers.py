@@ -1,11 +1,17 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
+import io
 import os
+import shutil
+import tempfile
 import unittest
 from nose.tools import *  # PEP8 asserts
 from nose.plugins.attrib import attr
+import mock
 
 from textblob.base import BaseTagger
+from textblob._text import Context, Morphology, Lexicon, CompactLexicon, SentenceCache
+from textblob.en import lexicon, parser
 import textblob.taggers
 
 HERE = os.path.abspath(os.path.dirname(__file__))
@@ -31,6 +37,184 @@ class TestPatternTagger(unittest.TestCase):
             ('Complex', 'NNP'), ('is', 'VBZ'), ('better', 'JJR'),
             ('than', 'IN'), ('complicated', 'VBN'), ('.', '.')])
 
+    def test_tag_with_cache(self):
+        tagger = textblob.taggers.PatternTagger(cache=True)
+        text = "Complex is better than complicated. " * 3
+        assert_equal(tagger.tag(text), self.tagger.tag(text))
+        assert_equal(tagger.tag(text), self.tagger.tag(text))
+        assert_equal(tagger.cache.misses, 1)
+        assert_equal(tagger.cache.hits, 5)
+        assert_equal(len(tagger.cache), 1)
+
+    def test_tag_sents(self):
+        texts = [self.text, "", "Tag! You're It!"]
+        assert_equal(self.tagger.tag_sents(texts),
+                     [self.tagger.tag(text) for text in texts])
+
+    def test_tag_sents_with_tokens(self):
+        assert_equal(self.tagger.tag_sents([["Simple", "is", "better", "."]]),
+            [[('Simple', 'JJ'), ('is', 'VBZ'), ('better', 'JJR'), ('.', '.')]])
+
+
+class TestSentenceCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = SentenceCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert_equal(cache.get("a"), 1)
+        cache.set("c", 3)
+        assert_true("a" in cache)
+        assert_false("b" in cache)
+        assert_equal(cache.get("b"), None)
+        assert_equal(cache.stats, {"entries": 2, "bytes": cache.bytes,
+            "hits": 1, "misses": 1, "evictions": 1})
+
+    def test_max_bytes(self):
+        cache = SentenceCache(max_entries=None, max_bytes=100)
+        cache.set("a", 1, size=60)
+        cache.set("b", 2, size=60)
+        assert_true("b" in cache)
+        assert_false("a" in cache)
+        assert_equal(cache.bytes, 60)
+        # Values larger than the cache are not stored
+        cache.set("c", 3, size=200)
+        assert_false("c" in cache)
+        cache.clear()
+        assert_equal((len(cache), cache.bytes), (0, 0))
+
+
+class TestContext(unittest.TestCase):
+
+    def setUp(self):
+        self.context = Context(path=os.path.join(
+            os.path.dirname(textblob.taggers.__file__), "en", "en-context.txt"))
+        self.tokens = [["I", "PRP"], ["want", "VBP"], ["to", "TO"], ["sleep", "NN"]]
+
+    def test_apply(self):
+        assert_equal(self.context.apply(self.tokens)[-1], ["sleep", "VB"])
+
+    def test_last_matching_rule_wins(self):
+        # A rule inserted first is overridden by the later "TO < NN" rule
+        self.context.insert(0, "NN", "JJ", "curwd", "sleep")
+        assert_equal(self.context.apply(self.tokens)[-1], ["sleep", "VB"])
+
+    def test_append_updates_rule_index(self):
+        self.context.apply(self.tokens)
+        self.context.append("NN", "VBG", "curwd", "sleep")
+        assert_equal(self.context.apply(self.tokens)[-1], ["sleep", "VBG"])
+
+    def test_changes_update_rule_index(self):
+        rule = ["NN", "VBG", "curwd", "sleep", ""]
+        self.context.apply(self.tokens)
+        self.context += [rule]
+        assert_equal(self.context.apply(self.tokens)[-1], ["sleep", "VBG"])
+        self.context.pop()
+        assert_equal(self.context.apply(self.tokens)[-1], ["sleep", "VB"])
+        self.context[-1] = rule
+        assert_equal(self.context.apply(self.tokens)[-1], ["sleep", "VBG"])
+        self.context.remove(rule)
+        assert_equal(self.context.apply(self.tokens)[-1], ["sleep", "VB"])
+
+    def test_parser_context(self):
+        # Parser only applies contextual rules if they are given
+        words = [w for w, tag in self.tokens]
+        with mock.patch.object(Context, "apply", side_effect=lambda tokens: tokens) as apply:
+            parser.find_tags(words)
+            assert_false(apply.called)
+            parser.parse("I want to sleep", context=self.context)
+            assert_true(apply.called)
+
+
+class TestMorphology(unittest.TestCase):
+
+    def setUp(self):
+        self.morphology = Morphology(lexicon, path=lexicon.morphology.path)
+
+    def test_apply(self):
+        apply = self.morphology.apply
+        assert_equal(apply(["quickly", "NN"]), ["quickly", "RB"])
+        assert_equal(apply(["unhappy", "NN"]), ["unhappy", "JJ"])
+        assert_equal(apply(["blorps", "NN"]), ["blorps", "NNS"])
+        # Tagged rules only apply to words with the given tag
+        assert_equal(apply(["1,000", "NN"]), ["1,000", "CD"])
+        assert_equal(apply(["1,000", "NNP"]), ["1,000", "NNP"])
+
+    def test_append_updates_rule_index(self):
+        self.morphology.apply(["blorps", "NN"])
+        self.morphology.append("VBZ", "-orps")
+        assert_equal(self.morphology.apply(["blorps", "NN"]), ["blorps", "VBZ"])
+
+    def test_changes_update_rule_index(self):
+        rule = ["orps", "hassuf", "4", "VBZ", "x"]
+        self.morphology.apply(["blorps", "NN"])
+        self.morphology += [rule]
+        assert_equal(self.morphology.apply(["blorps", "NN"]), ["blorps", "VBZ"])
+        del self.morphology[-1]
+        assert_equal(self.morphology.apply(["blorps", "NN"]), ["blorps", "NNS"])
+
+    def test_parser_morphology(self):
+        tagged = parser.find_tags(["blorpiness"], morphology=self.morphology)
+        assert_equal(tagged, [["blorpiness", "NN"]])
+        with mock.patch.object(Morphology, "apply", return_value=["blorpiness", "JJ"]):
+            assert_equal(parser.find_tags(["blorpiness"]), tagged)
+            assert_equal(parser.find_tags(["blorpiness"], morphology=self.morphology),
+                         [["blorpiness", "JJ"]])
+
+
+class TestCompactLexicon(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "lexicon.txt")
+        with io.open(self.path, "w", encoding="utf-8") as f:
+            f.write(";;; comment\nthe DT x\ncat NN x\nna\u00efve JJ x\n")
+        self.lexicon = Lexicon(path=self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_lookup(self):
+        assert_equal(self.lexicon.get("cat"), "NN")
+        assert_equal(self.lexicon["the"], "DT")
+        assert_equal(self.lexicon.get("na\u00efve"), "JJ")
+        assert_false("dog" in self.lexicon)
+        assert_equal(self.lexicon.get("dog", "NN"), "NN")
+        assert_equal(len(self.lexicon), 3)
+        assert_equal(sorted(self.lexicon.items()),
+                     [("cat", "NN"), ("na\u00efve", "JJ"), ("the", "DT")])
+        assert_true(isinstance(self.lexicon._compact, CompactLexicon))
+        assert_true(os.path.exists(os.path.join(self.dir, "lexicon.bin")))
+
+    def test_added_words_take_precedence(self):
+        self.lexicon["cat"] = "VB"
+        self.lexicon["dog"] = "NN"
+        assert_equal(self.lexicon.get("cat"), "VB")
+        assert_equal(self.lexicon["dog"], "NN")
+        assert_equal(len(self.lexicon), 4)
+
+    def test_pop(self):
+        assert_equal(self.lexicon.pop("cat"), "NN")
+        assert_false("cat" in self.lexicon)
+        assert_equal(len(self.lexicon), 2)
+
+    def test_del(self):
+        del self.lexicon["cat"]
+        assert_false("cat" in self.lexicon)
+        assert_equal(self.lexicon.get("the"), "DT")
+        assert_equal(len(self.lexicon), 2)
+        assert_raises(KeyError, self.lexicon.__delitem__, "dog")
+
+    def test_recompiled_when_source_changes(self):
+        len(self.lexicon)
+        with io.open(self.path, "a", encoding="utf-8") as f:
+            f.write("dog NN x\n")
+        os.utime(self.path, (0, 0))
+        with mock.patch.object(CompactLexicon, "close", autospec=True,
+                               side_effect=CompactLexicon.close) as close:
+            assert_equal(Lexicon(path=self.path).get("dog"), "NN")
+            assert_equal(close.call_count, 1)
+
 
 @attr("slow")
 @attr("no_pypy")
@@ -51,6 +235,11 @@ class TestNLTKTagger(unittest.TestCase):
             ('is', 'VBZ'), ('better', 'JJR'),
             ('than', 'IN'), ('complicated', 'JJ'), ('.', '.')])
 
+    def test_tag_sents(self):
+        texts = [self.text, "Tag! You're It!"]
+        assert_equal(self.tagger.tag_sents(texts),
+                     [self.tagger.tag(text) for text in texts])
+
 
 def test_cannot_instantiate_incomplete_tagger():
     class BadTagger(BaseTagger):
@@ -58,5 +247,12 @@ def test_cannot_instantiate_incomplete_tagger():
         pass
     assert_raises(TypeError, lambda: BadTagger())
 
+def test_default_tag_sents():
+    class UpperTagger(BaseTagger):
+        def tag(self, text, tokenize=True):
+            return [(word, word.upper()) for word in text.split()]
+    assert_equal(UpperTagger().tag_sents(["a b", "c"]),
+                 [[("a", "A"), ("b", "B")], [("c", "C")]])
+
 if __name__ == '__main__':
     unittest.main()
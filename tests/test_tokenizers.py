@@ -1,9 +1,16 @@
 # -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+import io
 import unittest
 from nose.plugins.attrib import attr
 from nose.tools import *  # PEP8 asserts
+import mock
 
-from textblob.tokenizers import WordTokenizer, SentenceTokenizer, word_tokenize, sent_tokenize
+import textblob.tokenizers
+from textblob.tokenizers import (WordTokenizer, SentenceTokenizer, word_tokenize,
+                                 sent_tokenize, sent_tokenize_stream,
+                                 word_tokenize_stream)
+from textblob._text import find_tokens, replacements
 from textblob.compat import PY2
 
 
@@ -70,10 +77,78 @@ class TestSentenceTokenizer(unittest.TestCase):
         assert_equal(next(gen), "Beautiful is better than ugly.")
         assert_equal(next(gen), "Simple is better than complex.")
 
+    def test_span_tokenize(self):
+        text = "Beautiful is better than ugly.   Simple is better than complex."
+        spans = self.tokenizer.span_tokenize(text)
+        assert_equal(spans, [(0, 30), (33, 63)])
+        assert_equal([text[start:end] for start, end in spans],
+                     self.tokenizer.tokenize(text))
+
     def test_sent_tokenize(self):
         tokens = sent_tokenize(self.text)
         assert_true(is_generator(tokens))  # It's a generator
         assert_equal(list(tokens), self.tokenizer.tokenize(self.text))
 
+
+class TestStreamTokenize(unittest.TestCase):
+
+    def setUp(self):
+        self.text = ("Beautiful is better than ugly. Explicit is better than implicit. "
+                     "Simple is better than complex. Complex is better than complicated.")
+
+    def test_sent_tokenize_stream_from_file(self):
+        stream = io.StringIO(self.text)
+        sentences = sent_tokenize_stream(stream, chunk_size=10)
+        assert_true(is_generator(sentences))
+        assert_equal(list(sentences), list(sent_tokenize(self.text)))
+
+    def test_sent_tokenize_stream_from_chunks(self):
+        chunks = [self.text[i:i + 7] for i in range(0, len(self.text), 7)]
+        assert_equal(list(sent_tokenize_stream(chunks)),
+                     list(sent_tokenize(self.text)))
+
+    def test_sent_tokenize_stream_long_sentence(self):
+        # Text without punctuation is not tokenized again for every chunk
+        chunks = ["word "] * 10000
+        with mock.patch.object(textblob.tokenizers, "sent_span_tokenize",
+                               wraps=textblob.tokenizers.sent_span_tokenize) as tokenize:
+            sentences = list(sent_tokenize_stream(chunks))
+        assert_equal(sentences, list(sent_tokenize("".join(chunks))))
+        assert_true(tokenize.call_count < 20)
+
+    def test_sent_tokenize_stream_max_sentence_length(self):
+        sentences = list(sent_tokenize_stream(["word "] * 1000, max_sentence_length=100))
+        assert_true(max(len(s) for s in sentences) < 200)
+        assert_equal(" ".join(sentences).split(), ["word"] * 1000)
+        assert_equal(list(sent_tokenize_stream(io.StringIO(self.text), chunk_size=10,
+                                               max_sentence_length=100)),
+                     list(sent_tokenize(self.text)))
+
+    def test_word_tokenize_stream(self):
+        stream = io.StringIO(self.text)
+        assert_equal(list(word_tokenize_stream(stream, include_punc=False, chunk_size=16)),
+                     list(word_tokenize(self.text, include_punc=False)))
+
+class TestFindTokens(unittest.TestCase):
+
+    def setUp(self):
+        self.text = ("I don't know. He'd say \u201chi\u201d :-) (!) etc.) "
+                     "U.S. e.g. Mr. Smith... ok?! \r\n\r\nNew para")
+
+    def test_find_tokens(self):
+        assert_equal(find_tokens(self.text),
+            ["I do n ' t know .", "He ' d say \u201c hi \u201d :-) (!)",
+            "etc. ) U.S. e.g. Mr. Smith ...", "ok ? !", "New para"])
+
+    def test_find_tokens_joins_emoticons(self):
+        assert_equal(find_tokens("Nice :o) but ;-] x"), ["Nice :o) but ;-] x"])
+        assert_equal(find_tokens("Don't cry ;'( ok"), ["Do n ' t cry ;'( ok"])
+
+    def test_custom_replacements_match_single_scan(self):
+        # Custom replacements use the string-rewriting tokenizer
+        custom = dict(replacements, **{"'em": " 'em"})
+        assert_equal(find_tokens(self.text, replace=custom),
+                     find_tokens(self.text))
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,7 +6,7 @@ __author__ = 'Steven Loria'
 
 PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-from .blob import TextBlob, Word, Sentence, Blobber, WordList
+from .blob import TextBlob, Word, Sentence, Blobber, WordList, warmup
 
 __all__ = [
     'TextBlob',
@@ -14,4 +14,5 @@ __all__ = [
     'Sentence',
     'Blobber',
     'WordList',
+    'warmup',
 ]
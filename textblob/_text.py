@@ -7,13 +7,21 @@ Licence: BSD
 from __future__ import unicode_literals
 import string
 import codecs
-from itertools import chain
+import sys
+import threading
+from array import array
+from itertools import chain, repeat
+from collections import namedtuple
 import types
 import os
 import re
+import mmap
+import struct
+import tempfile
+import zlib
 from xml.etree import cElementTree
 
-from .compat import text_type, basestring, imap, unicode, binary_type, PY2
+from .compat import text_type, basestring, imap, izip, unicode, binary_type, PY2, OrderedDict
 
 try:
     MODULE = os.path.dirname(os.path.abspath(__file__))
@@ -233,8 +241,33 @@ EMOTICONS = { # (facial expression, sentiment)-keys
     ("cry"  , -1.00): set((":'(", ":'''(", ";'("))
 }
 
-RE_EMOTICONS = [r" ?".join([re.escape(each) for each in e]) for v in EMOTICONS.values() for e in v]
-RE_EMOTICONS = re.compile(r"(%s)($|\s)" % "|".join(RE_EMOTICONS))
+def _trie_pattern(strings, separator=""):
+    """ Returns a regular expression that matches any of the given strings,
+        with the given separator between each two characters.
+        The alternatives are nested by common prefix, so that the regular expression
+        tests each character once, and longer strings are matched first.
+    """
+    trie = {}
+    for string in strings:
+        node = trie
+        for ch in string:
+            node = node.setdefault(ch, {})
+        node[None] = True
+    def pattern(node):
+        branches = []
+        for ch in sorted(k for k in node if k is not None):
+            child = node[ch]
+            if len(child) == 1 and None in child:
+                branches.append(re.escape(ch))
+            elif None in child:
+                branches.append("%s(?:%s%s)?" % (re.escape(ch), separator, pattern(child)))
+            else:
+                branches.append("%s%s%s" % (re.escape(ch), separator, pattern(child)))
+        return branches[0] if len(branches) == 1 else "(?:%s)" % "|".join(branches)
+    return pattern(trie)
+
+RE_EMOTICONS = [e for v in EMOTICONS.values() for e in v]
+RE_EMOTICONS = re.compile(r"(%s)($|\s)" % _trie_pattern(RE_EMOTICONS, separator=" ?"))
 
 # Handle sarcasm punctuation (!).
 RE_SARCASM = re.compile(r"\( ?\! ?\)")
@@ -253,14 +286,76 @@ replacements = {
 # Handle paragraph line breaks (\n\n marks end of sentence).
 EOS = "END-OF-SENTENCE"
 
-def find_tokens(string, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS, replace=replacements, linebreak=r"\n{2,}"):
-    """ Returns a list of sentences. Each sentence is a space-separated string of tokens (words).
-        Handles common cases of abbreviations (e.g., etc., ...).
-        Punctuation marks are split from other words. Periods (or ?!) mark the end of a sentence.
-        Headings without an ending period are inferred by line breaks.
+# Tokens that mark the end of a sentence, and tokens that may trail it.
+EOS_TOKENS = frozenset(("...", ".", "!", "?", EOS))
+EOS_TRAILING = frozenset(("”", "’", "...", ".", "!", "?", ")", EOS))
+
+# Handle Unicode quotes (each quote is a separate token).
+QUOTES = "“”‘’'\""
+
+# Single-pass tokenizer for the default replacements and line breaks.
+# The contraction, quote and whitespace rewrites in find_tokens() only insert or collapse spaces,
+# so the tokens they produce can be matched directly in the original string:
+# 1) two or more (Windows) line breaks => EOS,
+# 2) a quote,
+# 3) the "n" in "n't" (the only contraction that does not start with a quote),
+# 4) a run of characters that are not whitespace or quotes and that stops before "n't".
+RE_TOKENS = re.compile(r"(?:\r?\n){2,}|[%s]|n(?='t)|(?:[^\s%sn]|n(?!'t))+" % (QUOTES, QUOTES))
+
+def _split_punctuation(t, tokens, punctuation=(), abbreviations=ABBREVIATIONS, replace=replacements):
+    """ Appends the given token to the given list of tokens,
+        with leading and trailing punctuation marks split off as separate tokens.
+    """
+    tail = []
+    while t.startswith(punctuation) and \
+      not t in replace:
+        # Split leading punctuation.
+        if t.startswith(punctuation):
+            tokens.append(t[0]); t=t[1:]
+    while t.endswith(punctuation+(".",)) and \
+      not t in replace:
+        # Split trailing punctuation.
+        if t.endswith(punctuation):
+            tail.append(t[-1]); t=t[:-1]
+        # Split ellipsis (...) before splitting period.
+        if t.endswith("..."):
+            tail.append("..."); t=t[:-3].rstrip(".")
+        # Split period (if not an abbreviation).
+        if t.endswith("."):
+            if t in abbreviations or \
+              RE_ABBR1.match(t) is not None or \
+              RE_ABBR2.match(t) is not None or \
+              RE_ABBR3.match(t) is not None:
+                break
+            else:
+                tail.append(t[-1]); t=t[:-1]
+    if t != "":
+        tokens.append(t)
+    tokens.extend(reversed(tail))
+    return tokens
+
+def _scan_tokens(string, punctuation=(), abbreviations=ABBREVIATIONS, replace=replacements):
+    """ Returns a list of tokens from the given Unicode string, in a single scan (see RE_TOKENS).
+    """
+    tokens = []
+    split = {} # Tokens with leading or trailing punctuation, e.g., {"etc.)": ["etc.", ")"]}
+    head = set(punctuation)
+    tail = set(punctuation + (".",))
+    for t in RE_TOKENS.findall(string):
+        if t[0] in "\r\n":
+            tokens.append(EOS)
+        elif len(t) > 1 and (t[0] in head or t[-1] in tail):
+            if t not in split:
+                split[t] = _split_punctuation(t, [], punctuation, abbreviations, replace)
+            tokens.extend(split[t])
+        else:
+            tokens.append(t)
+    return tokens
+
+def _rewrite_tokens(string, punctuation=(), abbreviations=ABBREVIATIONS, replace=replacements, linebreak=r"\n{2,}"):
+    """ Returns a list of tokens from the given string,
+        by rewriting the string (contractions, quotes, line breaks, whitespace) and splitting it.
     """
-    # Handle periods separately.
-    punctuation = tuple(punctuation.replace(".", ""))
     # Handle replacements (contractions).
     for a, b in list(replace.items()):
         string = re.sub(a, b, string)
@@ -279,46 +374,34 @@ def find_tokens(string, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS, re
     tokens = []
     for t in TOKEN.findall(string+" "):
         if len(t) > 0:
-            tail = []
-            while t.startswith(punctuation) and \
-              not t in replace:
-                # Split leading punctuation.
-                if t.startswith(punctuation):
-                    tokens.append(t[0]); t=t[1:]
-            while t.endswith(punctuation+(".",)) and \
-              not t in replace:
-                # Split trailing punctuation.
-                if t.endswith(punctuation):
-                    tail.append(t[-1]); t=t[:-1]
-                # Split ellipsis (...) before splitting period.
-                if t.endswith("..."):
-                    tail.append("..."); t=t[:-3].rstrip(".")
-                # Split period (if not an abbreviation).
-                if t.endswith("."):
-                    if t in abbreviations or \
-                      RE_ABBR1.match(t) is not None or \
-                      RE_ABBR2.match(t) is not None or \
-                      RE_ABBR3.match(t) is not None:
-                        break
-                    else:
-                        tail.append(t[-1]); t=t[:-1]
-            if t != "":
-                tokens.append(t)
-            tokens.extend(reversed(tail))
-    sentences, i, j = [[]], 0, 0
-    while j < len(tokens):
-        if tokens[j] in ("...", ".", "!", "?", EOS):
+            _split_punctuation(t, tokens, punctuation, abbreviations, replace)
+    return tokens
+
+def find_tokens(string, punctuation=PUNCTUATION, abbreviations=ABBREVIATIONS, replace=replacements, linebreak=r"\n{2,}"):
+    """ Returns a list of sentences. Each sentence is a space-separated string of tokens (words).
+        Handles common cases of abbreviations (e.g., etc., ...).
+        Punctuation marks are split from other words. Periods (or ?!) mark the end of a sentence.
+        Headings without an ending period are inferred by line breaks.
+    """
+    # Handle periods separately.
+    punctuation = tuple(punctuation.replace(".", ""))
+    # Handle contractions, quotes, line breaks and whitespace in a single scan,
+    # unless custom replacements or line breaks are given.
+    if isinstance(string, unicode) and replace == replacements and linebreak == r"\n{2,}":
+        tokens = _scan_tokens(string, punctuation, abbreviations, replace)
+    else:
+        tokens = _rewrite_tokens(string, punctuation, abbreviations, replace, linebreak)
+    sentences, i, j, n = [], 0, 0, len(tokens)
+    while j < n:
+        if tokens[j] in EOS_TOKENS:
             # Handle citations, trailing parenthesis, repeated punctuation (!?).
-            while j < len(tokens) \
-                    and tokens[j] in ("'", "\"", u"”", u"’", "...", ".", "!", "?", ")", EOS):
-                if tokens[j] in ("'", "\"") and sentences[-1].count(tokens[j]) % 2 == 0:
-                    break  # Balanced quotes.
+            # Straight quotes (' ") are never balanced at this point: they open the next sentence.
+            while j < n and tokens[j] in EOS_TRAILING:
                 j += 1
-            sentences[-1].extend(t for t in tokens[i:j] if t != EOS)
-            sentences.append([])
+            sentences.append([t for t in tokens[i:j] if t != EOS])
             i = j
         j += 1
-    sentences[-1].extend(tokens[i:j])
+    sentences.append(tokens[i:j])
     sentences = (" ".join(s) for s in sentences if len(s) > 0)
     sentences = (RE_SARCASM.sub("(!)", s) for s in sentences)
     sentences = [RE_EMOTICONS.sub(
@@ -362,7 +445,7 @@ def _read(path, encoding="utf-8", comment=";;;"):
             if not line or (comment and line.startswith(comment)):
                 continue
             yield line
-    raise StopIteration
+    return
 
 
 class Lexicon(lazydict):
@@ -370,17 +453,99 @@ class Lexicon(lazydict):
     def __init__(self, path="", morphology=None, context=None, entities=None, NNP="NNP", language=None):
         """ A dictionary of words and their part-of-speech tags.
             For unknown words, rules for word morphology, context and named entities can be used.
+            If the lexicon is a file, it is compiled to a CompactLexicon next to it,
+            which is memory-mapped instead of being loaded into a dict.
+            Words added to the lexicon are stored in the dict and take precedence.
         """
         self._path = path
         self._language  = language
+        self._compact   = None
         self.morphology = Morphology(self, path=morphology)
         self.context    = Context(self, path=context)
         self.entities   = Entities(self, path=entities, tag=NNP)
 
     def load(self):
         # Arnold NNP x
+        if isinstance(self._path, basestring) and os.path.isfile(self._path):
+            self._compact = CompactLexicon.open(self._path)
+        if self._compact is not None:
+            self.get = self._mapped_get
+            return
         dict.update(self, (x.split(" ")[:2] for x in _read(self._path) if x.strip()))
 
+    def _lazy(self, method, *args):
+        """ If the lexicon is memory-mapped, dispatches to Lexicon._mapped_method().
+        """
+        if self._compact is None and dict.__len__(self) == 0:
+            self.load()
+        if self._compact is None:
+            return lazydict._lazy(self, method, *args)
+        return getattr(self, "_mapped_" + method.strip("_"))(*args)
+
+    def _mapped_get(self, word, default=None):
+        if dict.__contains__(self, word):
+            return dict.__getitem__(self, word)
+        return self._compact.get(word, default)
+
+    def _mapped_getitem(self, word):
+        v = self._mapped_get(word)
+        if v is None:
+            raise KeyError(word)
+        return v
+
+    def _mapped_contains(self, word):
+        return dict.__contains__(self, word) or word in self._compact
+
+    def _mapped_iter(self):
+        return chain(dict.__iter__(self), (w for w in self._compact if not dict.__contains__(self, w)))
+
+    def _mapped_len(self):
+        return len(self._compact) + sum(1 for w in dict.__iter__(self) if w not in self._compact)
+
+    def _mapped_keys(self):
+        return list(self._mapped_iter())
+
+    def _mapped_values(self):
+        return [self._mapped_get(w) for w in self._mapped_iter()]
+
+    def _mapped_items(self):
+        return [(w, self._mapped_get(w)) for w in self._mapped_iter()]
+
+    def _mapped_repr(self):
+        return repr(dict(self._mapped_items()))
+
+    def _mapped_setitem(self, word, tag):
+        dict.__setitem__(self, word, tag)
+
+    def _mapped_setdefault(self, word, tag=None):
+        if not self._mapped_contains(word):
+            dict.__setitem__(self, word, tag)
+        return self._mapped_get(word)
+
+    def _mapped_update(self, *args):
+        dict.update(self, *args)
+
+    def _unmap(self):
+        # Entries in the compact lexicon are read-only; removing one loads them all.
+        items, self._compact = self._mapped_items(), None
+        self.__dict__.pop("get", None)
+        dict.update(self, items)
+
+    def _mapped_pop(self, *args):
+        self._unmap()
+        return lazydict._lazy(self, "pop", *args)
+
+    def _mapped_popitem(self, *args):
+        self._unmap()
+        return lazydict._lazy(self, "popitem", *args)
+
+    def __delitem__(self, word):
+        return self._lazy("__delitem__", word)
+
+    def _mapped_delitem(self, word):
+        self._unmap()
+        dict.__delitem__(self, word)
+
     @property
     def path(self):
         return self._path
@@ -389,6 +554,160 @@ class Lexicon(lazydict):
     def language(self):
         return self._language
 
+#--- COMPACT LEXICON -------------------------------------------------------------------------------
+# A lexicon of about 100,000 words takes tens of MB as a Python dict, in every process that uses it.
+# CompactLexicon stores the words in a binary file that is memory-mapped instead,
+# so that the operating system shares a single copy between processes.
+# The file is a header, followed by:
+# - the tags, as a UTF-8 string separated by newlines,
+# - the start offset of each word in the string table (n+1 unsigned ints),
+# - the tag id of each word (n unsigned shorts),
+# - an open addressing hash table of word ids + 1, by CRC-32 of the word (0 = empty slot),
+# - the string table of UTF-8 encoded words.
+
+class CompactLexicon(object):
+
+    MAGIC   = b"TBLX"
+    VERSION = 1
+    HEADER  = struct.Struct(str("<4sIQQIIII")) # magic, version, source size, source mtime, n, slots, tags, words
+
+    _uint  = struct.Struct(str("<I"))
+    _uint2 = struct.Struct(str("<II"))
+    _short = struct.Struct(str("<H"))
+
+    def __init__(self, path):
+        """ A read-only dictionary of (word, tag)-items, memory-mapped from the given binary file.
+            Lookups read the file directly and do not build a dict.
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size, mtime, n, m, t, w = self.HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("%s is not a compact lexicon" % path)
+        i = self.HEADER.size
+        self.source   = (size, mtime)
+        self.tags     = self._map[i:i+t].decode("utf-8").split("\n")
+        self._offsets = i + t
+        self._tags    = self._offsets + 4 * (n + 1)
+        self._slots   = self._tags + 2 * n
+        self._words   = self._slots + 4 * m
+        self._mask    = m - 1
+        self._n       = n
+
+    @classmethod
+    def stat(cls, path):
+        """ Returns a (size, mtime)-tuple used to check if the compiled file is outdated.
+        """
+        st = os.stat(path)
+        return (st.st_size, int(st.st_mtime * 1000000))
+
+    @classmethod
+    def compile(cls, lexicon, path, source=(0, 0)):
+        """ Writes the given dictionary of (word, tag)-items to the binary file at the given path.
+            The file is written to a temporary file first and then renamed,
+            so that other processes never see a partially written file.
+        """
+        words = [w.encode("utf-8") for w in lexicon]
+        tags  = sorted(set(lexicon.values()))
+        index = dict((tag, i) for i, tag in enumerate(tags))
+        m = 1
+        while m < len(words) * 2:
+            m *= 2
+        slots = [0] * m
+        for j, w in enumerate(words):
+            i = (zlib.crc32(w) & 0xffffffff) & (m - 1)
+            while slots[i]:
+                i = (i + 1) & (m - 1)
+            slots[i] = j + 1
+        offsets = [0]
+        for w in words:
+            offsets.append(offsets[-1] + len(w))
+        t = "\n".join(tags).encode("utf-8")
+        b = b"".join(words)
+        f, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(f, "wb") as f:
+                f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, source[0], source[1], len(words), m, len(t), len(b)))
+                f.write(t)
+                f.write(struct.pack(str("<%dI" % len(offsets)), *offsets))
+                f.write(struct.pack(str("<%dH" % len(words)), *(index[lexicon[w]] for w in lexicon)))
+                f.write(struct.pack(str("<%dI" % m), *slots))
+                f.write(b)
+            os.chmod(tmp, 0o644)
+            if os.name == "nt" and os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp, path)
+        except:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    @classmethod
+    def open(cls, source, path=None):
+        """ Returns a CompactLexicon for the given lexicon text file,
+            compiling it first if it is missing or older than the text file.
+            By default, the binary file is stored next to the text file (e.g., en-lexicon.bin).
+            Returns None if the binary file can't be read or written.
+        """
+        path = path or os.path.splitext(source)[0] + ".bin"
+        try:
+            stat = cls.stat(source)
+            if os.path.exists(path):
+                lexicon = cls(path)
+                if lexicon.source == stat:
+                    return lexicon
+                lexicon.close()
+            lexicon = {}
+            lexicon.update(x.split(" ")[:2] for x in _read(source) if x.strip())
+            cls.compile(lexicon, path, source=stat)
+            return cls(path)
+        except (IOError, OSError, ValueError, struct.error):
+            return None
+
+    def _word(self, j):
+        a, b = self._uint2.unpack_from(self._map, self._offsets + 4 * j)
+        return self._map[self._words+a:self._words+b]
+
+    def _tag(self, j):
+        return self.tags[self._short.unpack_from(self._map, self._tags + 2 * j)[0]]
+
+    def get(self, word, default=None):
+        try:
+            w = word.encode("utf-8")
+        except (AttributeError, UnicodeError):
+            return default
+        m, mask = self._map, self._mask
+        i = (zlib.crc32(w) & 0xffffffff) & mask
+        while True:
+            j = self._uint.unpack_from(m, self._slots + 4 * i)[0]
+            if j == 0:
+                return default
+            a, b = self._uint2.unpack_from(m, self._offsets + 4 * j - 4)
+            if m[self._words+a:self._words+b] == w:
+                return self.tags[self._short.unpack_from(m, self._tags + 2 * j - 2)[0]]
+            i = (i + 1) & mask
+
+    def __getitem__(self, word):
+        v = self.get(word)
+        if v is None:
+            raise KeyError(word)
+        return v
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def __len__(self):
+        return self._n
+
+    def __iter__(self):
+        for j in range(self._n):
+            yield self._word(j).decode("utf-8")
+
+    def items(self):
+        return [(self._word(j).decode("utf-8"), self._tag(j)) for j in range(self._n)]
+
+    def close(self):
+        self._map.close()
 
 #--- MORPHOLOGICAL RULES ---------------------------------------------------------------------------
 # Brill's algorithm generates lexical (i.e., morphological) rules in the following format:
@@ -405,7 +724,51 @@ class Rules:
         """
         return x
 
-class Morphology(lazylist, Rules):
+class RuleList(lazylist, Rules):
+
+    # A lazy list of rules that compiles an index of the rules on first use (RuleList._index).
+    # Each method that changes the list calls list.method() directly and clears the index,
+    # instead of lazylist, which replaces the method with list.method() after loading.
+
+    def _changed(self, method, *args, **kwargs):
+        if list.__len__(self) == 0:
+            self.load()
+        self._index = None
+        return getattr(list, method)(self, *args, **kwargs)
+
+    def remove(self, *args):
+        return self._changed("remove", *args)
+    def pop(self, *args):
+        return self._changed("pop", *args)
+    def sort(self, *args, **kwargs):
+        return self._changed("sort", *args, **kwargs)
+    def reverse(self):
+        return self._changed("reverse")
+    def __setitem__(self, *args):
+        return self._changed("__setitem__", *args)
+    def __delitem__(self, *args):
+        return self._changed("__delitem__", *args)
+    def __iadd__(self, *args):
+        return self._changed("__iadd__", *args)
+    def __setslice__(self, *args): # Python 2
+        return self._changed("__setslice__", *args)
+    def __delslice__(self, *args):
+        return self._changed("__delslice__", *args)
+
+# Morphological rule conditions: (word, x, lexicon, previous, next) => True if the rule applies.
+MORPHOLOGY_MATCH = {
+          "char": lambda w, x, lexicon, previous, next: x in w,
+       "haspref": lambda w, x, lexicon, previous, next: w.startswith(x),
+        "hassuf": lambda w, x, lexicon, previous, next: w.endswith(x),
+       "addpref": lambda w, x, lexicon, previous, next: x + w in lexicon,
+        "addsuf": lambda w, x, lexicon, previous, next: w + x in lexicon,
+    "deletepref": lambda w, x, lexicon, previous, next: w.startswith(x) and w[len(x):] in lexicon,
+     "deletesuf": lambda w, x, lexicon, previous, next: w.endswith(x) and w[:-len(x)] in lexicon,
+      "goodleft": lambda w, x, lexicon, previous, next: x == next[0],
+     "goodright": lambda w, x, lexicon, previous, next: x == previous[0],
+}
+
+class Morphology(RuleList):
 
     def __init__(self, lexicon={}, path=""):
         """ A list of rules based on word morphology (prefix, suffix).
@@ -424,6 +787,7 @@ class Morphology(lazylist, Rules):
         cmd.update(("f" + k, v) for k, v in list(cmd.items()))
         Rules.__init__(self, lexicon, cmd)
         self._path = path
+        self._index = None
 
     @property
     def path(self):
@@ -432,27 +796,72 @@ class Morphology(lazylist, Rules):
     def load(self):
         # ["NN", "s", "fhassuf", "1", "NNS", "x"]
         list.extend(self, (x.split() for x in _read(self._path)))
+        self._index = None
+
+    def _compile(self):
+        """ Returns the rules as (f, tag, x, pos, cmd)-tuples, together with
+            an index of the rules that can apply to a given word:
+            prefix and suffix tries, dicts of characters and neighboring words,
+            and a list of residual rules that are always tested.
+        """
+        if self._index is None:
+            rules, r0 = [], None
+            for r in self:
+                if r[1] in self.cmd: # Rule = ly hassuf 2 RB x
+                    r0 = (False, r[0], r[0], r[-2], r[1].lower())
+                if r[2] in self.cmd: # Rule = NN s fhassuf 1 NNS x
+                    r0 = (True, r[0], r[1], r[-2], r[2].lower().lstrip("f"))
+                if r0 is not None:
+                    rules.append(r0[:1] + (r[0],) + r0[2:])
+            prefix, suffix, char, left, right, residual = {}, {}, {}, {}, {}, []
+            for i, (f, tag, x, pos, cmd) in enumerate(rules):
+                if cmd in ("haspref", "deletepref"):
+                    node = prefix
+                    for ch in x:
+                        node = node.setdefault(ch, {})
+                    node.setdefault(None, []).append(i)
+                elif cmd in ("hassuf", "deletesuf"):
+                    node = suffix
+                    for ch in reversed(x):
+                        node = node.setdefault(ch, {})
+                    node.setdefault(None, []).append(i)
+                elif cmd == "char" and len(x) == 1:
+                    char.setdefault(x, []).append(i)
+                elif cmd == "goodleft":
+                    left.setdefault(x, []).append(i)
+                elif cmd == "goodright":
+                    right.setdefault(x, []).append(i)
+                elif cmd in MORPHOLOGY_MATCH:
+                    residual.append(i)
+            self._index = (rules, prefix, suffix, char, left, right, residual)
+        return self._index
 
     def apply(self, token, previous=(None, None), next=(None, None)):
         """ Applies lexical rules to the given token, which is a [word, tag] list.
         """
+        # Walking the prefix and suffix tries yields the candidate rules in
+        # O(len(word)). Candidates are then tested in rule order, since a rule
+        # can depend on the tag assigned by a preceding rule.
+        rules, prefix, suffix, char, left, right, residual = self._compile()
         w = token[0]
-        for r in self:
-            if r[1] in self.cmd: # Rule = ly hassuf 2 RB x
-                f, x, pos, cmd = bool(0), r[0], r[-2], r[1].lower()
-            if r[2] in self.cmd: # Rule = NN s fhassuf 1 NNS x
-                f, x, pos, cmd = bool(1), r[1], r[-2], r[2].lower().lstrip("f")
-            if f and token[1] != r[0]:
+        candidates = list(residual)
+        for trie, chars in ((prefix, w), (suffix, reversed(w))):
+            node = trie
+            candidates.extend(node.get(None, ()))
+            for ch in chars:
+                node = node.get(ch)
+                if node is None:
+                    break
+                candidates.extend(node.get(None, ()))
+        for ch in set(w):
+            candidates.extend(char.get(ch, ()))
+        candidates.extend(left.get(next[0], ()))
+        candidates.extend(right.get(previous[0], ()))
+        for i in sorted(candidates):
+            f, tag, x, pos, cmd = rules[i]
+            if f and token[1] != tag:
                 continue
-            if (cmd == "char"       and x in w) \
-            or (cmd == "haspref"    and w.startswith(x)) \
-            or (cmd == "hassuf"     and w.endswith(x)) \
-            or (cmd == "addpref"    and x + w in self.lexicon) \
-            or (cmd == "addsuf"     and w + x in self.lexicon) \
-            or (cmd == "deletepref" and w.startswith(x) and w[len(x):] in self.lexicon) \
-            or (cmd == "deletesuf"  and w.endswith(x) and w[:-len(x)] in self.lexicon) \
-            or (cmd == "goodleft"   and x == next[0]) \
-            or (cmd == "goodright"  and x == previous[0]):
+            if MORPHOLOGY_MATCH[cmd](w, x, self.lexicon, previous, next):
                 token[1] = pos
         return token
 
@@ -470,7 +879,10 @@ class Morphology(lazylist, Rules):
             r = [tagged, affix, "f"+cmd.lstrip("f"), tag, "x"]
         else:
             r = [affix, cmd.lstrip("f"), tag, "x"]
-        lazylist.insert(self, i, r)
+        if list.__len__(self) == 0:
+            self.load()
+        list.insert(self, i, r)
+        self._index = None
 
     def append(self, *args, **kwargs):
         self.insert(len(self)-1, *args, **kwargs)
@@ -483,7 +895,36 @@ class Morphology(lazylist, Rules):
 # Brill's algorithm generates contextual rules in the following format:
 # VBD VB PREVTAG TO => unknown word tagged VBD changes to VB if preceded by a word tagged TO.
 
-class Context(lazylist, Rules):
+# Contextual rule conditions: (tokens, index, x, y) => True if the rule applies.
+CONTEXT_MATCH = {
+           "prevtag": lambda t, i, x, y: x == t[i-1][1],
+           "nexttag": lambda t, i, x, y: x == t[i+1][1],
+          "prev2tag": lambda t, i, x, y: x == t[i-2][1],
+          "next2tag": lambda t, i, x, y: x == t[i+2][1],
+       "prev1or2tag": lambda t, i, x, y: x in (t[i-1][1], t[i-2][1]),
+       "next1or2tag": lambda t, i, x, y: x in (t[i+1][1], t[i+2][1]),
+    "prev1or2or3tag": lambda t, i, x, y: x in (t[i-1][1], t[i-2][1], t[i-3][1]),
+    "next1or2or3tag": lambda t, i, x, y: x in (t[i+1][1], t[i+2][1], t[i+3][1]),
+       "surroundtag": lambda t, i, x, y: x == t[i-1][1] and y == t[i+1][1],
+             "curwd": lambda t, i, x, y: x == t[i+0][0],
+            "prevwd": lambda t, i, x, y: x == t[i-1][0],
+            "nextwd": lambda t, i, x, y: x == t[i+1][0],
+        "prev1or2wd": lambda t, i, x, y: x in (t[i-1][0], t[i-2][0]),
+        "next1or2wd": lambda t, i, x, y: x in (t[i+1][0], t[i+2][0]),
+         "prevwdtag": lambda t, i, x, y: x == t[i-1][0] and y == t[i-1][1],
+         "nextwdtag": lambda t, i, x, y: x == t[i+1][0] and y == t[i+1][1],
+         "wdprevtag": lambda t, i, x, y: x == t[i-1][1] and y == t[i+0][0],
+         "wdnexttag": lambda t, i, x, y: x == t[i+0][0] and y == t[i+1][1],
+         "wdand2aft": lambda t, i, x, y: x == t[i+0][0] and y == t[i+2][0],
+      "wdand2tagbfr": lambda t, i, x, y: x == t[i-2][1] and y == t[i+0][0],
+      "wdand2tagaft": lambda t, i, x, y: x == t[i+0][0] and y == t[i+2][1],
+           "lbigram": lambda t, i, x, y: x == t[i-1][0] and y == t[i+0][0],
+           "rbigram": lambda t, i, x, y: x == t[i+0][0] and y == t[i+1][0],
+        "prevbigram": lambda t, i, x, y: x == t[i-2][1] and y == t[i-1][1],
+        "nextbigram": lambda t, i, x, y: x == t[i+1][1] and y == t[i+2][1],
+}
+
+class Context(RuleList):
 
     def __init__(self, lexicon={}, path=""):
         """ A list of rules based on context (preceding and following words).
@@ -518,6 +959,7 @@ class Context(lazylist, Rules):
         )
         Rules.__init__(self, lexicon, dict.fromkeys(cmd, True))
         self._path = path
+        self._index = None
 
     @property
     def path(self):
@@ -526,47 +968,45 @@ class Context(lazylist, Rules):
     def load(self):
         # ["VBD", "VB", "PREVTAG", "TO"]
         list.extend(self, (x.split() for x in _read(self._path)))
+        self._index = None
+
+    def _compile(self):
+        """ Returns a dict of (tag, rules)-items and the list of wildcard rules.
+            For each tag, the rules that apply to it ("*" included) are kept
+            in reverse order as (tag2, match, x, y)-tuples.
+        """
+        if self._index is None:
+            rules = []
+            for r in self:
+                match = CONTEXT_MATCH.get(r[2].lower())
+                if match is not None:
+                    rules.append((r[0], (r[1], match, r[3], r[4] if len(r) > 4 else "")))
+            rules.reverse()
+            index = {}
+            for tag in set(tag for tag, r in rules if tag != "*"):
+                index[tag] = [r for tag1, r in rules if tag1 in (tag, "*")]
+            self._index = (index, [r for tag1, r in rules if tag1 == "*"])
+        return self._index
 
     def apply(self, tokens):
         """ Applies contextual rules to the given list of tokens,
             where each token is a [word, tag] list.
         """
+        # Rules are indexed by the tag they change, so each token is only tested
+        # against rules for its own tag. A rule never looks at the tag of the
+        # current word, so the last matching rule (in file order) wins:
+        # testing the rules in reverse order, we can stop at the first match.
+        index, wildcard = self._compile()
         o = [("STAART", "STAART")] * 3 # Empty delimiters for look ahead/back.
         t = o + tokens + o
-        for i, token in enumerate(t):
-            for r in self:
-                if token[1] == "STAART":
-                    continue
-                if token[1] != r[0] and r[0] != "*":
-                    continue
-                cmd, x, y = r[2], r[3], r[4] if len(r) > 4 else ""
-                cmd = cmd.lower()
-                if (cmd == "prevtag"        and x ==  t[i-1][1]) \
-                or (cmd == "nexttag"        and x ==  t[i+1][1]) \
-                or (cmd == "prev2tag"       and x ==  t[i-2][1]) \
-                or (cmd == "next2tag"       and x ==  t[i+2][1]) \
-                or (cmd == "prev1or2tag"    and x in (t[i-1][1], t[i-2][1])) \
-                or (cmd == "next1or2tag"    and x in (t[i+1][1], t[i+2][1])) \
-                or (cmd == "prev1or2or3tag" and x in (t[i-1][1], t[i-2][1], t[i-3][1])) \
-                or (cmd == "next1or2or3tag" and x in (t[i+1][1], t[i+2][1], t[i+3][1])) \
-                or (cmd == "surroundtag"    and x ==  t[i-1][1] and y == t[i+1][1]) \
-                or (cmd == "curwd"          and x ==  t[i+0][0]) \
-                or (cmd == "prevwd"         and x ==  t[i-1][0]) \
-                or (cmd == "nextwd"         and x ==  t[i+1][0]) \
-                or (cmd == "prev1or2wd"     and x in (t[i-1][0], t[i-2][0])) \
-                or (cmd == "next1or2wd"     and x in (t[i+1][0], t[i+2][0])) \
-                or (cmd == "prevwdtag"      and x ==  t[i-1][0] and y == t[i-1][1]) \
-                or (cmd == "nextwdtag"      and x ==  t[i+1][0] and y == t[i+1][1]) \
-                or (cmd == "wdprevtag"      and x ==  t[i-1][1] and y == t[i+0][0]) \
-                or (cmd == "wdnexttag"      and x ==  t[i+0][0] and y == t[i+1][1]) \
-                or (cmd == "wdand2aft"      and x ==  t[i+0][0] and y == t[i+2][0]) \
-                or (cmd == "wdand2tagbfr"   and x ==  t[i-2][1] and y == t[i+0][0]) \
-                or (cmd == "wdand2tagaft"   and x ==  t[i+0][0] and y == t[i+2][1]) \
-                or (cmd == "lbigram"        and x ==  t[i-1][0] and y == t[i+0][0]) \
-                or (cmd == "rbigram"        and x ==  t[i+0][0] and y == t[i+1][0]) \
-                or (cmd == "prevbigram"     and x ==  t[i-2][1] and y == t[i-1][1]) \
-                or (cmd == "nextbigram"     and x ==  t[i+1][1] and y == t[i+2][1]):
-                    t[i] = [t[i][0], r[1]]
+        for i in range(len(o), len(t) - len(o)):
+            token = t[i]
+            if token[1] == "STAART":
+                continue
+            for tag, match, x, y in index.get(token[1], wildcard):
+                if match(t, i, x, y):
+                    t[i] = [token[0], tag]
+                    break
         return t[len(o):-len(o)]
 
     def insert(self, i, tag1, tag2, cmd="prevtag", x=None, y=None):
@@ -577,7 +1017,10 @@ class Context(lazylist, Rules):
             tag1, x = tag1.split(" < "); cmd="prevtag"
         if " > " in tag1 and not x and not y:
             x, tag1 = tag1.split(" > "); cmd="nexttag"
-        lazylist.insert(self, i, [tag1, tag2, cmd, x or "", y or ""])
+        if list.__len__(self) == 0:
+            self.load()
+        list.insert(self, i, [tag1, tag2, cmd, x or "", y or ""])
+        self._index = None
 
     def append(self, *args, **kwargs):
         self.insert(len(self)-1, *args, **kwargs)
@@ -698,8 +1141,121 @@ class Score(tuple):
     def __init__(self, polarity, subjectivity, assessments=[]):
         self.assessments = assessments
 
+#--- COMPILED SENTIMENT LEXICON ---------------------------------------------------------------------
+# Parsing the sentiment XML and averaging the scores of each word sense takes tens of milliseconds,
+# in every process that uses it. CompiledSentiment stores the averaged scores in a binary file
+# next to the XML, which is read in one call. The file is a header, followed by:
+# - the strings, UTF-8 encoded and separated by newlines: the settings key, the language,
+#   the tags, the words, the synset ids, the labeled words and their labels,
+# - the word id and tag id + 1 of each (word, tag)-entry (n unsigned ints and n unsigned shorts),
+# - the polarity, subjectivity and intensity of each entry and each synset (doubles).
+
+class CompiledSentiment(object):
+
+    MAGIC   = b"TBSX"
+    VERSION = 1
+    HEADER  = struct.Struct(str("<4sIQQIIIIII")) # magic, version, source size, source mtime,
+                                                 # words, tags, entries, synsets, labels, strings
+
+    @classmethod
+    def compile(cls, data, path, source=(0, 0), key=""):
+        """ Writes the given (language, words, labels, synsets)-tuple to the binary file at the given path,
+            where words is a dict of word => {tag: [polarity, subjectivity, intensity]},
+            labels a dict of word => label and synsets a dict of id => [polarity, subjectivity, intensity].
+            The file is written to a temporary file first and then renamed,
+            so that other processes never see a partially written file.
+        """
+        language, words, labels, synsets = data
+        tags = sorted(set(tag for w in words.values() for tag in w if tag is not None))
+        index = dict((tag, i + 1) for i, tag in enumerate(tags))
+        index[None] = 0
+        entries = [(j, index[tag], psi) for j, w in enumerate(words.values()) for tag, psi in w.items()]
+        strings = [key, language or ""] + tags + list(words) + list(synsets) + list(labels) + list(labels.values())
+        strings = "\n".join(strings).encode("utf-8")
+        values = [x for j, t, psi in entries for x in psi] + [x for psi in synsets.values() for x in psi]
+        f, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(f, "wb") as f:
+                f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, source[0], source[1],
+                    len(words), len(tags), len(entries), len(synsets), len(labels), len(strings)))
+                f.write(strings)
+                f.write(struct.pack(str("<%dI" % len(entries)), *(j for j, t, psi in entries)))
+                f.write(struct.pack(str("<%dH" % len(entries)), *(t for j, t, psi in entries)))
+                f.write(struct.pack(str("<%dd" % len(values)), *values))
+            os.chmod(tmp, 0o644)
+            if os.name == "nt" and os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp, path)
+        except:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    @classmethod
+    def read(cls, path, source=None, key=""):
+        """ Returns the (language, words, labels, synsets)-tuple stored in the binary file at the given path,
+            or None if the file was compiled from another source (size, mtime) or with another key.
+        """
+        with open(path, "rb") as f:
+            b = f.read()
+        magic, version, size, mtime, nw, nt, n, ns, nl, m = cls.HEADER.unpack_from(b, 0)
+        if magic != cls.MAGIC or version != cls.VERSION:
+            raise ValueError("%s is not a compiled sentiment lexicon" % path)
+        i = cls.HEADER.size
+        strings = b[i:i+m].decode("utf-8").split("\n")
+        if source is not None and source != (size, mtime) or strings[0] != key:
+            return None
+        language = strings[1] or None
+        tags     = [None] + strings[2:2+nt]
+        strings  = strings[2+nt:]
+        words    = strings[:nw]
+        ids      = strings[nw:nw+ns]
+        labels   = dict(zip(strings[nw+ns:nw+ns+nl], strings[nw+ns+nl:]))
+        i += m
+        w = struct.unpack_from(str("<%dI" % n), b, i)
+        t = struct.unpack_from(str("<%dH" % n), b, i + 4 * n)
+        v = struct.unpack_from(str("<%dd" % (3 * (n + ns))), b, i + 6 * n)
+        v = list(imap(list, zip(v[0::3], v[1::3], v[2::3])))
+        entries = {}
+        for w, t, psi in zip(imap(words.__getitem__, w), imap(tags.__getitem__, t), v):
+            try:
+                entries[w][t] = psi
+            except KeyError:
+                entries[w] = {t: psi}
+        synsets = dict(zip(ids, v[n:]))
+        return language, entries, labels, synsets
+
+    @classmethod
+    def open(cls, source, parse, key="", path=None):
+        """ Returns the (language, words, labels, synsets)-tuple for the given sentiment XML file,
+            read from the binary file next to it (e.g., en-sentiment.bin).
+            If the binary file is missing, older than the XML file or compiled with another key,
+            the XML file is parsed with parse(source) and compiled, if the directory is writable.
+        """
+        path = path or os.path.splitext(source)[0] + ".bin"
+        stat = CompactLexicon.stat(source)
+        try:
+            if os.path.exists(path):
+                data = cls.read(path, stat, key)
+                if data is not None:
+                    return data
+        except (IOError, OSError, ValueError, struct.error):
+            pass
+        data = parse(source)
+        try:
+            cls.compile(data, path, source=stat, key=key)
+        except (IOError, OSError):
+            pass
+        return data
+
 class Sentiment(lazydict):
 
+    # Version of the scores that _parse() derives from the XML file. It is part of the key
+    # of the compiled file, together with the class name, so subclasses that override _parse()
+    # (e.g., to add adverbs) never load scores compiled by another class.
+    # Increment it when _parse() changes.
+    _parse_version = 1
+
     def __init__(self, path="", language=None, synset=None, confidence=None, **kwargs):
         """ A dictionary of words (adjectives) and polarity scores (positive/negative).
             The value for each word is a dictionary of part-of-speech tags.
@@ -712,6 +1268,7 @@ class Sentiment(lazydict):
         self._synset     = synset # XML synset attribute ("wordnet_id", "cornetto_id", ...)
         self._synsets    = {}     # {"a-01123879": (1.0, 1.0, 1.0)}
         self.labeler     = {}     # {"dammit": "profanity"}
+        self.emoticons   = {}     # {":-)": 0.5}
         self.tokenizer   = kwargs.get("tokenizer", find_tokens)
         self.negations   = kwargs.get("negations", ("no", "not", "n't", "never"))
         self.modifiers   = kwargs.get("modifiers", ("RB",))
@@ -733,12 +1290,34 @@ class Sentiment(lazydict):
         """ Loads the XML-file (with sentiment annotations) from the given path.
             By default, Sentiment.path is lazily loaded.
         """
-        # <word form="great" wordnet_id="a-01123879" pos="JJ" polarity="1.0" subjectivity="1.0" intensity="1.0" />
-        # <word form="damnmit" polarity="-0.75" subjectivity="1.0" label="profanity" />
         if not path:
             path = self._path
+        # Index the lowercase emoticons that assessments() looks up,
+        # i.e., non-alphabetic tokens of up to five characters that are not punctuation.
+        for (type, p), emoticons in EMOTICONS.items():
+            for e in emoticons:
+                e = e.lower()
+                if e.isalpha() is False and len(e) <= 5 and e not in PUNCTUATION:
+                    self.emoticons.setdefault(e, p)
         if not os.path.exists(path):
             return
+        # The averaged scores are compiled to a binary file next to the XML file,
+        # for each combination of parser and settings that changes them.
+        key = "%s.%s %s %s %s" % (
+            self.__class__.__module__, self.__class__.__name__, self._parse_version,
+            self._synset, self._confidence)
+        language, words, labels, synsets = CompiledSentiment.open(path, self._parse, key)
+        self._language = language or self._language
+        dict.update(self, words)
+        dict.update(self.labeler, labels)
+        dict.update(self._synsets, synsets)
+
+    def _parse(self, path):
+        """ Returns a (language, words, labels, synsets)-tuple from the XML-file at the given path,
+            with the averaged scores of each word, each word and part-of-speech tag, and each synset.
+        """
+        # <word form="great" wordnet_id="a-01123879" pos="JJ" polarity="1.0" subjectivity="1.0" intensity="1.0" />
+        # <word form="damnmit" polarity="-0.75" subjectivity="1.0" label="profanity" />
         words, synsets, labels = {}, {}, {}
         xml = cElementTree.parse(path)
         xml = xml.getroot()
@@ -761,7 +1340,7 @@ class Sentiment(lazydict):
                     labels[w] = label
                 if synset:
                     synsets.setdefault(synset, []).append(psi)
-        self._language = xml.attrib.get("language", self._language)
+        language = xml.attrib.get("language")
         # Average scores of all word senses per part-of-speech tag.
         for w in words:
             words[w] = dict((pos, [avg(each) for each in zip(*psi)]) for pos, psi in words[w].items())
@@ -771,9 +1350,7 @@ class Sentiment(lazydict):
         # Average scores of all synonyms per synset.
         for id, psi in synsets.items():
             synsets[id] = [avg(each) for each in zip(*psi)]
-        dict.update(self, words)
-        dict.update(self.labeler, labels)
-        dict.update(self._synsets, synsets)
+        return language, words, labels, synsets
 
     def synset(self, id, pos=ADJECTIVE):
         """ Returns a (polarity, subjectivity)-tuple for the given synset id.
@@ -912,11 +1489,8 @@ class Sentiment(lazydict):
                 if w == "(!)":
                     a.append(dict(w=[w], p=0.0, s=1.0, i=1.0, n=1, x=IRONY))
                 # EMOTICONS: {("grin", +1.0): set((":-D", ":D"))}
-                if w.isalpha() is False and len(w) <= 5 and w not in PUNCTUATION: # speedup
-                    for (type, p), e in EMOTICONS.items():
-                        if w in imap(lambda e: e.lower(), e):
-                            a.append(dict(w=[w], p=p, s=1.0, i=1.0, n=1, x=MOOD))
-                            break
+                if w in self.emoticons:
+                    a.append(dict(w=[w], p=self.emoticons[w], s=1.0, i=1.0, n=1, x=MOOD))
         for i in range(len(a)):
             w = a[i]["w"]
             p = a[i]["p"]
@@ -927,6 +1501,121 @@ class Sentiment(lazydict):
             a[i] = (w, p * -0.5 if n < 0 else p, s, x)
         return a
 
+    def score(self, s, negation=True, tags=None):
+        """ Returns a (polarity, subjectivity)-tuple for the given string or list of words,
+            the same as Sentiment(s), but without the list of assessments:
+            the averages are computed with running sums while scanning the words.
+            For a list of words, an optional list of part-of-speech tags can be given,
+            in which case the scores of a word are those of its tag, if the lexicon has them
+            (e.g., "real" => RB intensifies the next word more than "real" => JJ).
+        """
+        if isinstance(s, basestring) and not RE_SYNSET.match(s):
+            return self._score(" ".join(self.tokenizer(s)).lower().split(), negation)
+        if isinstance(s, list):
+            return self._score(s, negation, tags)
+        return tuple(self(s, negation))
+
+    def _score(self, words, negation=True, tags=None):
+        """ Returns the averaged (polarity, subjectivity) of Sentiment.assessments() for the given words,
+            keeping only the scores of the last assessment (p, s, i, n), which the next words can change.
+        """
+        len(self) # Load the lexicon.
+        lookup = dict.get
+        emoticons = self.emoticons
+        negations = self.negations if negation else ()
+        modifiers = self.modifiers
+        P, S, k = 0.0, 0.0, 0 # Sum of polarity and subjectivity of previous assessments.
+        p, s, i, n = None, 0.0, 1.0, 1
+        m = None # Preceding modifier.
+        x = None # Preceding negation.
+        for w, pos in izip(words, tags if tags is not None else repeat(None)):
+            if w is None:
+                continue
+            e = lookup(self, w)
+            if e is not None and None in e:
+                if pos is None or len(e) == 2:
+                    p1, s1, i1 = e[None]
+                else:
+                    p1, s1, i1 = e.get(pos) or e.get(pos[:2]) or e[None]
+                if m is None:
+                    if p is not None:
+                        P += p * -0.5 if n < 0 else p; S += s; k += 1
+                    p, s, i, n = p1, s1, i1, 1
+                else:
+                    p = max(-1.0, min(p1 * i, +1.0))
+                    s = max(-1.0, min(s1 * i, +1.0))
+                    i = i1
+                if x is not None:
+                    i = 1.0 / i
+                    n = -1
+                m = None
+                x = None
+                if any(map(e.__contains__, modifiers)):
+                    m = w
+                if w in negations:
+                    x = w
+            else:
+                if w in negations:
+                    x = w
+                elif x and len(w.strip("'")) > 1:
+                    x = None
+                if x is not None and m is not None and self.modifier(m):
+                    n = -1
+                    x = None
+                elif m and len(w) > 2:
+                    m = None
+                if w == "!" and p is not None:
+                    p = max(-1.0, min(p * 1.25, +1.0))
+                if w == "(!)":
+                    if p is not None:
+                        P += p * -0.5 if n < 0 else p; S += s; k += 1
+                    p, s, i, n = 0.0, 1.0, 1.0, 1
+                if w in emoticons:
+                    if p is not None:
+                        P += p * -0.5 if n < 0 else p; S += s; k += 1
+                    p, s, i, n = emoticons[w], 1.0, 1.0, 1
+        if p is not None:
+            P += p * -0.5 if n < 0 else p; S += s; k += 1
+        return P / float(k or 1), S / float(k or 1)
+
+    def tokenize_many(self, texts, marker="\x00"):
+        """ Returns a list of lowercase words for each of the given strings,
+            the same as Sentiment.tokenizer() splits each string into words.
+            The strings are tokenized at once, separated by a paragraph break and a marker token.
+        """
+        texts = [text_type(s) for s in texts]
+        if not texts:
+            return []
+        if any(marker in s for s in texts):
+            return [" ".join(self.tokenizer(s)).lower().split() for s in texts]
+        words = [[]]
+        for w in " ".join(self.tokenizer((" \n\n%s \n\n " % marker).join(texts))).lower().split():
+            if w == marker:
+                words.append([])
+            else:
+                words[-1].append(w)
+        return words
+
+    def score_many(self, texts, negation=True):
+        """ Returns a list of (polarity, subjectivity)-tuples for the given list of strings,
+            the same as Sentiment(s) returns for each string.
+            With NumPy, the strings are tokenized at once and their assessments are computed
+            with array operations. Strings with emoticons, sarcasm marks (!) or negations
+            that are also known words are assessed one by one.
+        """
+        texts = list(texts)
+        try:
+            import numpy
+        except ImportError:
+            return [self.score(s, negation) for s in texts]
+        # Synset ids are not tokenized (see Sentiment.__call__).
+        synsets = [i for i, s in enumerate(texts) if RE_SYNSET.match(s)]
+        words = self.tokenize_many(texts)
+        scores = _score_words(self, numpy, words, negation)
+        for i in synsets:
+            scores[i] = self.score(texts[i], negation)
+        return scores
+
     def annotate(self, word, pos=None, polarity=0.0, subjectivity=0.0, intensity=1.0, label=None):
         """ Annotates the given word with polarity, subjectivity and intensity scores,
             and optionally a semantic label (e.g., MOOD for emoticons, IRONY for "(!)").
@@ -936,6 +1625,111 @@ class Sentiment(lazydict):
         if label:
             self.labeler[word] = label
 
+
+def _score_words(sentiment, np, words, negation=True):
+    """ Returns a list of (polarity, subjectivity)-tuples for the given lists of lowercase words,
+        the same as Sentiment.assessments() averaged for each list, using NumPy array operations.
+        The assessments are found with the same rules, as a scan over all words of all lists:
+        - each known word starts an assessment, unless it follows a modifier (e.g., "very"),
+          in which case it replaces the scores of the modifier's assessment (scaled by its intensity),
+        - each negation (e.g., "not") negates the next known word and inverts its intensity,
+          or the preceding assessment if it follows an adverb modifier (e.g., "really not"),
+        - each unknown word longer than two characters ends a modifier,
+          and each unknown word longer than one character ends a negation,
+        - each exclamation mark boosts the polarity of the last assessment by 25%.
+    """
+    len(sentiment) # Load the lexicon.
+    vocabulary = {}
+    ids = [vocabulary.setdefault(w, len(vocabulary)) for w in chain(*words)]
+    n, N, V = len(words), len(ids), len(vocabulary)
+    # Properties of each word in the vocabulary.
+    known   = np.zeros(V, dtype=bool)
+    psi     = np.zeros((V, 3))
+    state   = np.zeros(V, dtype=np.int8) # 1 = modifier, 2 = modifier preceding a negation
+    isneg   = np.zeros(V, dtype=bool)
+    long_m  = np.zeros(V, dtype=bool)    # ends a modifier
+    long_n  = np.zeros(V, dtype=bool)    # ends a negation
+    isex    = np.zeros(V, dtype=bool)
+    special = np.zeros(V, dtype=bool)
+    for j, w in enumerate(vocabulary):
+        e = dict.get(sentiment, w)
+        if e is not None and None in e:
+            known[j] = True
+            psi[j] = e[None]
+            if any(map(e.__contains__, sentiment.modifiers)):
+                state[j] = 2 if sentiment.modifier(w) else 1
+        isneg[j]   = negation and w in sentiment.negations
+        long_m[j]  = len(w) > 2
+        long_n[j]  = len(w.strip("'")) > 1
+        isex[j]    = w == "!"
+        special[j] = w in sentiment.emoticons or w == "(!)" or known[j] and isneg[j]
+    lengths = np.array([len(w) for w in words], dtype=np.intp)
+    scores  = np.zeros((n, 2))
+    if N > 0:
+        t     = np.array(ids, dtype=np.intp)
+        doc   = np.repeat(np.arange(n), lengths)
+        first = (np.cumsum(lengths) - lengths)[doc] # Index of the first word of each word's list.
+        end   = np.cumsum(lengths)[doc]             # Index after the last word of each word's list.
+        k     = known[t]
+        u     = ~k
+        neg   = u & isneg[t]
+        index = np.arange(N)
+        def last(event):
+            # Index of the last event before each word in the same list (or -1).
+            e = np.maximum.accumulate(np.where(event, index, -1))
+            e = np.concatenate(([-1], e[:-1]))
+            return np.where(e >= first, e, -1)
+        # Modifier state before each word.
+        # A negation after a modifier adverb ("really not") negates its assessment,
+        # without ending the modifier or starting a negation.
+        value = np.where(k, state[t], 0)
+        event = k | u & ~neg & long_m[t]
+        e = last(event)
+        fire = neg & (np.where(e >= 0, value[e], 0) == 2)
+        e = last(event | neg & long_m[t] & ~fire)
+        m = np.where(e >= 0, value[e], 0) > 0
+        # Negation state before each word.
+        e = last(k | neg | u & long_n[t])
+        negated = np.where(e >= 0, neg[e] & ~fire[e], False)
+        # Assessments: known words that do not follow a modifier start a new assessment.
+        kpos  = np.flatnonzero(k)
+        start = ~m[kpos]
+        group = np.cumsum(start) - 1
+        G     = int(group[-1]) + 1 if len(kpos) else 0
+        p, s, i = psi[t[kpos]].T
+        negated = negated[kpos]
+        with np.errstate(divide="ignore"):
+            i = np.where(negated, 1.0 / i, i)
+        i = np.concatenate(([1.0], i[:-1])) # Intensity of the preceding word in the assessment.
+        p = np.where(start, p, np.clip(p * i, -1.0, +1.0))
+        s = np.where(start, s, np.clip(s * i, -1.0, +1.0))
+        # The scores of an assessment are those of its last word.
+        final = np.ones(len(kpos), dtype=bool)
+        final[:-1] = start[1:]
+        gpos = kpos[final]
+        p, s = p[final], s[final]
+        gneg = np.bincount(group[negated], minlength=G) > 0
+        gneg[group[np.searchsorted(kpos, last(k)[fire])]] = True
+        # Exclamation marks after the last word of an assessment, up to the next known word.
+        ex = np.cumsum(isex[t])
+        e = np.minimum(np.append(kpos, N)[np.flatnonzero(final) + 1], end[gpos])
+        c = ex[e - 1] - ex[gpos]
+        for x in range(int(c.max()) if G else 0):
+            p = np.where(c > x, np.clip(p * 1.25, -1.0, +1.0), p)
+        p = np.where(gneg, p * -0.5, p)
+        # Averages for each list of words.
+        d = doc[gpos]
+        count = np.maximum(np.bincount(d, minlength=n), 1)
+        scores[:, 0] = np.bincount(d, weights=p, minlength=n) / count
+        scores[:, 1] = np.bincount(d, weights=s, minlength=n) / count
+        one_by_one = np.flatnonzero(np.bincount(doc[special[t]], minlength=n))
+    else:
+        one_by_one = []
+    scores = [tuple(x) for x in scores.tolist()]
+    for j in one_by_one:
+        scores[j] = sentiment.score(words[j], negation)
+    return scores
+
 #--- PART-OF-SPEECH TAGGER -------------------------------------------------------------------------
 
 # Unknown words are recognized as numbers if they contain only digits and -,.:/%$
@@ -1056,14 +1850,17 @@ def find_chunks(tagged, language="en"):
     """
     chunked = [x for x in tagged]
     tags = "".join("%s%s" % (tag, SEPARATOR) for token, tag in tagged)
+    # Number of preceding separators = number of preceding tokens,
+    # for each character offset in the tags-string.
+    index = []
+    for k, s in enumerate(tags.split(SEPARATOR)):
+        index.extend([k] * (len(s) + 1))
     # Use Germanic or Romance chunking rules according to given language.
     for tag, rule in CHUNKS[int(language in ("ca", "es", "pt", "fr", "it", "pt", "ro"))]:
         for m in rule.finditer(tags):
             # Find the start of chunks inside the tags-string.
-            # Number of preceding separators = number of preceding tokens.
-            i = m.start()
-            j = tags[:i].count(SEPARATOR)
-            n = m.group(0).count(SEPARATOR)
+            j = index[m.start()]
+            n = index[m.end()] - j
             for k in range(j, j+n):
                 if len(chunked[k]) == 3:
                     continue
@@ -1115,6 +1912,55 @@ def find_prepositions(chunked):
                         pp = False
     return chunked
 
+#--- SEMANTIC ROLE LABELER -------------------------------------------------------------------------
+# Naive approach: a noun phrase before a verb phrase is the subject of the verb,
+# and a noun phrase after a verb phrase is the object of the verb.
+# Each verb phrase with a subject or an object gets a new relation id:
+# I/NP-SBJ-1 ate/VP-1 pizza/NP-OBJ-1 and/O she/NP-SBJ-2 drank/VP-2 beer/NP-OBJ-2
+# A noun phrase can be part of two relations, e.g., NP-OBJ-1*NP-SBJ-2.
+
+def find_relations(chunked):
+    """ The input is a list of [token, tag, chunk, preposition]-items (or [token, tag, chunk]).
+        The output is a list of [token, tag, chunk, preposition, relation]-items.
+        A noun phrase preceding a verb phrase is perceived as sentence subject.
+        Prepositional noun phrases (the cat on the mat) between them are skipped.
+        A noun phrase following a verb phrase is perceived as sentence object.
+        Tokens that are not part of a relation get the O-tag.
+    """
+    # Group successive tokens with the same chunk tag.
+    # Each chunk is a [tag, first token index, last token index + 1, in PNP]-list.
+    chunks = []
+    for i, token in enumerate(chunked):
+        tag = token[2].split("-")[-1] # B-NP => NP
+        if tag == "O" or token[2].startswith("B-") or not chunks or tag != chunks[-1][0]:
+            chunks.append([tag, i, i+1, len(token) > 3 and token[3] != "O"])
+        else:
+            chunks[-1][2] = i+1
+    # Relation tags for each chunk.
+    relations = [[] for ch in chunks]
+    id, subject = 0, None # Index of the last NP before the current chunk (skipping PNPs).
+    for i, (tag, a, b, pnp) in enumerate(chunks):
+        if tag == "VP":
+            object = i+1 < len(chunks) and chunks[i+1][0] == "NP" and i+1 or None
+            if subject is not None or object is not None:
+                id += 1
+                relations[i].append("VP-%s" % id)
+                if subject is not None:
+                    relations[subject].append("NP-SBJ-%s" % id)
+                if object is not None:
+                    relations[object].append("NP-OBJ-%s" % id)
+            subject = None
+        elif tag == "NP" and not pnp:
+            subject = i
+        elif not pnp:
+            subject = None
+    # Append the relation tag to each token.
+    for (tag, a, b, pnp), r in zip(chunks, relations):
+        r = "*".join(r) or "O"
+        for j in range(a, b):
+            chunked[j] = chunked[j] + [r]
+    return chunked
+
 #### PARSER ########################################################################################
 
 #--- PARSER ----------------------------------------------------------------------------------------
@@ -1150,6 +1996,117 @@ def find_prepositions(chunked):
 # http://www.clips.ua.ac.be/pages/penn-treebank-tagset
 PTB = PENN = "penn"
 
+#--- SENTENCE CACHE --------------------------------------------------------------------------------
+# Real-world text repeats a lot (notifications, retweets, signatures, boilerplate).
+# Parser.parse() can look up the annotations of each sentence in a cache,
+# keyed by the sentence tokens and the parse options.
+
+class SentenceCache(object):
+
+    def __init__(self, max_entries=10000, max_bytes=None):
+        """ A thread-safe least recently used cache of parsed sentences,
+            with at most the given number of entries and (approximate) bytes.
+            Parser.parse(cache=SentenceCache()) annotates each sentence only once.
+            The cache must be cleared when the lexicon or rules change.
+        """
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self.bytes       = 0
+        self.hits        = 0
+        self.misses      = 0
+        self.evictions   = 0
+        self._entries    = OrderedDict() # key => (value, size)
+        self._lock       = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """ Returns the cached value for the given key and marks it as recently used.
+        """
+        with self._lock:
+            try:
+                v = self._entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self._entries[key] = v
+            self.hits += 1
+            return v[0]
+
+    def set(self, key, value, size=None):
+        """ Caches the given value, evicting the least recently used entries if needed.
+        """
+        if size is None:
+            size = sizeof(key) + sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while self.max_entries is not None and len(self._entries) > self.max_entries \
+               or self.max_bytes is not None and self.bytes > self.max_bytes:
+                self.bytes -= self._entries.popitem(last=False)[1][1]
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    @property
+    def stats(self):
+        """ Returns a dict with the number of entries, bytes, hits, misses and evictions.
+        """
+        return {
+            "entries": len(self._entries),
+              "bytes": self.bytes,
+               "hits": self.hits,
+             "misses": self.misses,
+          "evictions": self.evictions
+        }
+
+    def __getstate__(self):
+        # Locks can't be pickled.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+def sizeof(v):
+    """ Returns the approximate size in bytes of the given string or nested tuple of strings.
+    """
+    if isinstance(v, (tuple, list)):
+        return sys.getsizeof(v) + sum(sizeof(x) for x in v)
+    return sys.getsizeof(v)
+
+class LexiconCache(dict):
+
+    def __init__(self, lexicon):
+        """ A dictionary of the words looked up in the given lexicon, and their tag (or None).
+            Used by Parser.parse_many() to look up each word once per batch.
+        """
+        self.lexicon = lexicon
+
+    def __missing__(self, word):
+        v = self[word] = self.lexicon.get(word)
+        return v
+
+    def get(self, word, default=None):
+        v = self[word]
+        return default if v is None else v
+
+    def __contains__(self, word):
+        return self[word] is not None
+
 class Parser:
 
     def __init__(self, lexicon={}, default=("NN", "NNP", "CD"), language=None):
@@ -1164,6 +2121,7 @@ class Parser:
         self.lexicon  = lexicon
         self.default  = default
         self.language = language
+        self.cache    = None
 
     def find_tokens(self, string, **kwargs):
         """ Returns a list of sentences from the given string.
@@ -1179,11 +2137,16 @@ class Parser:
     def find_tags(self, tokens, **kwargs):
         """ Annotates the given list of tokens with part-of-speech tags.
             Returns a list of tokens, where each token is now a [word, tag]-list.
+            By default, unknown words are tagged with suffix rules and no contextual rules.
+            The Brill rules of the lexicon can be used with
+            morphology=lexicon.morphology and context=lexicon.context.
         """
         # ["The", "cat", "purs"] => [["The", "DT"], ["cat", "NN"], ["purs", "VB"]]
         return find_tags(tokens,
                    language = kwargs.get("language", self.language),
                     lexicon = kwargs.get( "lexicon", self.lexicon),
+                 morphology = kwargs.get("morphology", None),
+                    context = kwargs.get("context", None),
                     default = kwargs.get( "default", self.default),
                         map = kwargs.get(     "map", None))
 
@@ -1212,16 +2175,23 @@ class Parser:
         """
         return [token + [token[0].lower()] for token in tokens]
 
-    def parse(self, s, tokenize=True, tags=True, chunks=True, relations=False, lemmata=False, encoding="utf-8", **kwargs):
-        """ Takes a string (sentences) and returns a tagged Unicode string (TaggedString).
-            Sentences in the output are separated by newlines.
-            With tokenize=True, punctuation is split from words and sentences are separated by \n.
-            With tags=True, part-of-speech tags are parsed (NN, VB, IN, ...).
-            With chunks=True, phrase chunk tags are parsed (NP, VP, PP, PNP, ...).
-            With relations=True, semantic role labels are parsed (SBJ, OBJ).
-            With lemmata=True, word lemmata are parsed.
-            Optional parameters are passed to
-            the tokenizer, tagger, chunker, labeler and lemmatizer.
+    def _cache(self, tags, chunks, relations, lemmata, kwargs):
+        """ Returns the sentence cache (or None) and the parse options that are part of its keys.
+            Removes the cache from the given dict of optional parameters.
+        """
+        cache = kwargs.pop("cache", self.cache)
+        options = (tags, chunks, relations, lemmata)
+        if cache is not None and kwargs:
+            try:
+                options += tuple(sorted(kwargs.items()))
+                hash(options)
+            except TypeError:
+                # Unhashable options (e.g., a custom lexicon dict) are not cached.
+                cache = None
+        return cache, options
+
+    def _sentences(self, s, tokenize=True, encoding="utf-8", **kwargs):
+        """ Returns the given string as a list of sentences, where each sentence is a list of words.
         """
         # Tokenizer.
         if tokenize:
@@ -1235,6 +2205,20 @@ class Parser:
             for j in range(len(s[i])):
                 if isinstance(s[i][j], binary_type):
                     s[i][j] = decode_string(s[i][j], encoding)
+        return s
+
+    def _annotate(self, s, tags=True, chunks=True, relations=False, lemmata=False, cache=None, options=None, **kwargs):
+        """ Annotates the given list of sentences, where each sentence is a list of words.
+            Each word is replaced by a [word, tag, chunk, ...]-list.
+        """
+        for i in range(len(s)):
+            # Cache.
+            if cache is not None:
+                key = (tuple(s[i]), options)
+                v = cache.get(key)
+                if v is not None:
+                    s[i] = [list(token) for token in v]
+                    continue
             # Tagger (required by chunker, labeler & lemmatizer).
             if tags or chunks or relations or lemmata:
                 s[i] = self.find_tags(s[i], **kwargs)
@@ -1246,9 +2230,49 @@ class Parser:
             # Labeler.
             if relations:
                 s[i] = self.find_labels(s[i], **kwargs)
+                if not chunks:
+                    s[i] = [token[:2] + token[4:] for token in s[i]]
             # Lemmatizer.
             if lemmata:
                 s[i] = self.find_lemmata(s[i], **kwargs)
+            if cache is not None:
+                cache.set(key, tuple(tuple(token) for token in s[i]))
+        return s
+
+    def parse_many(self, documents, tokenize=True, tags=True, chunks=True, relations=False, lemmata=False, encoding="utf-8", **kwargs):
+        """ Takes a list of strings (documents) and returns a list of parsed documents.
+            Each document is a list of sentences, each sentence a list of tokens,
+            and each token a [word, tag, chunk, preposition, relation, lemma]-list
+            (depending on the given parameters, see Parser.parse()).
+            Unlike Parser.parse(), this does not build and split a TaggedString,
+            and the parse options are processed once for the whole batch.
+        """
+        kwargs.pop("collapse", None)
+        kwargs.pop("split", None)
+        cache, options = self._cache(tags, chunks, relations, lemmata, kwargs)
+        # Each distinct word is looked up in the lexicon once per batch.
+        kwargs["lexicon"] = LexiconCache(kwargs.get("lexicon", self.lexicon))
+        sentences, annotate = self._sentences, self._annotate
+        return [annotate(sentences(s, tokenize, encoding, **kwargs),
+                         tags, chunks, relations, lemmata, cache, options, **kwargs)
+                for s in documents]
+
+    def parse(self, s, tokenize=True, tags=True, chunks=True, relations=False, lemmata=False, encoding="utf-8", **kwargs):
+        """ Takes a string (sentences) and returns a tagged Unicode string (TaggedString).
+            Sentences in the output are separated by newlines.
+            With tokenize=True, punctuation is split from words and sentences are separated by \n.
+            With tags=True, part-of-speech tags are parsed (NN, VB, IN, ...).
+            With chunks=True, phrase chunk tags are parsed (NP, VP, PP, PNP, ...).
+            With relations=True, semantic role labels are parsed (SBJ, OBJ).
+            With lemmata=True, word lemmata are parsed.
+            With cache=SentenceCache(), each sentence is looked up in the cache first
+            (by default, Parser.cache is used).
+            Optional parameters are passed to
+            the tokenizer, tagger, chunker, labeler and lemmatizer.
+        """
+        cache, options = self._cache(tags, chunks, relations, lemmata, kwargs)
+        s = self._sentences(s, tokenize, encoding, **kwargs)
+        s = self._annotate(s, tags, chunks, relations, lemmata, cache, options, **kwargs)
         # Slash-formatted tagged string.
         # With collapse=False (or split=True), returns raw list
         # (this output is not usable by tree.Text).
@@ -1257,27 +2281,231 @@ class Parser:
             return s
         # Construct TaggedString.format.
         # (this output is usable by tree.Text).
-        format = ["word"]
+        format = self._format(tags, chunks, relations, lemmata)
+        return collapse(s, format, language=kwargs.get("language", self.language))
+
+    def _format(self, tags=True, chunks=True, relations=False, lemmata=False):
+        """ Returns the list of tags of each parsed token (e.g., ["word", "part-of-speech"]).
+        """
+        format = [WORD]
         if tags:
-            format.append("part-of-speech")
+            format.append(POS)
         if chunks:
-            format.extend(("chunk", "preposition"))
+            format.extend((CHUNK, PNP))
         if relations:
-            format.append("relation")
+            format.append(REL)
         if lemmata:
-            format.append("lemma")
-        # Collapse raw list.
-        # Sentences are separated by newlines, tokens by spaces, tags by slashes.
-        # Slashes in words are encoded with &slash;
-        for i in range(len(s)):
-            for j in range(len(s[i])):
-                s[i][j][0] = s[i][j][0].replace("/", "&slash;")
-                s[i][j] = "/".join(s[i][j])
-            s[i] = " ".join(s[i])
-        s = "\n".join(s)
-        s = TaggedString(unicode(s), format, language=kwargs.get("language", self.language))
-        return s
+            format.append(LEMMA)
+        return format
+
+    def parse_structured(self, s, tokenize=True, tags=True, chunks=True, relations=False, lemmata=False, encoding="utf-8", **kwargs):
+        """ Takes a string (sentences) and returns a ParsedText,
+            a list of sentences where each sentence is a list of Token records,
+            with word, tag, chunk, pnp, relation and lemma fields.
+            The parameters are the same as for Parser.parse().
+            Unlike Parser.parse(), no TaggedString is built (see ParsedText.string).
+        """
+        kwargs.pop("collapse", None)
+        kwargs.pop("split", None)
+        cache, options = self._cache(tags, chunks, relations, lemmata, kwargs)
+        s = self._sentences(s, tokenize, encoding, **kwargs)
+        s = self._annotate(s, tags, chunks, relations, lemmata, cache, options, **kwargs)
+        format = self._format(tags, chunks, relations, lemmata)
+        return ParsedText(s, format, language=kwargs.get("language", self.language))
+
+def collapse(sentences, format=[WORD], language=None):
+    """ Returns a TaggedString for the given list of sentences,
+        where each sentence is a list of tokens, and each token a list of word + tags.
+    """
+    # Collapse raw list.
+    # Sentences are separated by newlines, tokens by spaces, tags by slashes.
+    # Slashes in words are encoded with &slash;
+    s = "\n".join(" ".join("/".join(
+        (token[0].replace("/", "&slash;"),) + tuple(token[1:])) for token in sentence)
+            for sentence in sentences)
+    return TaggedString(unicode(s), format, language=language)
+
+#--- PARSED TEXT -----------------------------------------------------------------------------------
+
+try:
+    intern = sys.intern
+except AttributeError:
+    # Python 2 only interns byte strings.
+    intern = lambda s: s
+
+# Parser.parse_structured() returns a ParsedText: a list of ParsedSentence objects.
+# This avoids joining the parsed tokens into a TaggedString and splitting it again.
+# Each ParsedSentence stores its tokens in columns: a list of words, and arrays of small integers
+# for the part-of-speech tags, chunk tags and preposition tags, which index into a TagTable.
+# This takes a fraction of the memory of a list of [word, tag, chunk, pnp]-lists per token.
+# Iterating over a ParsedSentence yields Token records.
+# A ParsedText can also be passed to Sentiment, which then uses the part-of-speech tags.
+
+FIELDS = {WORD: "word", POS: "tag", CHUNK: "chunk", PNP: "pnp", REL: "relation", LEMMA: "lemma"}
+
+class TagTable(object):
+
+    def __init__(self, tags=()):
+        """ A table of interned tags, where each tag has a small integer id.
+            Unknown tags are added to the table when their id is requested.
+        """
+        self.tags  = []
+        self.ids   = {}
+        self._lock = threading.Lock()
+        for tag in tags:
+            self.id(tag)
+
+    def id(self, tag):
+        """ Returns the id of the given tag.
+        """
+        try:
+            return self.ids[tag]
+        except KeyError:
+            with self._lock:
+                if tag not in self.ids:
+                    self.ids[tag] = len(self.tags)
+                    self.tags.append(tag)
+            return self.ids[tag]
+
+    def __getitem__(self, i):
+        return self.tags[i]
+
+    def __len__(self):
+        return len(self.tags)
+
+# Penn Treebank II and universal part-of-speech tags.
+POS_TAGS = TagTable((
+    "CC", "CD", "DT", "EX", "FW", "IN", "JJ", "JJR", "JJS", "LS", "MD", "NN", "NNS", "NNP",
+    "NNPS", "PDT", "POS", "PRP", "PRP$", "RB", "RBR", "RBS", "RP", "SYM", "TO", "UH", "VB",
+    "VBD", "VBG", "VBN", "VBP", "VBZ", "WDT", "WP", "WP$", "WRB", ".", ",", ":", "(", ")",
+    "\"", "#", "$", "''", "``",
+    NOUN, VERB, ADJ, ADV, PRON, DET, PREP, ADP, NUM, CONJ, INTJ, PRT, PUNC, X
+))
 
+CHUNK_TAGS = TagTable(["O"] + ["%s-%s" % (x, ch)
+    for ch in ("NP", "VP", "PP", "ADJP", "ADVP") for x in ("B", "I")])
+
+PNP_TAGS = TagTable(("O", "B-PNP", "I-PNP"))
+
+class Token(namedtuple("Token", ("word", "tag", "chunk", "pnp", "relation", "lemma"))):
+    """ A parsed word with its part-of-speech tag, chunk tag, preposition tag,
+        relation tag and lemma (None if not parsed).
+    """
+    __slots__ = ()
+
+    @property
+    def string(self):
+        return self.word
+
+    @property
+    def pos(self):
+        return self.tag
+
+# Token field => ParsedSentence attribute.
+COLUMNS = dict(zip(Token._fields, ("words", "tags", "chunks", "pnp", "relations", "lemmata")))
+
+class ParsedSentence(object):
+
+    __slots__ = ("words", "_tags", "_chunks", "_pnp", "relations", "lemmata")
+
+    def __init__(self, tokens=[], format=[WORD]):
+        """ A parsed sentence, stored as a list of words and parallel arrays of tag ids
+            (part-of-speech, chunk and preposition tags), and lists of relations and lemmata.
+            The given tokens are lists of word + tags in the given format,
+            for example from find_tags() with format=["word", "part-of-speech"].
+        """
+        columns = dict((FIELDS[tag], [token[j] for token in tokens]) for j, tag in enumerate(format))
+        def ids(table, field):
+            return array("H", imap(table.id, columns[field])) if field in columns else None
+        self.words     = [intern(w) for w in columns["word"]]
+        self._tags     = ids(POS_TAGS, "tag")
+        self._chunks   = ids(CHUNK_TAGS, "chunk")
+        self._pnp      = ids(PNP_TAGS, "pnp")
+        self.relations = columns.get("relation")
+        self.lemmata   = columns.get("lemma")
+
+    @property
+    def tags(self):
+        return [POS_TAGS.tags[i] for i in self._tags] if self._tags is not None else None
+
+    @property
+    def chunks(self):
+        return [CHUNK_TAGS.tags[i] for i in self._chunks] if self._chunks is not None else None
+
+    @property
+    def pnp(self):
+        return [PNP_TAGS.tags[i] for i in self._pnp] if self._pnp is not None else None
+
+    def columns(self, fields=Token._fields):
+        """ Returns a list of columns (lists) for the given Token fields (None if not parsed).
+        """
+        return [getattr(self, COLUMNS[f]) for f in fields]
+
+    def __len__(self):
+        return len(self.words)
+
+    def __iter__(self):
+        n = [None] * len(self.words)
+        return imap(Token._make, zip(*[c if c is not None else n for c in self.columns()]))
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return list(self)[i]
+        return Token(*[c[i] if c is not None else None for c in self.columns()])
+
+    def __eq__(self, other):
+        if not isinstance(other, (ParsedSentence, list)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def __repr__(self):
+        return "ParsedSentence(%s)" % repr(list(self))
+
+    def __getstate__(self):
+        # Tag ids depend on the order in which tags were added to the table.
+        return (self.words, self.tags, self.chunks, self.pnp, self.relations, self.lemmata)
+
+    def __setstate__(self, state):
+        self.words, tags, chunks, pnp, self.relations, self.lemmata = state
+        self._tags   = array("H", imap(POS_TAGS.id, tags)) if tags is not None else None
+        self._chunks = array("H", imap(CHUNK_TAGS.id, chunks)) if chunks is not None else None
+        self._pnp    = array("H", imap(PNP_TAGS.id, pnp)) if pnp is not None else None
+
+class ParsedText(list):
+
+    def __init__(self, sentences=[], format=[WORD], language=None):
+        """ A list of ParsedSentence objects.
+            The given sentences are lists of tokens, where each token is a list of word + tags
+            in the given format (e.g., ["word", "part-of-speech", "chunk", "preposition"]).
+        """
+        list.__init__(self, (ParsedSentence(s, format) for s in sentences))
+        self.format   = list(format)
+        self.language = language
+
+    @property
+    def sentences(self):
+        return self
+
+    @property
+    def words(self):
+        return [token for sentence in self for token in sentence]
+
+    def split(self):
+        """ Returns a list of sentences, where each sentence is a list of tokens,
+            where each token is a list of word + tags (see TaggedString.split()).
+        """
+        fields = [FIELDS[tag] for tag in self.format]
+        return [[list(token) for token in zip(*sentence.columns(fields))] for sentence in self]
+
+    @property
+    def string(self):
+        """ Returns the parsed sentences as a TaggedString (see Parser.parse()).
+        """
+        return collapse(self.split(), self.format, self.language)
 
 #--- TAGGED STRING ---------------------------------------------------------------------------------
 # Pattern.parse() returns a TaggedString: a Unicode string with "tags" and "language" attributes.
@@ -1319,17 +2547,198 @@ class TaggedString(unicode):
 #### SPELLING CORRECTION ###########################################################################
 # Based on: Peter Norvig, "How to Write a Spelling Corrector", http://norvig.com/spell-correct.html
 
+#--- SPELLING DELETION INDEX -----------------------------------------------------------------------
+# Known words with edit distance 2 are found by generating the words with edit distance 1
+# of each word with edit distance 1, i.e., tens of thousands of strings for a 10-letter word.
+# SpellingIndex precomputes symmetric deletes instead (see Wolf Garbe's SymSpell):
+# each known word is stored under the strings that remain after deleting up to two characters
+# from its first seven characters. Two words with edit distance 2 or less share such a string,
+# so the candidates of a word are found by looking up its own deletes (at most 29 lookups),
+# and then checked with the Damerau-Levenshtein distance.
+# The index is stored in a binary file that is memory-mapped. The file is a header, followed by:
+# - the start offset of each word in the string table (n+1 unsigned ints),
+# - the start offset of each bucket in the word ids (m+1 unsigned ints),
+# - the ids of the words in each bucket, by CRC-32 of their deletes (k unsigned ints),
+# - the string table of UTF-8 encoded words.
+# Different deletes can share a bucket, which only adds candidates that are then discarded.
+
+def edit_distance(a, b, k=2):
+    """ Returns the Damerau-Levenshtein distance between the given strings (the smallest number
+        of deleted, inserted, replaced or swapped adjacent characters), or k+1 if it is more than k.
+    """
+    n1, n2 = len(a), len(b)
+    if abs(n1 - n2) > k:
+        return k + 1
+    # Lowrance-Wagner algorithm, with a border row and column of "infinity".
+    x = n1 + n2
+    d = [[x] * (n2 + 2) for i in range(n1 + 2)]
+    for i in range(n1 + 1):
+        d[i+1][1] = i
+    for j in range(n2 + 1):
+        d[1][j+1] = j
+    last = {} # Last row in which each character of a occurs.
+    for i in range(1, n1 + 1):
+        ch = a[i-1]
+        j0 = 0  # Last column in this row in which b has the same character as a.
+        for j in range(1, n2 + 1):
+            i0 = last.get(b[j-1], 0)
+            j1 = j0
+            if ch == b[j-1]:
+                cost = 0
+                j0 = j
+            else:
+                cost = 1
+            d[i+1][j+1] = min(
+                d[i][j] + cost,
+                d[i+1][j] + 1,
+                d[i][j+1] + 1,
+                d[i0][j1] + (i - i0 - 1) + 1 + (j - j1 - 1))
+        last[ch] = i
+    return min(d[n1+1][n2+1], k + 1)
+
+class SpellingIndex(object):
+
+    MAGIC    = b"TBSI"
+    VERSION  = 1
+    HEADER   = struct.Struct(str("<4sIQQIII")) # magic, version, source size, source mtime, n, buckets, ids
+    PREFIX   = 7
+    DISTANCE = 2
+
+    _uint2 = struct.Struct(str("<II"))
+
+    def __init__(self, path):
+        """ A read-only index of known words by symmetric deletes, memory-mapped from the given binary file.
+        """
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size, mtime, n, m, k = self.HEADER.unpack_from(self._map, 0)
+        if magic != self.MAGIC or version != self.VERSION:
+            raise ValueError("%s is not a spelling index" % path)
+        self.source   = (size, mtime)
+        self._offsets = self.HEADER.size
+        self._buckets = self._offsets + 4 * (n + 1)
+        self._ids     = self._buckets + 4 * (m + 1)
+        self._words   = self._ids + 4 * k
+        self._mask    = m - 1
+        self._n       = n
+
+    stat = CompactLexicon.stat
+
+    @classmethod
+    def deletes(cls, w):
+        """ Returns the set of strings that remain after deleting up to two characters
+            from the first seven characters of the given word.
+        """
+        w = w[:cls.PREFIX]
+        a = b = set((w,))
+        for _ in range(cls.DISTANCE):
+            b = set(x[:i] + x[i+1:] for x in b for i in range(len(x)))
+            a |= b
+        return a
+
+    @classmethod
+    def _bucket(cls, w, mask):
+        return (zlib.crc32(w.encode("utf-8")) & 0xffffffff) & mask
+
+    @classmethod
+    def compile(cls, words, path, source=(0, 0)):
+        """ Writes the index of the given list of lowercase words (a-z) to the binary file at the given path.
+            The file is written to a temporary file first and then renamed,
+            so that other processes never see a partially written file.
+        """
+        words = sorted(words)
+        for w in words:
+            if not w or w.strip(Spelling.ALPHA):
+                # Words with other characters are not indexed, since the edits of Spelling._edit1()
+                # only insert or replace a-z.
+                raise ValueError("can't index %s" % repr(w))
+        m = 1
+        while m < len(words) * 16:
+            m *= 2
+        buckets = [set() for _ in range(m)]
+        for j, w in enumerate(words):
+            for x in cls.deletes(w):
+                buckets[cls._bucket(x, m - 1)].add(j)
+        ids = [j for bucket in buckets for j in sorted(bucket)]
+        starts = [0]
+        for bucket in buckets:
+            starts.append(starts[-1] + len(bucket))
+        words = [w.encode("utf-8") for w in words]
+        offsets = [0]
+        for w in words:
+            offsets.append(offsets[-1] + len(w))
+        f, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(f, "wb") as f:
+                f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, source[0], source[1], len(words), m, len(ids)))
+                f.write(struct.pack(str("<%dI" % len(offsets)), *offsets))
+                f.write(struct.pack(str("<%dI" % len(starts)), *starts))
+                f.write(struct.pack(str("<%dI" % len(ids)), *ids))
+                f.write(b"".join(words))
+            os.chmod(tmp, 0o644)
+            if os.name == "nt" and os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp, path)
+        except:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+    @classmethod
+    def open(cls, source, path=None):
+        """ Returns a SpellingIndex for the given word list text file (see Spelling.load()),
+            compiling it first if it is missing or older than the text file.
+            By default, the binary file is stored next to the text file (e.g., en-spelling.bin).
+            Returns None if the binary file can't be read or written, or if the words can't be indexed.
+        """
+        path = path or os.path.splitext(source)[0] + ".bin"
+        try:
+            stat = cls.stat(source)
+            if os.path.exists(path):
+                index = cls(path)
+                if index.source == stat:
+                    return index
+                index.close()
+            cls.compile([x.split()[0] for x in _read(source)], path, source=stat)
+            return cls(path)
+        except (IOError, OSError, ValueError, struct.error):
+            return None
+
+    def _word(self, j):
+        a, b = self._uint2.unpack_from(self._map, self._offsets + 4 * j)
+        return self._map[self._words+a:self._words+b].decode("utf-8")
+
+    def candidates(self, w):
+        """ Returns the set of indexed words that share a bucket with a delete of the given word.
+            This includes all indexed words with edit distance 2 or less.
+        """
+        m, mask = self._map, self._mask
+        ids = set()
+        for x in self.deletes(w):
+            a, b = self._uint2.unpack_from(m, self._buckets + 4 * self._bucket(x, mask))
+            if a < b:
+                ids.update(struct.unpack_from(str("<%dI" % (b - a)), m, self._ids + 4 * a))
+        return set(self._word(j) for j in ids)
+
+    def __len__(self):
+        return self._n
+
+    def close(self):
+        self._map.close()
+
 class Spelling(lazydict):
 
     ALPHA = "abcdefghijklmnopqrstuvwxyz"
 
     def __init__(self, path=""):
         self._path = path
+        self._index = None
 
     def load(self):
         for x in _read(self._path):
             x = x.split()
             dict.__setitem__(self, x[0], int(x[1]))
+        self._index = None
 
     @property
     def path(self):
@@ -1372,8 +2781,23 @@ class Spelling(lazydict):
         """
         # Of all spelling errors, 99% is covered by edit distance 2.
         # Only keep candidates that are actually known words (20% speedup).
+        index = self.index
+        if index is not None:
+            return set(c for c in index.candidates(w) if c in self and edit_distance(w, c) <= 2)
         return set(e2 for e1 in self._edit1(w) for e2 in self._edit1(e1) if e2 in self)
 
+    @property
+    def index(self):
+        """ Returns the SpellingIndex of the known words, compiled next to the word list file,
+            or None if it can't be compiled or if known words were added after loading.
+        """
+        n = len(self)
+        if self._index is None:
+            self._index = SpellingIndex.open(self._path) or False
+        if self._index is False or len(self._index) != n:
+            return None
+        return self._index
+
     def _known(self, words=[]):
         """ Returns the given list of words filtered by known words.
         """
@@ -26,6 +26,15 @@ class BaseTagger(with_metaclass(ABCMeta)):
         """
         return
 
+    def tag_sents(self, texts, tokenize=True):
+        """Return a list of lists of (word, tag) tuples, one for each text in
+        ``texts``. Override this to tag a batch of texts more efficiently than
+        calling ``tag()`` for each text.
+
+        .. versionadded:: 0.9.2
+        """
+        return [self.tag(text, tokenize) for text in texts]
+
 ##### NOUN PHRASE EXTRACTORS #####
 
 class BaseNPExtractor(with_metaclass(ABCMeta)):
@@ -39,6 +48,15 @@ class BaseNPExtractor(with_metaclass(ABCMeta)):
         """Return a list of noun phrases (strings) for a body of text."""
         return
 
+    def extract_blob(self, blob):
+        """Return a list of noun phrases (strings) for a blob. Override this to
+        reuse the blob's annotations (tokens, sentences, tags), which are only
+        computed once per blob. Defaults to ``extract(blob.raw)``.
+
+        .. versionadded:: 0.9.2
+        """
+        return self.extract(blob.raw)
+
 ##### TOKENIZERS #####
 
 class BaseTokenizer(with_metaclass(ABCMeta), nltk.tokenize.api.TokenizerI):
@@ -94,6 +112,15 @@ class BaseSentimentAnalyzer(with_metaclass(ABCMeta)):
         # Analyze text
         return None
 
+    def analyze_blob(self, blob):
+        """Return the result of analysis for a blob. Override this to reuse
+        the blob's annotations (tokens, sentences, tags), which are only
+        computed once per blob. Defaults to ``analyze(blob.raw)``.
+
+        .. versionadded:: 0.9.2
+        """
+        return self.analyze(blob.raw)
+
 ##### PARSERS #####
 
 class BaseParser(with_metaclass(ABCMeta)):
@@ -23,7 +23,10 @@ Example usage: ::
 from __future__ import unicode_literals, absolute_import
 import sys
 import json
-from collections import defaultdict
+import multiprocessing
+import threading
+from collections import defaultdict, deque, namedtuple
+from itertools import islice
 
 import nltk
 
@@ -32,15 +35,18 @@ from textblob.utils import lowerstrip, PUNCTUATION_REGEX
 from textblob.inflect import singularize as _singularize, pluralize as _pluralize
 from textblob.mixins import BlobComparableMixin, StringlikeMixin
 from textblob.compat import unicode, basestring
+from textblob.exceptions import TextBlobError
 from textblob.base import (BaseNPExtractor, BaseTagger, BaseTokenizer,
-                       BaseSentimentAnalyzer, BaseParser)
+                       BaseSentimentAnalyzer, BaseParser, CONTINUOUS)
 from textblob.np_extractors import FastNPExtractor
 from textblob.taggers import PatternTagger
-from textblob.tokenizers import WordTokenizer, sent_tokenize, word_tokenize
+from textblob.tokenizers import WordTokenizer, sent_span_tokenize, word_tokenize
 from textblob.sentiments import PatternAnalyzer
 from textblob.parsers import PatternParser
 from textblob.translate import Translator
-from textblob.en import suggest
+from textblob.en import suggest, spelling
+
+_pattern_analyzer = PatternAnalyzer()
 
 # Wordnet interface
 # NOTE: textblob.wordnet is not imported so that the wordnet corpus can be lazy-loaded
@@ -394,6 +400,8 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
         """Classify the blob using the blob's ``classifier``."""
         if self.classifier is None:
             raise NameError("This blob has no classifier. Train one first!")
+        if hasattr(self.classifier, 'classify_blob'):
+            return self.classifier.classify_blob(self)
         return self.classifier.classify(self.raw)
 
     @cached_property
@@ -405,32 +413,55 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
 
         :rtype: namedtuple of the form ``Sentiment(polarity, subjectivity)``
         """
-        return self.analyzer.analyze(self.raw)
+        return self.analyzer.analyze_blob(self)
 
     @cached_property
+    def _scores(self):
+        """The (polarity, subjectivity) scores of the blob. These are shared
+        with :attr:`sentiment` if the blob's analyzer is continuous. Otherwise
+        they are computed once with the default :class:`PatternAnalyzer`.
+        """
+        if self.analyzer.kind == CONTINUOUS:
+            return self.sentiment
+        return _pattern_analyzer.analyze_blob(self)
+
+    @property
     def polarity(self):
         """Return the polarity score as a float within the range [-1.0, 1.0]
 
         :rtype: float
         """
-        return PatternAnalyzer().analyze(self.raw)[0]
+        return self._scores[0]
 
-    @cached_property
+    @property
     def subjectivity(self):
         """Return the subjectivity score as a float within the range [0.0, 1.0]
         where 0.0 is very objective and 1.0 is very subjective.
 
         :rtype: float
         """
-        return PatternAnalyzer().analyze(self.raw)[1]
+        return self._scores[1]
 
     @cached_property
     def noun_phrases(self):
         """Returns a list of noun phrases for this blob."""
         return WordList([phrase.strip().lower()
-                        for phrase in self.np_extractor.extract(self.raw)
+                        for phrase in self.np_extractor.extract_blob(self)
                         if len(phrase) > 1])
 
+    @cached_property
+    def tagged_tokens(self):
+        """Returns a list of tuples of the form (token, POS tag), including
+        punctuation, as returned by this blob's POS tagger. The tags are
+        computed once and shared by ``pos_tags``, noun phrase extractors
+        and sentiment analyzers.
+
+        .. versionadded:: 0.9.2
+
+        :rtype: list of tuples
+        """
+        return list(self.pos_tagger.tag(self.raw))
+
     @cached_property
     def pos_tags(self):
         """Returns an list of tuples of the form (word, POS tag).
@@ -444,7 +475,7 @@ class BaseBlob(StringlikeMixin, BlobComparableMixin):
         :rtype: list of tuples
         """
         return [(Word(word, pos_tag=t), unicode(t))
-                for word, t in self.pos_tagger.tag(self.raw)
+                for word, t in self.tagged_tokens
                 if not PUNCTUATION_REGEX.match(unicode(t))]
 
     tags = pos_tags
@@ -642,19 +673,16 @@ class TextBlob(BaseBlob):
         '''Returns a list of Sentence objects from the raw text.
         '''
         sentence_objects = []
-        sentences = sent_tokenize(self.raw)
-        char_index = 0  # Keeps track of character index within the blob
-        for sent in sentences:
-            # Compute the start and end indices of the sentence
-            # within the blob
-            start_index = self.raw.index(sent, char_index)
-            char_index += len(sent)
-            end_index = start_index + len(sent)
+        # The start and end indices of each sentence within the blob
+        # come straight from the sentence tokenizer
+        for start_index, end_index in sent_span_tokenize(self.raw):
             # Sentences share the same models as their parent blob
-            s = Sentence(sent, start_index=start_index, end_index=end_index,
+            s = Sentence(self.raw[start_index:end_index],
+                start_index=start_index, end_index=end_index,
                 tokenizer=self.tokenizer, np_extractor=self.np_extractor,
                 pos_tagger=self.pos_tagger, analyzer=self.analyzer,
                 parser=self.parser, classifier=self.classifier)
+            s._blob = self
             sentence_objects.append(s)
         return sentence_objects
 
@@ -670,6 +698,9 @@ class Sentence(BaseBlob):
                         length of the sentence - 1.
     """
 
+    # The TextBlob that this sentence was created by, whose tokens and tags it shares
+    _blob = None
+
     def __init__(self, sentence, start_index=0, end_index=None, *args, **kwargs):
         super(Sentence, self).__init__(sentence, *args, **kwargs)
         #: The start index within a TextBlob
@@ -677,6 +708,33 @@ class Sentence(BaseBlob):
         #: The end index within a textBlob
         self.end = self.end_index = end_index or len(sentence) - 1
 
+    @cached_property
+    def tokens(self):
+        """Return a list of tokens, using this blob's tokenizer object.
+        The tokens of a sentence of a :class:`TextBlob` are split from the
+        tokens of the whole text, unless a token crosses a sentence boundary.
+        """
+        tokens = _blob_annotation(self, 'tokens')
+        if tokens is None:
+            tokens = WordList(self.tokenizer.tokenize(self.raw))
+        return tokens
+
+    @cached_property
+    def tagged_tokens(self):
+        """Returns a list of tuples of the form (token, POS tag), including
+        punctuation. The tags of a sentence of a :class:`TextBlob` are split
+        from the tags of the whole text, unless a token crosses a sentence
+        boundary.
+
+        .. versionadded:: 0.9.2
+
+        :rtype: list of tuples
+        """
+        tagged = _blob_annotation(self, 'tagged_tokens')
+        if tagged is None:
+            tagged = list(self.pos_tagger.tag(self.raw))
+        return tagged
+
     @property
     def dict(self):
         '''The dict representation of this sentence.'''
@@ -717,8 +775,12 @@ class Blobber(object):
     :param parser: A parser. If ``None``, defaults to
         :class:`PatternParser <textblob.en.parsers.PatternParser>`.
     :param classifier: A classifier.
+    :param bool warmup: If ``True``, load and train the models before
+        returning (see :meth:`warmup`).
 
     .. versionadded:: 0.4.0
+    .. versionchanged:: 0.9.2
+        Added the ``warmup`` parameter.
     """
 
     np_extractor = FastNPExtractor()
@@ -728,9 +790,11 @@ class Blobber(object):
     parser = PatternParser()
 
     def __init__(self, tokenizer=None, pos_tagger=None, np_extractor=None,
-                analyzer=None, parser=None, classifier=None):
+                analyzer=None, parser=None, classifier=None, warmup=False):
         _initialize_models(self, tokenizer, pos_tagger, np_extractor, analyzer,
                             parser, classifier)
+        if warmup:
+            self.warmup()
 
     def __call__(self, text):
         """Return a new TextBlob object with this Blobber's ``np_extractor``,
@@ -743,6 +807,120 @@ class Blobber(object):
                         parser=self.parser,
                         classifier=self.classifier)
 
+    def pipe(self, texts, n_workers=None, batch_size=100,
+             fields=("tags", "noun_phrases", "sentiment"), preserve_order=True):
+        """Analyze many texts in a pool of worker processes that share this
+        Blobber's models. Generates one compact record per text instead of
+        a TextBlob: a namedtuple with the text's ``index`` in ``texts`` and
+        one item per field, converted to plain lists, tuples and strings.
+
+        Usage:
+
+            >>> tb = Blobber()
+            >>> for record in tb.pipe(texts, n_workers=4, fields=("tags", "sentiment")):  # doctest: +SKIP
+            ...     print(record.index, record.sentiment.polarity)
+
+        :param texts: An iterable of strings.
+        :param int n_workers: Number of worker processes. If ``None``, defaults to
+            the number of CPUs. With ``1``, texts are analyzed in this process.
+        :param int batch_size: Number of texts sent to a worker at a time.
+        :param fields: Names of the TextBlob properties to compute, e.g.
+            ``"tags"``, ``"noun_phrases"``, ``"sentiment"``, ``"words"``.
+        :param bool preserve_order: Generate records in the order of ``texts``.
+            If ``False``, records are generated as soon as their batch is done.
+        :raises ValueError: If a field name is not a property of a TextBlob.
+
+        .. versionadded:: 0.9.2
+        """
+        fields = tuple(fields)
+        known = _blob_fields()
+        for name in fields:
+            if name not in known:
+                raise ValueError("Unknown field {0!r}. Must be one of {1}."
+                                 .format(name, ", ".join(known)))
+        return self._pipe(texts, n_workers, batch_size, fields, preserve_order)
+
+    def _pipe(self, texts, n_workers, batch_size, fields, preserve_order):
+        record = namedtuple('BlobRecord', ('index',) + fields)
+        return_type = getattr(self.analyzer, 'RETURN_TYPE', None)
+        # Load and train the models once, before the workers start
+        _analyze_batch(self, [(0, "Warm up.")], fields)
+        batches = _batches(enumerate(texts), batch_size)
+        if n_workers is None:
+            n_workers = multiprocessing.cpu_count()
+        if n_workers <= 1:
+            results = (_analyze_batch(self, batch, fields) for batch in batches)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(n_workers, initializer=_init_worker,
+                                        initargs=(self, fields))
+            results = _imap_bounded(pool, batches, 2 * n_workers, preserve_order)
+        try:
+            for batch in results:
+                for values in batch:
+                    values = dict(zip(('index',) + fields, values))
+                    if return_type is not None and "sentiment" in values:
+                        values["sentiment"] = return_type(*values["sentiment"])
+                    yield record(**values)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+
+    def warmup(self, components=None, background=False):
+        """Load and train this Blobber's models now instead of on first use,
+        e.g., the pattern lexicons, the Brown corpus tagger of the
+        :class:`FastNPExtractor <textblob.en.np_extractors.FastNPExtractor>`
+        or the movie review classifier of the
+        :class:`NaiveBayesAnalyzer <textblob.en.sentiments.NaiveBayesAnalyzer>`.
+        Each model is warmed up by analyzing a short text.
+
+        Usage:
+
+            >>> tb = Blobber(np_extractor=ConllExtractor())
+            >>> ready = tb.warmup(background=True)
+            >>> ready.result(timeout=60)
+            ('tokenizer', 'pos_tagger', 'np_extractor', 'analyzer', 'parser', 'spelling')
+
+        :param components: Names of the models to warm up (see
+            ``WARMUP_COMPONENTS``). If ``None``, warms up all of them. The
+            ``classifier`` is skipped if the Blobber has none.
+        :param bool background: Warm up in a daemon thread and return
+            immediately.
+        :returns: A :class:`WarmupFuture` that is done when the models are
+            loaded. Its result is the tuple of warmed up components.
+        :raises ValueError: If a component name is unknown.
+
+        .. versionadded:: 0.9.2
+        """
+        if components is None:
+            components = [name for name in WARMUP_COMPONENTS
+                          if name != "classifier" or self.classifier is not None]
+        components = tuple(components)
+        for name in components:
+            if name not in WARMUP_COMPONENTS:
+                raise ValueError("Unknown component {0!r}. Must be one of {1}."
+                                 .format(name, ", ".join(WARMUP_COMPONENTS)))
+        future = WarmupFuture()
+
+        def run():
+            try:
+                for name in components:
+                    _warmup_component(self, name)
+            except BaseException as error:
+                future._set(exception=error)
+            else:
+                future._set(result=components)
+
+        if background:
+            thread = threading.Thread(target=run, name="textblob-warmup")
+            thread.daemon = True
+            thread.start()
+        else:
+            run()
+            future.result()
+        return future
+
     def __repr__(self):
         classifier_name = self.classifier.__class__.__name__ + "()" if self.classifier else "None"
         return ("Blobber(tokenizer={0}(), pos_tagger={1}(), "
@@ -755,3 +933,243 @@ class Blobber(object):
                             classifier_name)
 
     __str__ = __repr__
+
+
+def _batches(iterable, size):
+    """Generate lists of at most ``size`` items from ``iterable``."""
+    iterable = iter(iterable)
+    batch = list(islice(iterable, size))
+    while batch:
+        yield batch
+        batch = list(islice(iterable, size))
+
+
+def _plain(value):
+    """Convert a property value of a blob to plain, picklable types."""
+    if isinstance(value, BaseBlob):
+        return unicode(value.raw)
+    if isinstance(value, basestring):
+        return unicode(value)
+    if isinstance(value, dict):
+        return dict((_plain(k), _plain(v)) for k, v in value.items())
+    if isinstance(value, tuple):
+        return tuple(_plain(v) for v in value)
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    return value
+
+
+# Tokens that tokenizers write differently from the text they come from
+_TOKEN_FORMS = {"``": ('"', "``"), "''": ('"', "''")}
+
+def _token_spans(text, tokens):
+    """Return the ``(start, end)`` offsets of each token in ``text``, or
+    ``None`` if the tokens can't be aligned with the text, i.e., if anything
+    but whitespace separates two tokens.
+    """
+    spans = []
+    i = 0
+    for token in tokens:
+        for form in _TOKEN_FORMS.get(token, (token,)):
+            j = text.find(form, i)
+            if j >= 0 and not text[i:j].strip():
+                break
+        else:
+            return None
+        i = j + len(form)
+        spans.append((j, i))
+    return spans
+
+def _sentence_slices(spans, sentences):
+    """Return the ``(i, j)`` slice of ``spans`` that falls within each
+    sentence, or ``None`` if a span crosses a sentence boundary.
+    """
+    slices = []
+    k = 0
+    for sentence in sentences:
+        i = k
+        while k < len(spans) and spans[k][0] < sentence.end_index:
+            if spans[k][0] < sentence.start_index or spans[k][1] > sentence.end_index:
+                return None
+            k += 1
+        slices.append((i, k))
+    return slices if k == len(spans) else None
+
+# The token of each value of the annotations that sentences share with their blob
+_ANNOTATION_TOKENS = {'tokens': unicode, 'tagged_tokens': lambda tag: tag[0]}
+
+def _blob_annotation(sentence, name):
+    """Return the tokens or tagged tokens (``name``) of a sentence, split by
+    offset from those of the whole text of the blob it was created by. These
+    are computed once for the blob, so the result does not depend on whether
+    the blob or its sentences were analyzed first. Returns ``None`` if the
+    sentence has no blob, or a token of the blob can't be aligned with the
+    text or crosses a sentence boundary.
+    """
+    blob = sentence._blob
+    if blob is None:
+        return None
+    split = blob.__dict__.setdefault('_split_annotations', set())
+    if name not in split:
+        split.add(name)
+        values = getattr(blob, name)
+        spans = _token_spans(blob.raw, [_ANNOTATION_TOKENS[name](v) for v in values])
+        slices = spans is not None and _sentence_slices(spans, blob.sentences)
+        if slices:
+            for s, (i, j) in zip(blob.sentences, slices):
+                s.__dict__.setdefault(name, values[i:j])
+    return sentence.__dict__.get(name)
+
+
+# Fields of Blobber.pipe() that are computed from a blob's tagged_tokens
+_TAG_FIELDS = frozenset(("tags", "pos_tags", "tagged_tokens"))
+
+def _blob_fields():
+    """Return the names of the properties of a TextBlob, which
+    :meth:`Blobber.pipe` can compute.
+    """
+    return tuple(name for name in sorted(dir(TextBlob)) if not name.startswith("_")
+                 and isinstance(getattr(TextBlob, name), (property, cached_property)))
+
+def _analyze_batch(blobber, batch, fields):
+    """Return a list of ``(index, value, ...)`` tuples for a list of
+    ``(index, text)`` tuples.
+    """
+    blobs = [(i, blobber(text)) for i, text in batch]
+    tag_sents = getattr(blobber.pos_tagger, "tag_sents", None)
+    if tag_sents is not None and _TAG_FIELDS.intersection(fields):
+        # Tag the batch at once and store the result as each blob's tagged_tokens
+        tagged = tag_sents([blob.raw for i, blob in blobs])
+        for (i, blob), tags in zip(blobs, tagged):
+            blob.__dict__["tagged_tokens"] = list(tags)
+    return [(i,) + tuple(_plain(getattr(blob, field)) for field in fields)
+            for i, blob in blobs]
+
+# Blobber and fields of a worker process of Blobber.pipe()
+_worker = {}
+
+def _init_worker(blobber, fields):
+    _worker["blobber"], _worker["fields"] = blobber, fields
+    # Load the lazily loaded models (e.g., lexicons) in this process
+    _analyze_batch(blobber, [(0, "Warm up.")], fields)
+
+def _analyze_worker_batch(batch):
+    return _analyze_batch(_worker["blobber"], batch, _worker["fields"])
+
+def _imap_bounded(pool, batches, window, preserve_order):
+    """Generate the results of :func:`_analyze_worker_batch` for ``batches``
+    in ``pool``, like ``pool.imap``, but with at most ``window`` batches
+    submitted and not yet generated. This way, ``batches`` is only read as
+    fast as the results are consumed.
+    """
+    batches = iter(batches)
+    pending = deque()
+    while True:
+        for batch in islice(batches, window - len(pending)):
+            pending.append(pool.apply_async(_analyze_worker_batch, (batch,)))
+        if not pending:
+            return
+        if preserve_order:
+            result = pending.popleft()
+        else:
+            result = _first_ready(pending)
+        yield result.get()
+
+def _first_ready(pending):
+    """Remove and return the first finished result of a deque of
+    ``AsyncResult`` objects, waiting until one is finished.
+    """
+    while True:
+        for result in pending:
+            if result.ready():
+                pending.remove(result)
+                return result
+        pending[0].wait(0.01)
+
+
+#: Names of the models that :meth:`Blobber.warmup` can load
+WARMUP_COMPONENTS = ("tokenizer", "pos_tagger", "np_extractor", "analyzer",
+                     "parser", "classifier", "spelling")
+
+_WARMUP_TEXT = "Warm up the models."
+
+def _warmup_component(blobber, name):
+    """Load a model of a Blobber by analyzing a short text with it."""
+    text = _WARMUP_TEXT
+    if name == "tokenizer":
+        blobber.tokenizer.tokenize(text)
+        sent_span_tokenize(text)
+    elif name == "pos_tagger":
+        blobber.pos_tagger.tag(text)
+    elif name == "np_extractor":
+        blobber.np_extractor.extract(text)
+    elif name == "analyzer":
+        blobber.analyzer.analyze(text)
+    elif name == "parser":
+        blobber.parser.parse(text)
+    elif name == "classifier":
+        blobber.classifier.classify(text)
+    elif name == "spelling":
+        spelling.index
+
+
+class WarmupFuture(object):
+    """The readiness of a :meth:`Blobber.warmup`, with a subset of the
+    interface of :class:`concurrent.futures.Future`.
+
+    .. versionadded:: 0.9.2
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._result = None
+        self._exception = None
+
+    def _set(self, result=None, exception=None):
+        self._result, self._exception = result, exception
+        self._event.set()
+
+    def done(self):
+        """Return ``True`` if the warm-up has finished or failed."""
+        return self._event.is_set()
+
+    def wait(self, timeout=None):
+        """Wait at most ``timeout`` seconds for the warm-up to finish.
+        Return whether it is done.
+        """
+        self._event.wait(timeout)
+        return self.done()
+
+    def exception(self, timeout=None):
+        """Return the exception raised by the warm-up, or ``None``."""
+        if not self.wait(timeout):
+            raise TextBlobError("Warm-up did not finish in {0} seconds.".format(timeout))
+        return self._exception
+
+    def result(self, timeout=None):
+        """Return the warmed up components, or raise the exception that
+        the warm-up raised.
+
+        :raises TextBlobError: If the warm-up did not finish within
+            ``timeout`` seconds.
+        """
+        exception = self.exception(timeout)
+        if exception is not None:
+            raise exception
+        return self._result
+
+
+def warmup(components=None, background=False):
+    """Load and train the default models of :class:`TextBlob` now instead
+    of on first use. See :meth:`Blobber.warmup`.
+
+    Usage:
+
+        >>> import textblob
+        >>> ready = textblob.warmup(components=("pos_tagger", "analyzer"), background=True)
+        >>> ready.wait(timeout=10)
+        True
+
+    .. versionadded:: 0.9.2
+    """
+    return Blobber().warmup(components, background)
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""A persistent cache of trained models, so that models that are trained on
+NLTK corpora (e.g., the taggers of
+:class:`FastNPExtractor <textblob.en.np_extractors.FastNPExtractor>` and
+:class:`ChunkParser <textblob.en.np_extractors.ChunkParser>` and the classifier
+of :class:`NaiveBayesAnalyzer <textblob.en.sentiments.NaiveBayesAnalyzer>`)
+are trained once instead of in every new process.
+
+Usage:
+
+    >>> from textblob.np_extractors import FastNPExtractor
+    >>> extractor = FastNPExtractor(cache="/var/cache/textblob")
+
+or set the ``TEXTBLOB_MODEL_CACHE`` environment variable to a directory.
+
+.. versionadded:: 0.9.2
+"""
+from __future__ import absolute_import
+import hashlib
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import zlib
+
+import nltk
+
+from textblob.compat import basestring
+
+#: Environment variable with the default cache directory
+CACHE_ENV_VAR = "TEXTBLOB_MODEL_CACHE"
+
+
+class ModelCache(object):
+    """A directory of trained models, stored by name and key. The key
+    identifies what a model was trained on and how, e.g., the corpus files
+    and the model's parameters. A model is stored as a header with the key,
+    followed by the zlib-compressed pickle of the model. Files are written
+    to a temporary file and then renamed, so processes that share the
+    directory never read a partially written file.
+
+    Models are unpickled when they are loaded, so only use a directory that
+    is writable by trusted users.
+
+    :param str directory: The cache directory. It is created if it does not
+        exist.
+    """
+
+    MAGIC = b"TBMC"
+    #: Version of the file format, which is part of every key
+    VERSION = 1
+    HEADER = struct.Struct(str("<4sII"))
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path(self, name, key):
+        """Return the path of the file of the model with the given name and key."""
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "{0}-{1}.model".format(name, digest[:20]))
+
+    def load(self, name, key):
+        """Return the model with the given name and key, or ``None`` if the
+        cache has no such model or the file can't be read.
+        """
+        try:
+            with open(self.path(name, key), "rb") as f:
+                magic, version, n = self.HEADER.unpack(f.read(self.HEADER.size))
+                if magic != self.MAGIC or version != self.VERSION:
+                    return None
+                if f.read(n).decode("utf-8") != key:
+                    return None
+                return pickle.loads(zlib.decompress(f.read()))
+        except (IOError, OSError, EOFError, ValueError, TypeError, struct.error,
+                zlib.error, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+
+    def save(self, name, key, model):
+        """Store the model with the given name and key. Return ``True`` if
+        it was stored, or ``False`` if the file can't be written.
+        """
+        path = self.path(name, key)
+        key = key.encode("utf-8")
+        data = zlib.compress(pickle.dumps(model, pickle.HIGHEST_PROTOCOL))
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory)
+            f, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except (IOError, OSError):
+            return False
+        try:
+            with os.fdopen(f, "wb") as f:
+                f.write(self.HEADER.pack(self.MAGIC, self.VERSION, len(key)))
+                f.write(key)
+                f.write(data)
+            os.chmod(tmp, 0o644)
+            if os.name == "nt" and os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp, path)
+            return True
+        except (IOError, OSError):
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return False
+
+    def __repr__(self):
+        return "ModelCache({0!r})".format(self.directory)
+
+
+def get_cache(cache=None):
+    """Return a :class:`ModelCache` for the given cache or directory. If
+    ``None``, returns a cache for the directory in the ``TEXTBLOB_MODEL_CACHE``
+    environment variable, or ``None`` if it is not set.
+    """
+    if cache is None:
+        cache = os.environ.get(CACHE_ENV_VAR) or None
+    if isinstance(cache, basestring):
+        cache = ModelCache(cache)
+    return cache
+
+
+def model_key(name, **params):
+    """Return the cache key of a model with the given name and parameters,
+    which also includes the versions of the file format, Python and NLTK.
+    """
+    params.update(format=ModelCache.VERSION, python=list(sys.version_info[:2]),
+                  nltk=nltk.__version__)
+    return name + " " + " ".join("{0}={1!r}".format(k, params[k]) for k in sorted(params))
+
+
+def corpus_identity(corpus, fileids=None):
+    """Return a string that identifies the files of an NLTK corpus reader,
+    by their names, sizes and modification times.
+    """
+    root = corpus.root
+    if fileids is None:
+        fileids = corpus.fileids()
+    if hasattr(root, "zipfile"):
+        files = [os.path.abspath(root.zipfile.filename)]
+    else:
+        files = [os.path.join(root.path, fileid) for fileid in fileids]
+    digest = hashlib.sha1()
+    digest.update(repr(sorted(fileids)).encode("utf-8"))
+    for path in files:
+        stat = os.stat(path)
+        digest.update("{0} {1} {2}\n".format(path, stat.st_size, int(stat.st_mtime)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _const_identity(value):
+    """Return a string that identifies a constant of a code object the same
+    way in every process. Nested code objects (e.g., of a generator
+    expression) are identified by their code instead of their repr, which
+    has a memory address, and sets by their sorted items.
+    """
+    if hasattr(value, "co_code"):
+        return "<code {0} {1!r} {2}>".format(hashlib.sha1(value.co_code).hexdigest(),
+                                             value.co_names, _const_identity(value.co_consts))
+    if isinstance(value, (tuple, list)):
+        return "(" + ", ".join(_const_identity(v) for v in value) + ")"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(_const_identity(v) for v in value)) + "}"
+    return repr(value)
+
+
+def function_identity(func):
+    """Return a string that identifies a function by its qualified name
+    and its code, e.g., the feature extractor of a classifier.
+    """
+    name = "{0}.{1}".format(getattr(func, "__module__", None),
+                            getattr(func, "__name__", type(func).__name__))
+    code = getattr(func, "__code__", None)
+    if code is not None:
+        name += " " + hashlib.sha1(_const_identity(code).encode("utf-8")).hexdigest()
+    return name
+
+
+def ngram_models(tagger):
+    """Return the models of an NLTK n-gram tagger and its n-gram backoff
+    taggers (e.g., a bigram tagger that backs off to a unigram tagger),
+    i.e., their dicts of context => tag, from the unigram model up.
+    """
+    models = []
+    while isinstance(tagger, nltk.tag.ContextTagger):
+        models.insert(0, tagger._context_to_tag)
+        tagger = tagger.backoff
+    return models
+
+
+def ngram_tagger(models, backoff=None):
+    """Return the n-gram tagger for a list of models returned by
+    :func:`ngram_models`, with the given backoff tagger (e.g., the same
+    regular expression tagger that the models were trained with).
+    """
+    taggers = (nltk.UnigramTagger, nltk.BigramTagger, nltk.TrigramTagger)
+    for tagger, model in zip(taggers, models):
+        # NLTK doesn't create a tagger with an empty model, which only backs off
+        if model:
+            backoff = tagger(model=model, backoff=backoff)
+    return backoff
+
+
+def cached_model(cache, name, train, **params):
+    """Return the model that ``train()`` returns, loaded from ``cache`` if it
+    has a model with the same name and parameters, or trained and stored
+    in the cache otherwise. ``cache`` is passed to :func:`get_cache`.
+
+    Parameters that are callables (e.g., ``lambda: corpus_identity(corpus)``)
+    are called for their value only if there is a cache.
+    """
+    cache = get_cache(cache)
+    if cache is None:
+        return train()
+    params = dict((k, v() if callable(v) else v) for k, v in params.items())
+    key = model_key(name, **params)
+    model = cache.load(name, key)
+    if model is None:
+        model = train()
+        cache.save(name, key, model)
+    return model
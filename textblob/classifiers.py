@@ -151,6 +151,17 @@ class BaseClassifier(object):
         """Classifies a string of text."""
         raise NotImplementedError('Must implement a "classify" method.')
 
+    def classify_blob(self, blob):
+        """Classifies a blob. The built-in feature extractors accept a list
+        of words, so the blob's words are reused instead of tokenizing
+        its text again.
+
+        .. versionadded:: 0.9.2
+        """
+        if self.feature_extractor in (basic_extractor, contains_extractor):
+            return self.classify(blob.words)
+        return self.classify(blob.raw)
+
     def train(self, labeled_featureset):
         """Trains the classifier."""
         raise NotImplementedError('Must implement a "train" method.')
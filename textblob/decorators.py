@@ -25,6 +25,13 @@ class cached_property(object):
         return value
 
 
+def is_cached(obj, name):
+    """Return whether the :class:`cached_property` ``name`` has already been
+    computed for ``obj``.
+    """
+    return name in obj.__dict__
+
+
 def requires_nltk_corpus(func):
     """Wraps a function that requires an NLTK corpus. If the corpus isn't found,
     raise a :exc:`MissingCorpusError`.
@@ -6,9 +6,10 @@ from __future__ import absolute_import
 import os
 
 from textblob._text import (Parser as _Parser, Sentiment as _Sentiment, Lexicon,
-    WORD, POS, CHUNK, PNP, PENN, UNIVERSAL, Spelling)
+    WORD, POS, CHUNK, PNP, PENN, UNIVERSAL, Spelling, SentenceCache, ParsedText, Token)
 
 from textblob.compat import text_type, unicode
+from textblob.en.inflect import singularize, find_lemma
 
 try:
     MODULE = os.path.dirname(os.path.abspath(__file__))
@@ -21,19 +22,37 @@ spelling = Spelling(
 
 #--- ENGLISH PARSER --------------------------------------------------------------------------------
 
+# Memo of (word, tag) => lemma, cleared when it holds LEMMA_CACHE_SIZE entries.
+LEMMA_CACHE_SIZE = 10000
+lemma_cache = {}
+
+def lemmatize(word, pos):
+    """ Returns the lowercase lemma of the given word with the given part-of-speech tag:
+        the singular form of plural nouns and the infinitive of conjugated verbs.
+    """
+    # cats => cat
+    if pos == "NNS":
+        return singularize(word).lower()
+    # sat => sit
+    if pos.startswith(("VB", "MD")):
+        return find_lemma(word) or word.lower()
+    return word.lower()
+
 def find_lemmata(tokens):
     """ Annotates the tokens with lemmata for plural nouns and conjugated verbs,
         where each token is a [word, part-of-speech] list.
     """
+    cache = lemma_cache
     for token in tokens:
-        word, pos, lemma = token[0], token[1], token[0]
-        # cats => cat
-        if pos == "NNS":
-            lemma = singularize(word)
-        # sat => sit
-        if pos.startswith(("VB", "MD")):
-            lemma = conjugate(word, INFINITIVE) or word
-        token.append(lemma.lower())
+        k = (token[0], token[1])
+        try:
+            lemma = cache[k]
+        except KeyError:
+            lemma = lemmatize(*k)
+            if len(cache) >= LEMMA_CACHE_SIZE:
+                cache.clear()
+            cache[k] = lemma
+        token.append(lemma)
     return tokens
 
 class Parser(_Parser):
@@ -50,18 +69,22 @@ class Parser(_Parser):
 
 class Sentiment(_Sentiment):
 
-    def load(self, path=None):
-        _Sentiment.load(self, path)
+    _parse_version = 1
+
+    def _parse(self, path):
+        language, words, labels, synsets = _Sentiment._parse(self, path)
         # Map "terrible" to adverb "terribly" (+1% accuracy)
-        if not path:
-            for w, pos in list(dict.items(self)):
+        if path == self._path:
+            for w, pos in list(words.items()):
                 if "JJ" in pos:
                     if w.endswith("y"):
                         w = w[:-1] + "i"
                     if w.endswith("le"):
                         w = w[:-2]
                     p, s, i = pos["JJ"]
-                    self.annotate(w + "ly", "RB", p, s, i)
+                    w = words.setdefault(w + "ly", {})
+                    w["RB"] = w[None] = [p, s, i]
+        return language, words, labels, synsets
 
 
 lexicon = Lexicon(
@@ -108,13 +131,13 @@ def split(s, token=[WORD, POS, CHUNK, PNP]):
     """
     return Text(text_type(s), token)
 
-def tag(s, tokenize=True, encoding="utf-8"):
+def tag(s, tokenize=True, encoding="utf-8", **kwargs):
     """ Returns a list of (token, tag)-tuples from the given string.
+        With cache=SentenceCache(), tagged sentences are cached (see Parser.parse).
     """
     tags = []
-    for sentence in parse(s, tokenize, True, False, False, False, encoding).split():
-        for token in sentence:
-            tags.append((token[0], token[1]))
+    for sentence in parser.parse_structured(unicode(s), tokenize, True, False, False, False, encoding, **kwargs):
+        tags.extend(zip(sentence.words, sentence.tags))
     return tags
 
 def suggest(w):
@@ -463,3 +463,167 @@ def singularize(word, pos=NOUN, custom={}):
             return suffix.sub(inflection, word)
 
     return word
+
+#### VERB LEMMATA ##################################################################################
+
+# Irregular verbs: infinitive, past tense and past participle.
+# Alternative forms are separated by "|".
+verb_irregular_table = """
+    arise arose arisen; awake awoke awoken; be was|were been; bear bore borne|born;
+    beat beat beaten; become became become; begin began begun; bend bent bent;
+    bet bet bet; bid bid bid; bind bound bound; bite bit bitten; bleed bled bled;
+    blow blew blown; break broke broken; breed bred bred; bring brought brought;
+    broadcast broadcast broadcast; build built built; burn burnt burnt; burst burst burst;
+    buy bought bought; cast cast cast; catch caught caught; choose chose chosen;
+    cling clung clung; come came come; cost cost cost; creep crept crept; cut cut cut;
+    deal dealt dealt; dig dug dug; do did done; draw drew drawn; dream dreamt dreamt;
+    drink drank drunk; drive drove driven; dwell dwelt dwelt; eat ate eaten; fall fell fallen;
+    feed fed fed; feel felt felt; fight fought fought; find found found; flee fled fled;
+    fling flung flung; fly flew flown; forbid forbade forbidden; forecast forecast forecast;
+    forget forgot forgotten; forgive forgave forgiven; freeze froze frozen; get got got|gotten;
+    give gave given; go went gone; grind ground ground; grow grew grown; hang hung hung;
+    have had had; hear heard heard; hide hid hidden; hit hit hit; hold held held;
+    hurt hurt hurt; keep kept kept; kneel knelt knelt; know knew known; lay laid laid;
+    lead led led; lean leant leant; leap leapt leapt; learn learnt learnt; leave left left;
+    lend lent lent; let let let; lie lay lain; light lit lit; lose lost lost; make made made;
+    mean meant meant; meet met met; mislead misled misled; mistake mistook mistaken;
+    overcome overcame overcome; overtake overtook overtaken; pay paid paid; prove proved proven;
+    put put put; quit quit quit; read read read; rid rid rid; ride rode ridden; ring rang rung;
+    rise rose risen; run ran run; say said said; see saw seen; seek sought sought;
+    sell sold sold; send sent sent; set set set; sew sewed sewn; shake shook shaken;
+    shed shed shed; shine shone shone; shoot shot shot; show showed shown; shrink shrank shrunk;
+    shut shut shut; sing sang sung; sink sank sunk; sit sat sat; slay slew slain;
+    sleep slept slept; slide slid slid; sling slung slung; slit slit slit; smell smelt smelt;
+    speak spoke spoken; speed sped sped; spell spelt spelt; spend spent spent; spill spilt spilt;
+    spin spun spun; spit spat spat; split split split; spoil spoilt spoilt; spread spread spread;
+    spring sprang sprung; stand stood stood; steal stole stolen; stick stuck stuck;
+    sting stung stung; stink stank stunk; stride strode stridden; strike struck struck;
+    string strung strung; strive strove striven; swear swore sworn; sweep swept swept;
+    swell swelled swollen; swim swam swum; swing swung swung; take took taken;
+    teach taught taught; tear tore torn; tell told told; think thought thought;
+    throw threw thrown; thrust thrust thrust; tread trod trodden; understand understood understood;
+    undertake undertook undertaken; undo undid undone; upset upset upset; wake woke woken;
+    wear wore worn; weave wove woven; weep wept wept; win won won; wind wound wound;
+    withdraw withdrew withdrawn; withhold withheld withheld; withstand withstood withstood;
+    wring wrung wrung; write wrote written
+"""
+
+# Irregular present tense forms and contractions.
+verb_irregular = {
+     "am": "be",  "is": "be", "are": "be", "'m": "be", "'re": "be", "'s": "be", "ai": "be",
+    "has": "have", "'ve": "have", "does": "do", "'d": "would", "'ll": "will",
+     "wo": "will", "ca": "can", "sha": "shall"
+}
+
+VOWELS = "aeiouy"
+re_vowel = re.compile(r"a|e|i|o|u|y", re.I)
+re_vowels = re.compile(r"[aeiouy]+", re.I)
+
+def present_participle(verb):
+    """ Returns the -ing form of the given infinitive, e.g., "come" => "coming", "sit" => "sitting".
+        Final consonants are doubled after a single vowel, as in one-syllable verbs and
+        verbs stressed on the last syllable ("begin" => "beginning").
+    """
+    v = verb
+    if v.endswith("ie"):
+        return v[:-2] + "ying" # lie => lying
+    if v.endswith("e") and not v.endswith(("ee", "ye", "oe")) and v != "be":
+        return v[:-1] + "ing" # come => coming
+    if len(v) > 2 and v[-1] not in VOWELS + "wx" and v[-2] in VOWELS \
+     and (v[-3] not in VOWELS or v[-4:-2] == "qu"):
+        return v + v[-1] + "ing" # sit => sitting, quit => quitting
+    return v + "ing"
+
+for forms in verb_irregular_table.split(";"):
+    forms = forms.split()
+    for form in forms[1:] + [present_participle(forms[0])]:
+        for form in form.split("|"):
+            verb_irregular.setdefault(form, forms[0])
+
+# Verbs with a base form in -ee, e.g., "agreed" => "agree" (but "need", "succeed").
+verb_ee = set((
+    "agree", "decree", "disagree", "emcee", "foresee", "free", "guarantee", "oversee",
+    "pedigree", "referee", "tee"
+))
+
+# Verbs with a doubled final -ll in British English, e.g., "travelled" => "travel",
+# unlike "spelled" => "spell".
+verb_ll = ("dwell", "sell", "shell", "smell", "spell", "swell", "tell", "well", "yell")
+
+# Verbs with a base form in -oe, e.g., "shoes" => "shoe" (but "goes" => "go").
+verb_oe = set((
+    "canoe", "hoe", "shoe", "tiptoe", "toe"
+))
+
+# Verbs with a base form in -s that take -es, e.g., "buses" => "bus" (but "causes" => "cause").
+verb_s = set((
+    "bias", "bus", "canvas", "focus", "gas", "nonplus", "refocus"
+))
+
+def find_lemma(verb):
+    """ Returns the base form of the given inflected verb, e.g., "said" => "say".
+        Irregular forms are looked up in a table, others are handled by rules,
+        which are less reliable for verbs whose base form ends in -e.
+    """
+    v = verb.lower()
+    if v in verb_irregular:
+        return verb_irregular[v]
+    b = False
+    if v.endswith("s") and len(v) > 2:
+        if v.endswith("ies") and len(v) > 4 and v[-4] not in VOWELS:
+            return v[:-3] + "y" # complies => comply
+        if v.endswith(("sses", "shes", "ches", "xes", "zzes")):
+            return v[:-2] # kisses => kiss
+        if v.endswith("oes") and v[:-1] not in verb_oe:
+            return v[:-2] # goes => go
+        if v.endswith("ses") and v[:-2] in verb_s:
+            return v[:-2] # focuses => focus
+        if v.endswith("ss"):
+            return v
+        return v[:-1] # walks => walk
+    if v.endswith("ied"):
+        return v[:-3] + "y" if len(v) > 4 else v[:-1] # envied => envy, tied => tie
+    if v.endswith("ying") and len(v) == 5 and v[0] not in VOWELS:
+        return v[:-4] + "ie" # dying => die
+    if v.endswith("eed"):
+        return v[:-1] if v[:-1] in verb_ee else v # agreed => agree, need => need
+    if v.endswith("ing") and re_vowel.search(v[:-3]) is not None:
+        b, v = True, v[:-3] # chopping => chopp
+    elif v.endswith("ed") and re_vowel.search(v[:-2]) is not None:
+        b, v = True, v[:-2] # danced => danc
+    if b:
+        # Doubled consonant after a short vowel: chopp => chop, equipp => equip.
+        if len(v) > 3 and v[-1] == v[-2] and v[-3] in VOWELS \
+         and (v[-4] not in VOWELS or v[-5:-3] == "qu") \
+         and not v.endswith(("ss", "ll", "zz", "ff")):
+            return v[:-1]
+        # Doubled -ll after an unstressed vowel: travell => travel, controll => control.
+        if v.endswith(("ell", "oll")) and len(re_vowels.findall(v)) > 1 \
+         and not v.endswith(verb_ll):
+            return v[:-1]
+        if v.endswith(("ick", "ack")) and len(v) > 4:
+            return v[:-1] # panick => panic
+        if v in verb_s:
+            return v # focus
+        # Guess common cases where the base form ends in -e.
+        if v.endswith(("v", "z", "c", "i", "us")):
+            return v + "e" # danc => dance
+        if v.endswith(("iat", "uat", "creat")):
+            return v + "e" # creat => create, evaluat => evaluate
+        if v.endswith(("cit", "nit", "vit")) and not v.endswith("licit"):
+            return v + "e" # invit => invite, but solicit
+        if v.endswith("g") and not v.endswith(("dg", "lg", "ng", "rg")):
+            return v + "e" # oblig => oblige
+        if v.endswith(("dg", "rg")):
+            return v + "e" # judg => judge
+        if v.endswith(("b", "d", "g", "k", "l", "m", "p", "r", "s", "t")) \
+         and len(v) > 2 and v[-2] in VOWELS and v[-3] not in VOWELS \
+         and not v.endswith(("er", "en", "it", "et", "ol", "om", "el", "elop")):
+            return v + "e" # generat => generate
+        if v.endswith("in") and not v.endswith(("ain", "oin", "ein")) and len(v) > 3:
+            return v + "e" # imagin => imagine
+        if v.endswith("l") and len(v) > 2 and v[-2] not in VOWELS and v[-2] != "l":
+            return v + "e" # squabbl => squabble
+        if v.endswith(("th", "ang", "cr", "vr", "rs", "ps", "tr")):
+            return v + "e" # bath => bathe
+    return v
@@ -5,25 +5,42 @@ from __future__ import unicode_literals, absolute_import
 import nltk
 
 from textblob.taggers import PatternTagger
+from textblob.tokenizers import WordTokenizer
 from textblob.decorators import requires_nltk_corpus
 from textblob.utils import tree2str, filter_insignificant
 from textblob.base import BaseNPExtractor
+from textblob.compat import unicode
+from textblob.cache import cached_model, corpus_identity, ngram_models, ngram_tagger
 
 
 class ChunkParser(nltk.ChunkParserI):
+    """Noun phrase chunker that is trained on the CoNLL-2000 corpus.
 
-    def __init__(self):
+    :param cache: (optional) A :class:`ModelCache <textblob.cache.ModelCache>`
+        or directory in which the trained chunker is stored and from which
+        it is loaded. If ``None``, uses the ``TEXTBLOB_MODEL_CACHE``
+        environment variable, if set.
+    """
+
+    def __init__(self, cache=None):
         self._trained = False
+        self.cache = cache
 
     @requires_nltk_corpus
     def train(self):
         '''Train the Chunker on the ConLL-2000 corpus.'''
-        train_data = [[(t, c) for _, t, c in nltk.chunk.tree2conlltags(sent)]
-                      for sent in
-                      nltk.corpus.conll2000.chunked_sents('train.txt',
-                                                    chunk_types=['NP'])]
-        unigram_tagger = nltk.UnigramTagger(train_data)
-        self.tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger)
+        def train():
+            train_data = [[(t, c) for _, t, c in nltk.chunk.tree2conlltags(sent)]
+                          for sent in
+                          nltk.corpus.conll2000.chunked_sents('train.txt',
+                                                        chunk_types=['NP'])]
+            unigram_tagger = nltk.UnigramTagger(train_data)
+            bigram_tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger)
+            return ngram_models(bigram_tagger)
+        models = cached_model(self.cache, "ChunkParser", train,
+            corpus=lambda: corpus_identity(nltk.corpus.conll2000, ['train.txt']),
+            chunk_types=['NP'])
+        self.tagger = ngram_tagger(models)
         self._trained = True
 
     def parse(self, sentence):
@@ -67,17 +84,47 @@ class ConllExtractor(BaseNPExtractor):
         noun_phrases = []
         for sentence in sentences:
             parsed = self._parse_sentence(sentence)
-            # Get the string representation of each subtree that is a
-            # noun phrase tree
-            phrases = [_normalize_tags(filter_insignificant(each,
-                       self.INSIGNIFICANT_SUFFIXES)) for each in parsed
-                       if isinstance(each, nltk.tree.Tree) and each.label()
-                       == 'NP' and len(filter_insignificant(each)) >= 1
-                       and _is_match(each, cfg=self.CFG)]
-            nps = [tree2str(phrase) for phrase in phrases]
-            noun_phrases.extend(nps)
+            noun_phrases.extend(self._extract_parsed(parsed))
         return noun_phrases
 
+    def extract_blob(self, blob):
+        '''Return a list of noun phrases (strings) for a blob, like
+        :meth:`extract`. If the blob is tagged with the same tagger as this
+        extractor, the tags of its sentences are reused, and each sentence
+        is chunked once, by either the sentence or the blob.
+        '''
+        if type(blob.pos_tagger) is not type(self.POS_TAGGER):
+            return self.extract(blob.raw)
+        sentences = getattr(blob, 'sentences', None)
+        if sentences is None:
+            # A single sentence
+            return self._extract_sentence(blob)
+        noun_phrases = []
+        for sentence in sentences:
+            noun_phrases.extend(self._extract_sentence(sentence))
+        return noun_phrases
+
+    def _extract_sentence(self, sentence):
+        '''Return the noun phrases in a blob of one sentence, which are
+        stored in the blob so that it is chunked once by this extractor.
+        '''
+        extractor, noun_phrases = sentence.__dict__.get('_conll_noun_phrases', (None, None))
+        if extractor is not self:
+            noun_phrases = self._extract_parsed(self.parser.parse(sentence.tagged_tokens))
+            sentence.__dict__['_conll_noun_phrases'] = (self, noun_phrases)
+        return list(noun_phrases)
+
+    def _extract_parsed(self, parsed):
+        '''Return the noun phrases (strings) in a parsed sentence.'''
+        # Get the string representation of each subtree that is a
+        # noun phrase tree
+        phrases = [_normalize_tags(filter_insignificant(each,
+                   self.INSIGNIFICANT_SUFFIXES)) for each in parsed
+                   if isinstance(each, nltk.tree.Tree) and each.label()
+                   == 'NP' and len(filter_insignificant(each)) >= 1
+                   and _is_match(each, cfg=self.CFG)]
+        return [tree2str(phrase) for phrase in phrases]
+
     def _parse_sentence(self, sentence):
         '''Tag and parse a sentence (a plain, untagged string).'''
         tagged = self.POS_TAGGER.tag(sentence)
@@ -91,6 +138,11 @@ class FastNPExtractor(BaseNPExtractor):
     Credit to Shlomi Babluk. Link to original blog post:
 
         http://thetokenizer.com/2013/05/09/efficient-way-to-extract-the-main-topics-of-a-sentence/
+
+    :param cache: (optional) A :class:`ModelCache <textblob.cache.ModelCache>`
+        or directory in which the trained tagger is stored and from which
+        it is loaded. If ``None``, uses the ``TEXTBLOB_MODEL_CACHE``
+        environment variable, if set.
     '''
 
     CFG = {
@@ -101,12 +153,12 @@ class FastNPExtractor(BaseNPExtractor):
         ('JJ', 'NN'): 'NNI',
         }
 
-    def __init__(self):
+    def __init__(self, cache=None):
         self._trained = False
+        self.cache = cache
 
     @requires_nltk_corpus
     def train(self):
-        train_data = nltk.corpus.brown.tagged_sents(categories='news')
         regexp_tagger = nltk.RegexpTagger([
             (r'^-?[0-9]+(.[0-9]+)?$', 'CD'),
             (r'(-|:|;)$', ':'),
@@ -121,8 +173,15 @@ class FastNPExtractor(BaseNPExtractor):
             (r'.*ed$', 'VBD'),
             (r'.*', 'NN'),
             ])
-        unigram_tagger = nltk.UnigramTagger(train_data, backoff=regexp_tagger)
-        self.tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger)
+        def train():
+            train_data = nltk.corpus.brown.tagged_sents(categories='news')
+            unigram_tagger = nltk.UnigramTagger(train_data, backoff=regexp_tagger)
+            bigram_tagger = nltk.BigramTagger(train_data, backoff=unigram_tagger)
+            return ngram_models(bigram_tagger)
+        models = cached_model(self.cache, "FastNPExtractor", train,
+            corpus=lambda: corpus_identity(nltk.corpus.brown,
+                                           nltk.corpus.brown.fileids(categories='news')))
+        self.tagger = ngram_tagger(models, backoff=regexp_tagger)
         self._trained = True
         return None
 
@@ -134,9 +193,20 @@ class FastNPExtractor(BaseNPExtractor):
 
     def extract(self, sentence):
         '''Return a list of noun phrases (strings) for body of text.'''
+        return self._extract_tokens(self._tokenize_sentence(sentence))
+
+    def extract_blob(self, blob):
+        '''Return a list of noun phrases (strings) for a blob. If the blob
+        uses the default word tokenizer, its tokens are reused.
+        '''
+        if type(blob.tokenizer) is not WordTokenizer:
+            return self.extract(blob.raw)
+        return self._extract_tokens([unicode(token) for token in blob.tokens])
+
+    def _extract_tokens(self, tokens):
+        '''Return a list of noun phrases (strings) for a list of tokens.'''
         if not self._trained:
             self.train()
-        tokens = self._tokenize_sentence(sentence)
         tagged = self.tagger.tag(tokens)
         tags = _normalize_tags(tagged)
         merge = True
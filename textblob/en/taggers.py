@@ -4,22 +4,54 @@ from __future__ import absolute_import
 
 import nltk
 
-from textblob.en import tag as pattern_tag
+from textblob.en import tag as pattern_tag, parser as pattern_parser, SentenceCache
 from textblob.decorators import requires_nltk_corpus
 from textblob.tokenizers import word_tokenize
 from textblob.base import BaseTagger
+from textblob.compat import basestring
 
 
 class PatternTagger(BaseTagger):
     """Tagger that uses the implementation in
     Tom de Smedt's pattern library
     (http://www.clips.ua.ac.be/pattern).
+
+    :param cache: (optional) A :class:`SentenceCache <textblob.en.SentenceCache>`
+        of tagged sentences, or ``True`` to create one with the default limits.
+        Repeated sentences are then only tagged once.
+
+    .. versionchanged:: 0.9.2
+        Added the ``cache`` parameter.
     """
 
+    def __init__(self, cache=None):
+        self.cache = SentenceCache() if cache is True else cache
+
     def tag(self, text, tokenize=True):
         """Tag a string `text`."""
+        if self.cache is not None:
+            return pattern_tag(text, tokenize, cache=self.cache)
         return pattern_tag(text, tokenize)
 
+    def tag_sents(self, texts, tokenize=True):
+        """Tag a list of strings in one batch. Returns a list of lists of
+        (word, tag) tuples. Lists of tokens are tagged as a single sentence.
+
+        .. versionadded:: 0.9.2
+        """
+        documents = []
+        for text in texts:
+            if not isinstance(text, basestring):
+                documents.append([list(text)])
+            elif tokenize:
+                documents.append(pattern_parser.find_tokens(text))
+            else:
+                documents.append(text)
+        kwargs = {"cache": self.cache} if self.cache is not None else {}
+        parsed = pattern_parser.parse_many(documents, False, True, False, False, False, **kwargs)
+        return [[(token[0], token[1]) for sentence in document for token in sentence]
+                for document in parsed]
+
 
 class NLTKTagger(BaseTagger):
     """Tagger that uses NLTK's standard TreeBank tagger.
@@ -33,3 +65,14 @@ class NLTKTagger(BaseTagger):
             text = list(word_tokenize(text))
         tagged = nltk.tag.pos_tag(text)
         return tagged
+
+    @requires_nltk_corpus
+    def tag_sents(self, texts, tokenize=True):
+        """Tag a list of strings in one batch, loading NLTK's tagger once.
+        Returns a list of lists of (word, tag) tuples.
+
+        .. versionadded:: 0.9.2
+        """
+        if tokenize:
+            texts = [list(word_tokenize(text)) for text in texts]
+        return nltk.tag.pos_tag_sents(texts)
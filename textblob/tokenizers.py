@@ -8,7 +8,8 @@ from itertools import chain
 
 import nltk
 
-from textblob.utils import strip_punc
+from textblob.utils import strip_punc, is_filelike
+from textblob.compat import basestring
 from textblob.base import BaseTokenizer
 from textblob.decorators import requires_nltk_corpus
 
@@ -56,8 +57,32 @@ class SentenceTokenizer(BaseTokenizer):
         '''Return a list of sentences.'''
         return nltk.tokenize.sent_tokenize(text)
 
+    @requires_nltk_corpus
+    def span_tokenize(self, text):
+        '''Return a list of (start, end) character offsets of the sentences
+        in ``text``, such that ``text[start:end]`` is a sentence.
+
+        .. versionadded:: 0.9.2
+        '''
+        return list(_punkt_tokenizer().span_tokenize(text))
+
+
+def _punkt_tokenizer(language="english"):
+    """Return the Punkt sentence tokenizer used by
+    :func:`nltk.tokenize.sent_tokenize`.
+    """
+    try:  # nltk>=3.8.2
+        return nltk.tokenize._get_punkt_tokenizer(language)
+    except AttributeError:
+        return nltk.data.load('tokenizers/punkt/{0}.pickle'.format(language))
+
+_sentence_tokenizer = SentenceTokenizer()  # Singleton sentence tokenizer
+
 #: Convenience function for tokenizing sentences
-sent_tokenize = SentenceTokenizer().itokenize
+sent_tokenize = _sentence_tokenizer.itokenize
+
+#: Convenience function for finding the character offsets of sentences
+sent_span_tokenize = _sentence_tokenizer.span_tokenize
 
 _word_tokenizer = WordTokenizer()  # Singleton word tokenizer
 def word_tokenize(text, include_punc=True, *args, **kwargs):
@@ -71,3 +96,80 @@ def word_tokenize(text, include_punc=True, *args, **kwargs):
                                 *args, **kwargs)
         for sentence in sent_tokenize(text))
     return words
+
+
+def _read_chunks(stream, chunk_size=64 * 1024):
+    """Generate chunks of text from a file object, an iterable of strings,
+    or a single string.
+    """
+    if is_filelike(stream):
+        chunk = stream.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = stream.read(chunk_size)
+    elif isinstance(stream, basestring):
+        yield stream
+    else:
+        for chunk in stream:
+            yield chunk
+
+
+def sent_tokenize_stream(stream, chunk_size=64 * 1024, max_sentence_length=1024 * 1024):
+    """Generate sentences from a file object (opened in text mode) or an
+    iterable of text chunks, without reading the whole text into memory.
+
+    A sentence is generated as soon as the next sentence has begun, so that
+    sentences which cross chunk boundaries are carried over to the next
+    chunk. The unfinished last sentence is tokenized again once the text
+    read after it is as long as the sentence itself, so that a long
+    sentence takes linear time. A sentence that grows longer than
+    ``max_sentence_length`` characters (e.g., in text without punctuation)
+    is generated as it is, so memory use is bounded by the chunk size plus
+    ``max_sentence_length``.
+
+    :param stream: A file object or an iterable of strings.
+    :param int chunk_size: Number of characters to read from a file object
+        at a time.
+    :param int max_sentence_length: Number of characters after which an
+        unfinished sentence is generated.
+
+    .. versionadded:: 0.9.2
+    """
+    buffer, pending, size = '', [], 0
+    for chunk in _read_chunks(stream, chunk_size):
+        pending.append(chunk)
+        size += len(chunk)
+        if size < len(buffer) and len(buffer) + size < max_sentence_length:
+            continue
+        buffer += ''.join(pending)
+        pending, size = [], 0
+        spans = sent_span_tokenize(buffer)
+        if not spans:
+            buffer = ''
+            continue
+        # The last sentence may continue in the next chunk
+        (start, end), spans = spans[-1], spans[:-1]
+        for i, j in spans:
+            yield buffer[i:j]
+        if len(buffer) - start >= max_sentence_length:
+            yield buffer[start:end]
+            buffer = ''
+        else:
+            buffer = buffer[start:]
+    buffer += ''.join(pending)
+    for start, end in sent_span_tokenize(buffer):
+        yield buffer[start:end]
+
+
+def word_tokenize_stream(stream, include_punc=True, chunk_size=64 * 1024,
+                         *args, **kwargs):
+    """Generate word tokens from a file object (opened in text mode) or an
+    iterable of text chunks, sentence by sentence. See
+    :func:`sent_tokenize_stream`.
+
+    .. versionadded:: 0.9.2
+    """
+    return chain.from_iterable(
+        _word_tokenizer.itokenize(sentence, include_punc=include_punc,
+                                *args, **kwargs)
+        for sentence in sent_tokenize_stream(stream, chunk_size=chunk_size))